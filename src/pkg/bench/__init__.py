@@ -0,0 +1,4 @@
+"""Benchmarks for the lint engine. Not imported by the linter itself; each
+module is runnable with ``python -m pkg.bench.<module>``, and
+``python -m pkg.bench`` (``verilinter-bench``) runs the regression suite.
+"""
@@ -0,0 +1,172 @@
+"""Deterministic synthetic SystemVerilog corpus for benchmarks.
+
+Every generated design is a tree of modules: module ``m0`` is the top, and
+module ``mI`` instantiates ``m(I*F+1)`` .. ``m(I*F+F)`` (those that exist), so
+``fanout`` controls both the width and, with ``modules``, the depth of the
+instantiation tree. Each module has ``signals`` internal signals driven by
+``blocks`` procedural blocks (alternating always_ff / always_comb), whose
+bodies nest ``depth`` levels of ``if`` around the assignments.
+
+The output depends only on the spec, so the same spec always produces the
+same bytes. Designs are structurally sound - no undefined or duplicate
+modules and one procedural driver per signal - so the module and driver
+rules exercise their normal, non-reporting path.
+
+Usage: python -m pkg.bench.corpus OUT_DIR [--modules N] [--signals M] ...
+"""
+
+import argparse
+from pathlib import Path
+
+WIDTH = 8
+
+
+class CorpusSpec:
+    def __init__(
+        self,
+        modules: int = 50,
+        signals: int = 16,
+        blocks: int = 4,
+        depth: int = 2,
+        fanout: int = 2,
+        files: int | None = None,
+    ) -> None:
+        if modules < 1:
+            raise ValueError(f"modules must be >= 1, got {modules}")
+        if blocks < 1:
+            raise ValueError(f"blocks must be >= 1, got {blocks}")
+        if signals < blocks:
+            # every block drives at least one signal of its own
+            raise ValueError(f"signals must be >= blocks ({blocks}), got {signals}")
+        if depth < 0 or fanout < 0:
+            raise ValueError("depth and fanout must be >= 0")
+        self.modules = modules
+        self.signals = signals
+        self.blocks = blocks
+        self.depth = depth
+        self.fanout = fanout
+        # modules are spread round-robin over this many files (default: one per module)
+        self.files = modules if files is None else max(1, min(files, modules))
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "modules": self.modules,
+            "signals": self.signals,
+            "blocks": self.blocks,
+            "depth": self.depth,
+            "fanout": self.fanout,
+            "files": self.files,
+        }
+
+    def children(self, index: int) -> list[int]:
+        first = index * self.fanout + 1
+        return [child for child in range(first, first + self.fanout) if child < self.modules]
+
+
+def _block(spec: CorpusSpec, block: int) -> list[str]:
+    targets = [f"s{j}" for j in range(block, spec.signals, spec.blocks)]
+    sequential = block % 2 == 0
+    op = "<=" if sequential else "="
+    # read from the neighbouring block's signals so every signal is used
+    source = f"s{(block + 1) % spec.blocks}"
+
+    lines: list[str] = []
+    if sequential:
+        lines.append("  always_ff @(posedge clk or negedge rst_n) begin")
+        lines.append("    if (!rst_n) begin")
+        lines.extend(f"      {t} <= '0;" for t in targets)
+        lines.append("    end else begin")
+        indent = "      "
+    else:
+        lines.append("  always_comb begin")
+        # defaults first so the nested ifs never infer a latch
+        lines.extend(f"    {t} = '0;" for t in targets)
+        indent = "    "
+
+    for level in range(spec.depth):
+        lines.append(f"{indent}if (din[{level % WIDTH}]) begin")
+        indent += "  "
+    lines.extend(f"{indent}{t} {op} {source} + din;" for t in targets)
+    for _level in range(spec.depth):
+        indent = indent[:-2]
+        lines.append(f"{indent}end")
+
+    if sequential:
+        lines.append("    end")
+    lines.append("  end")
+    return lines
+
+
+def generate_module(spec: CorpusSpec, index: int) -> str:
+    children = spec.children(index)
+    lines = [
+        f"module m{index}(input logic clk, input logic rst_n, "
+        f"input logic [{WIDTH - 1}:0] din, output logic [{WIDTH - 1}:0] dout);"
+    ]
+    lines.extend(f"  logic [{WIDTH - 1}:0] s{j};" for j in range(spec.signals))
+    lines.extend(f"  logic [{WIDTH - 1}:0] c{child};" for child in children)
+    for block in range(spec.blocks):
+        lines.extend(_block(spec, block))
+    for n, child in enumerate(children):
+        lines.append(
+            f"  m{child} u_m{child}(.clk(clk), .rst_n(rst_n), "
+            f".din(s{n % spec.signals}), .dout(c{child}));"
+        )
+    result = " ^ ".join([f"s{j}" for j in range(spec.signals)] + [f"c{child}" for child in children])
+    lines.append(f"  assign dout = {result};")
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n"
+
+
+def generate(spec: CorpusSpec) -> dict[str, str]:
+    """File name -> source text for the whole corpus."""
+    sources: dict[str, list[str]] = {}
+    for index in range(spec.modules):
+        name = f"bench_{index % spec.files:04d}.sv"
+        sources.setdefault(name, []).append(generate_module(spec, index))
+    return {name: "\n".join(modules) for name, modules in sources.items()}
+
+
+def write_corpus(spec: CorpusSpec, out_dir: Path) -> list[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for name, text in generate(spec).items():
+        path = out_dir / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = CorpusSpec()
+    parser.add_argument("--modules", type=int, default=defaults.modules, help="number of modules (N)")
+    parser.add_argument("--signals", type=int, default=defaults.signals, help="signals per module (M)")
+    parser.add_argument("--blocks", type=int, default=defaults.blocks, help="procedural blocks per module (K)")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="if-nesting depth inside each block (D)")
+    parser.add_argument("--fanout", type=int, default=defaults.fanout, help="child instances per module (F)")
+    parser.add_argument("--files", type=int, default=None, help="number of files (default: one per module)")
+
+
+def spec_from_args(args: argparse.Namespace) -> CorpusSpec:
+    return CorpusSpec(
+        modules=args.modules,
+        signals=args.signals,
+        blocks=args.blocks,
+        depth=args.depth,
+        fanout=args.fanout,
+        files=args.files,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic SystemVerilog benchmark corpus")
+    parser.add_argument("out_dir", type=Path, help="directory to write the .sv files into")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+    paths = write_corpus(spec_from_args(args), args.out_dir)
+    print(f"wrote {len(paths)} files to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Micro-benchmark for per-node dispatch overhead.
+
+Compares three ways of turning a raw pyslang node into a (vnode, handler)
+pair over a flattened tree of roughly ``--nodes`` raw nodes:
+
+- ``mro``:      uncached MRO scan for the vnode class + ``Dispatch.get``
+- ``separate``: ``vnode_factory.create`` + ``Dispatch.get`` (two cached lookups)
+- ``fused``:    ``Dispatch.resolve`` (one lookup in the fused table)
+
+Usage: python -m pkg.bench.dispatch_overhead [--nodes N] [--repeat R]
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from ..handlers.register_handlers import *
+from ..parser.parse import parse_text
+from ..parser.types import RawNode, SyntaxNode, SyntaxTree, Token
+from ..vnodes.register_vnodes import *
+from ..vnodes.syntax_vnode import SyntaxVNode
+from ..vnodes.token_vnode import TokenVNode
+from ..vnodes.vnode_factory import VNodeFactory, vnode_factory
+from ..walk.dispatch import dispatch
+
+# raw nodes produced per generated assign statement, measured on pyslang 9.x
+_NODES_PER_STATEMENT = 30
+
+
+def build_source(statements: int) -> str:
+    lines = ["module bench(input logic a, input logic b);"]
+    lines.extend(f"  wire w{i} = a & (b | 1'b{i % 2});" for i in range(statements))
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n"
+
+
+def flatten(root: RawNode) -> list[RawNode]:
+    nodes: list[RawNode] = []
+    stack: list[RawNode] = [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        if isinstance(node, SyntaxNode):
+            stack.extend(child for child in node if child is not None)
+    return nodes
+
+
+def _mro_vnode_class(raw: RawNode) -> type:
+    for base in type(raw).__mro__:
+        if base in VNodeFactory._node_map:
+            return VNodeFactory._node_map[base]
+    return TokenVNode if isinstance(raw, Token) else SyntaxVNode
+
+
+def _per_node_mro(nodes: list[RawNode], tree: SyntaxTree) -> None:
+    for raw in nodes:
+        vnode = _mro_vnode_class(raw)(raw, tree)
+        dispatch.get(vnode)
+
+
+def _per_node_separate(nodes: list[RawNode], tree: SyntaxTree) -> None:
+    for raw in nodes:
+        vnode = vnode_factory.create(raw, tree)
+        dispatch.get(vnode)
+
+
+def _per_node_fused(nodes: list[RawNode], tree: SyntaxTree) -> None:
+    resolve = dispatch.resolve
+    for raw in nodes:
+        vnode_cls, _handler = resolve(raw)
+        vnode_cls(raw, tree)
+
+
+STRATEGIES: dict[str, Callable[[list[RawNode], SyntaxTree], None]] = {
+    "mro": _per_node_mro,
+    "separate": _per_node_separate,
+    "fused": _per_node_fused,
+}
+
+
+def run(target_nodes: int, repeat: int) -> dict[str, float]:
+    tree = parse_text(build_source(max(1, target_nodes // _NODES_PER_STATEMENT)))
+    nodes = flatten(tree.root)
+
+    results: dict[str, float] = {}
+    for name, strategy in STRATEGIES.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            strategy(nodes, tree)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best / len(nodes) * 1e9
+
+    print(f"{len(nodes)} raw nodes, best of {repeat}")
+    for name, ns_per_node in results.items():
+        print(f"  {name:<9} {ns_per_node:8.1f} ns/node")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-node dispatch overhead micro-benchmark")
+    parser.add_argument("--nodes", type=int, default=500_000, help="approximate raw node count (default: 500000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per strategy (default: 5)")
+    args = parser.parse_args(argv)
+    run(args.nodes, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
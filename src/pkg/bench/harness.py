@@ -0,0 +1,114 @@
+"""End-to-end lint benchmark with a per-phase breakdown.
+
+Lints either an existing set of files or a freshly generated synthetic
+corpus (see ``pkg.bench.corpus``) with ``run_lint.run()`` and reads the time
+of each phase - parse, walk, rules (the token scan and the syntax rules),
+symbol_rules and module_rules - from its ``RunProfile``, so the numbers are
+those ``--profile`` reports for the same files. Writes a JSON report with
+seconds, nodes/sec and lines/sec per phase plus peak RSS.
+
+Usage:
+    python -m pkg.bench.harness [--modules N ...] [--output report.json]
+    python -m pkg.bench.harness --corpus DIR [--output report.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from run_lint import run
+
+from ..instrument.memory import peak_rss_bytes
+from ..instrument.profile import PHASES, RunProfile
+from .corpus import CorpusSpec, add_spec_arguments, spec_from_args, write_corpus
+
+
+def count_lines(paths: list[Path]) -> int:
+    total = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            total += sum(1 for _ in f)
+    return total
+
+
+def measure(paths: list[Path]) -> dict[str, Any]:
+    """One profiled lint run over `paths`; wall seconds per phase plus node and diagnostic counts."""
+    profile = RunProfile()
+    diagnostics = run(paths, profile=profile)
+    return {
+        "seconds": dict(profile.wall),
+        "nodes": sum(file.nodes for file in profile.files),
+        "diagnostics": len(diagnostics),
+    }
+
+
+def _rate(count: int, seconds: float) -> float | None:
+    return count / seconds if seconds > 0 else None
+
+
+def benchmark(paths: list[Path], repeat: int = 1, spec: CorpusSpec | None = None) -> dict[str, Any]:
+    """Run `measure` `repeat` times and report the fastest pass."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat}")
+    lines = count_lines(paths)
+    best = min((measure(paths) for _ in range(repeat)), key=lambda m: sum(m["seconds"].values()))
+    total = sum(best["seconds"].values())
+    nodes = best["nodes"]
+
+    return {
+        "spec": spec.as_dict() if spec is not None else None,
+        "repeat": repeat,
+        "files": len(paths),
+        "lines": lines,
+        "nodes": nodes,
+        "diagnostics": best["diagnostics"],
+        "phases": {
+            phase: {
+                "seconds": seconds,
+                "nodes_per_sec": _rate(nodes, seconds),
+                "lines_per_sec": _rate(lines, seconds),
+            }
+            for phase, seconds in best["seconds"].items()
+        },
+        "total_seconds": total,
+        "nodes_per_sec": _rate(nodes, total),
+        "lines_per_sec": _rate(lines, total),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "python": platform.python_version(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the lint engine phase by phase")
+    parser.add_argument("--corpus", type=Path, default=None, help="lint these .v/.sv files instead of generating a corpus")
+    parser.add_argument("--repeat", type=int, default=1, help="timed passes; the fastest is reported (default: 1)")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="write the JSON report here (default: stdout)")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.corpus is not None:
+        paths = sorted([*args.corpus.rglob("*.v"), *args.corpus.rglob("*.sv")])
+        if not paths:
+            print(f"Error: no .v or .sv files found in {args.corpus}", file=sys.stderr)
+            return 1
+        report = benchmark(paths, repeat=args.repeat)
+    else:
+        spec = spec_from_args(args)
+        with tempfile.TemporaryDirectory(prefix="lint-bench-") as tmp:
+            report = benchmark(write_corpus(spec, Path(tmp)), repeat=args.repeat, spec=spec)
+
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+"""Fixed benchmark suite and performance regression gate.
+
+Runs every corpus in ``SUITE`` through ``harness.measure`` (a profiled
+``run_lint.run``) with warmups and repeats, and summarises each phase by
+median and interquartile range. The result can be stored as a JSON baseline
+(``--output``) and later compared against (``--compare``): a phase regresses
+when its median grows by more than ``--threshold`` of the baseline median and
+by more than the larger of the two IQRs, so the floor scales with the phase
+and millisecond phases are gated as well as slow ones. ``--min-seconds`` adds
+an optional absolute floor on top for noisy machines.
+
+Usage:
+    python -m pkg.bench --output baseline.json
+    python -m pkg.bench --compare baseline.json [--threshold 0.10]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .corpus import CorpusSpec, write_corpus
+from .harness import PHASES, measure
+
+BASELINE_VERSION = 1
+
+SUITE: dict[str, CorpusSpec] = {
+    "flat": CorpusSpec(modules=12, signals=16, blocks=4, depth=2, fanout=0, files=4),
+    "deep": CorpusSpec(modules=4, signals=16, blocks=4, depth=8, fanout=1, files=4),
+    "wide": CorpusSpec(modules=3, signals=64, blocks=8, depth=1, fanout=2, files=3),
+    "hierarchy": CorpusSpec(modules=60, signals=4, blocks=2, depth=1, fanout=4, files=6),
+}
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    if len(samples) >= 2:
+        q1, _q2, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+        iqr = q3 - q1
+    else:
+        iqr = 0.0
+    return {"median": statistics.median(samples), "iqr": iqr, "samples": samples}
+
+
+def run_benchmark(spec: CorpusSpec, warmup: int, repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="lint-bench-") as tmp:
+        paths = write_corpus(spec, Path(tmp))
+        for _ in range(warmup):
+            measure(paths)
+        runs = [measure(paths) for _ in range(repeat)]
+
+    samples = {phase: [run["seconds"][phase] for run in runs] for phase in PHASES}
+    samples["total"] = [sum(run["seconds"].values()) for run in runs]
+    return {
+        "spec": spec.as_dict(),
+        "nodes": runs[0]["nodes"],
+        "phases": {phase: summarize(values) for phase, values in samples.items()},
+    }
+
+
+def run_suite(
+    names: list[str] | None = None,
+    warmup: int = 1,
+    repeat: int = 5,
+) -> dict[str, Any]:
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat}")
+    if warmup < 0:
+        raise ValueError(f"warmup must be >= 0, got {warmup}")
+    selected = list(SUITE) if names is None else names
+    unknown = [name for name in selected if name not in SUITE]
+    if unknown:
+        raise ValueError(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "benchmarks": {name: run_benchmark(SUITE[name], warmup, repeat) for name in selected},
+    }
+
+
+class Regression:
+    def __init__(self, benchmark: str, phase: str, baseline: float, current: float) -> None:
+        self.benchmark = benchmark
+        self.phase = phase
+        self.baseline = baseline
+        self.current = current
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.10,
+    min_seconds: float = 0.0,
+) -> tuple[list[Regression], list[str]]:
+    """Return the regressions and a readable per-phase comparison table."""
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"unsupported baseline version: {baseline.get('version')!r}")
+
+    regressions: list[Regression] = []
+    lines = [f"{'benchmark':<12}{'phase':<14}{'baseline':>10}{'current':>10}{'change':>9}  status"]
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            lines.append(f"{name:<12}{'':<14}{'':>10}{'':>10}{'':>9}  not in baseline")
+            continue
+        for phase, stats in result["phases"].items():
+            base_stats = base["phases"].get(phase)
+            if base_stats is None:
+                continue
+            before, after = base_stats["median"], stats["median"]
+            delta = after - before
+            noise = max(base_stats["iqr"], stats["iqr"])
+            regressed = delta > before * threshold and delta > min_seconds and delta > noise
+            change = f"{delta / before * 100:+.1f}%" if before > 0 else "n/a"
+            status = "REGRESSED" if regressed else "ok"
+            lines.append(f"{name:<12}{phase:<14}{before:>10.4f}{after:>10.4f}{change:>9}  {status}")
+            if regressed:
+                regressions.append(Regression(name, phase, before, after))
+    return regressions, lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Lint engine benchmark suite and regression gate")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="write the results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, default=None, metavar="BASELINE", help="compare against a stored baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown of a phase median that fails the gate (default: 0.10)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.0,
+        help="absolute slowdown below which a phase never fails the gate (default: 0, off)",
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="untimed passes per benchmark (default: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes per benchmark (default: 5)")
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=None,
+        choices=list(SUITE),
+        help="run only this benchmark (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare is not None else None
+        results = run_suite(args.only, warmup=args.warmup, repeat=args.repeat)
+        if args.output is not None:
+            args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        if baseline is None:
+            for name, result in results["benchmarks"].items():
+                total = result["phases"]["total"]
+                print(f"{name:<12}{total['median']:>10.4f}s  (iqr {total['iqr']:.4f}s, {result['nodes']} nodes)")
+            return 0
+        regressions, lines = compare(baseline, results, threshold=args.threshold, min_seconds=args.min_seconds)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} phase(s) regressed beyond {args.threshold:.0%}:", file=sys.stderr)
+        for r in regressions:
+            print(f"  {r.benchmark}/{r.phase}: {r.baseline:.4f}s -> {r.current:.4f}s ({r.change:+.1%})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 from typing import Generic, TypeVar
 
+from ..parser.types import RawNode
 from ..semantic.symbol_table import SymbolTable
 from ..vnodes.base_vnode import BaseVNode
 from ..walk.context import Context
@@ -8,7 +9,11 @@ VNodeType = TypeVar("VNodeType", bound=BaseVNode)
 
 
 class BaseHandler(Generic[VNodeType]):
-    def children(self, _vnode: VNodeType) -> list[BaseVNode]:
+    # raw kinds this handler reacts to; None means unknown, which disables walk pruning
+    consumes: frozenset[object] | None = None
+
+    def children(self, _vnode: VNodeType) -> list[RawNode | BaseVNode]:
+        # raw children are turned into vnodes by the walker via the dispatch table
         return []
 
     def update_context(self, ctx: Context, _vnode: VNodeType, _symbol_table: SymbolTable) -> Context:
@@ -1,7 +1,7 @@
 from ..walk.dispatch import dispatch
 from ..walk.context import Context, ContextFlag
 from ..semantic.symbol_table import SymbolTable
-from ..parser.syntax import has_default_case_item, is_case_generate_keyword_pair
+from ..parser.syntax import CASE_GENERATE_KIND, has_default_case_item, is_case_generate_keyword_pair
 from ..parser.types import CaseGenerateNode
 from ..vnodes.syntax_vnode import SyntaxVNode
 from .syntax_node_handler import SyntaxNodeHandler
@@ -9,6 +9,8 @@ from .syntax_node_handler import SyntaxNodeHandler
 
 @dispatch.register(CaseGenerateNode)
 class CaseGenerateHandler(SyntaxNodeHandler):
+    consumes = frozenset({CASE_GENERATE_KIND})
+
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
         ctx = ctx.push(vnode)
 
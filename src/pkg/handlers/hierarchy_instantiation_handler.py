@@ -2,7 +2,7 @@ from ..walk.dispatch import dispatch
 from ..walk.context import Context
 from ..semantic.symbol import Symbol
 from ..semantic.symbol_table import SymbolTable
-from ..parser.syntax import hierarchical_instance_name, instantiation_type_name
+from ..parser.syntax import HIERARCHY_INSTANTIATION_KIND, hierarchical_instance_name, instantiation_type_name
 from ..parser.types import HierarchicalInstanceNode, HierarchyInstantiationNode
 from ..vnodes.syntax_vnode import SyntaxVNode
 from .syntax_node_handler import SyntaxNodeHandler
@@ -10,6 +10,8 @@ from .syntax_node_handler import SyntaxNodeHandler
 
 @dispatch.register(HierarchyInstantiationNode)
 class HierarchyInstantiationHandler(SyntaxNodeHandler):
+    consumes = frozenset({HIERARCHY_INSTANTIATION_KIND})
+
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
         type_name = instantiation_type_name(vnode.raw)
         if type_name:
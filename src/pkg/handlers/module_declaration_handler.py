@@ -1,6 +1,6 @@
 from ..walk.dispatch import dispatch
 from ..walk.context import Context
-from ..parser.syntax import module_declaration_name
+from ..parser.syntax import MODULE_DECLARATION_KINDS, module_declaration_name
 from ..semantic.symbol_table import SymbolTable
 from ..vnodes.syntax_vnode import SyntaxVNode
 from ..parser.types import ModuleDeclarationNode
@@ -9,6 +9,7 @@ from .syntax_node_handler import SyntaxNodeHandler
 
 @dispatch.register(ModuleDeclarationNode)
 class ModuleDeclarationHandler(SyntaxNodeHandler):
+    consumes = frozenset(MODULE_DECLARATION_KINDS)
 
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
         name = module_declaration_name(vnode.raw) or "<anonymous>"
@@ -21,8 +22,10 @@ class ModuleDeclarationHandler(SyntaxNodeHandler):
         symbol_table.register_module(name, module_scope)
         return ctx.push(vnode).with_scope(module_scope)
 
-    def on_exit(self, _ctx: Context, _vnode: SyntaxVNode, symbol_table: SymbolTable) -> None:
+    def on_exit(self, ctx: Context, _vnode: SyntaxVNode, symbol_table: SymbolTable) -> None:
         symbol_table.pop_scope()
+        if symbol_table.on_module_exit is not None:
+            symbol_table.on_module_exit(ctx.scope())
 
     def __str__(self) -> str:
         return "ModuleDeclarationHandler"
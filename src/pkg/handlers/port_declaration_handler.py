@@ -0,0 +1,22 @@
+from ..walk.dispatch import dispatch
+from ..walk.context import Context
+from ..parser.syntax import PORT_KINDS
+from ..semantic.symbol_table import SymbolTable
+from ..parser.types import ExplicitAnsiPortNode, ImplicitAnsiPortNode, PortDeclarationNode
+from ..vnodes.syntax_vnode import SyntaxVNode
+from .syntax_node_handler import SyntaxNodeHandler
+
+
+@dispatch.register(PortDeclarationNode)
+@dispatch.register(ImplicitAnsiPortNode)
+@dispatch.register(ExplicitAnsiPortNode)
+class PortDeclarationHandler(SyntaxNodeHandler):
+    """Records the port on the Context, so declarators below it know they declare a port."""
+
+    consumes = PORT_KINDS
+
+    def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
+        return ctx.push(vnode).with_port(vnode)
+
+    def __str__(self) -> str:
+        return "PortDeclarationHandler"
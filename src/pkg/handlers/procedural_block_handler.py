@@ -7,16 +7,22 @@ from ..parser.syntax import (
     ALWAYS_BLOCK_KIND,
     ALWAYS_COMB_BLOCK_KIND,
     ALWAYS_LATCH_BLOCK_KIND,
+    PROCEDURAL_BLOCK_KINDS,
 )
 from ..parser.types import (
     ProceduralBlockNode,
 )
+from ..walk.block_summary import BlockSummary
 from ..walk.dispatch import dispatch
 
 @dispatch.register(ProceduralBlockNode)
 class ProceduralBlockHandler(SyntaxNodeHandler):
+    consumes = frozenset(PROCEDURAL_BLOCK_KINDS)
+
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
-        ctx = ctx.push(vnode)
+        block = BlockSummary(vnode)
+        block.driver_id = symbol_table.add_driver(block.location)
+        ctx = ctx.push(vnode).with_block(block)
         kind = vnode.kind
 
         if kind == ALWAYS_COMB_BLOCK_KIND:
@@ -14,6 +14,7 @@ from .case_generate_handler import CaseGenerateHandler
 
 #  variables
 from .signal_event_expression_handler import SignalEventExpressionHandler
+from .port_declaration_handler import PortDeclarationHandler
 from .declarator_handler import DeclaratorHandler
 from .identifier_name_handler import IdentifierNameHandler
 
@@ -3,7 +3,7 @@
 from ..walk.dispatch import dispatch
 from ..walk.context import Context, ContextFlag
 from ..semantic.symbol_table import SymbolTable
-from ..parser.syntax import is_negedge_event, is_posedge_event
+from ..parser.syntax import SIGNAL_EVENT_EXPRESSION_KIND, is_negedge_event, is_posedge_event
 from ..parser.types import SignalEventExpressionNode
 from ..vnodes.syntax_vnode import SyntaxVNode
 from .syntax_node_handler import SyntaxNodeHandler
@@ -11,6 +11,8 @@ from .syntax_node_handler import SyntaxNodeHandler
 
 @dispatch.register(SignalEventExpressionNode)
 class SignalEventExpressionHandler(SyntaxNodeHandler):
+    consumes = frozenset({SIGNAL_EVENT_EXPRESSION_KIND})
+
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
         ctx = ctx.push(vnode)
 
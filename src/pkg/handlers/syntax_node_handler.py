@@ -1,21 +1,20 @@
 from ..walk.context import Context
 from ..semantic.symbol_table import SymbolTable
 from .base_handler import BaseHandler
-from ..vnodes.base_vnode import BaseVNode
 from ..vnodes.syntax_vnode import SyntaxVNode
 
 from ..walk.dispatch import dispatch
-from ..parser.types import SyntaxNode
-from ..vnodes.vnode_factory import vnode_factory
+from ..parser.types import RawNode, SyntaxNode
 
 @dispatch.register(SyntaxNode)
 class SyntaxNodeHandler(BaseHandler[SyntaxVNode]):
+    consumes = frozenset()
 
     def update_context(self, ctx: Context, vnode: SyntaxVNode, symbol_table: SymbolTable) -> Context:
         return ctx.push(vnode)
 
-    def children(self, vnode: SyntaxVNode) -> list[BaseVNode]:
-        return [vnode_factory.create(child, vnode.tree) for child in vnode.raw_children]
+    def children(self, vnode: SyntaxVNode) -> list[RawNode]:
+        return vnode.raw_children
 
     def __str__(self) -> str:
         return "SyntaxNodeHandler"
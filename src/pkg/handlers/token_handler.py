@@ -9,6 +9,7 @@ from ..parser.types import Token
 
 @dispatch.register(Token)
 class TokenHandler(BaseHandler[TokenVNode]):
+    consumes = frozenset()
 
     def update_context(self, ctx: Context, vnode: TokenVNode, symbol_table: SymbolTable) -> Context:
         return ctx.push(vnode)
@@ -0,0 +1,17 @@
+"""Opt-in instrumentation for lint runs. Nothing here is active unless the
+caller asks for it (a CLI flag or an explicit object passed to run()), so a
+plain lint pays no cost.
+
+RunProfile records wall and CPU time per phase and per file (``--profile``).
+RuleStats records per-rule calls, hits and time through instrumented copies
+of the rule runners (``--rule-stats``). MemoryProfile takes tracemalloc
+snapshots with live project-object counts and RSS (``--memory-profile``).
+WalkStats counts what the walk visits - kinds, depth, tokens versus syntax
+nodes, handler hits - in the linting pass itself (``--walk-stats``).
+CallProfile records function-level profiles of the whole run or one phase,
+as pstats (``--cprofile``) and collapsed stacks (``--flamegraph``).
+RunObserver is the event hook interface; ChromeTraceObserver turns the
+events into a trace-event timeline (``--trace``). `openmetrics` renders a
+run's profile, rule stats and diagnostics as OpenMetrics text
+(``--metrics-file``).
+"""
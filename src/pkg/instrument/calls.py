@@ -0,0 +1,152 @@
+# src/pkg/instrument/calls.py
+import cProfile
+import pstats
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+# syntax rules run from on_node, so "walk" includes them here
+CALL_PHASES = ("parse", "walk", "symbol_rules", "module_rules")
+
+# paths under the directory holding `pkg` are shown relative to it, as pkg/...
+_SOURCE_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+
+
+def relative_path(filename: str) -> str:
+    if filename.startswith(_SOURCE_ROOT):
+        return filename[len(_SOURCE_ROOT) :].lstrip("/\\").replace("\\", "/")
+    return filename
+
+
+def _relative_key(key: tuple[str, int, str]) -> tuple[str, int, str]:
+    filename, line, name = key
+    return relative_path(filename), line, name
+
+
+class StackRecorder:
+    """Self time per call stack of Python frames, as collapsed stacks for flamegraph tools.
+
+    Uses sys.settrace rather than sys.setprofile so it can run alongside
+    cProfile. Time spent in C code (pyslang) is booked to the calling Python
+    frame.
+    """
+
+    def __init__(self) -> None:
+        self.stacks: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        # per open frame: label, start time, time spent in traced callees
+        self._open: list[list[Any]] = []
+        self._labels: dict[Any, str] = {}
+        self._previous: Any = None
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({relative_path(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+            self._labels[code] = label
+        return label
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event != "call":
+            return None
+        self._open.append([self._label(frame), time.perf_counter(), 0.0])
+        frame.f_trace_lines = False
+        return self._local
+
+    def _local(self, frame: FrameType, event: str, arg: Any) -> Any:
+        if event == "return" and self._open:
+            label, start, callees = self._open.pop()
+            elapsed = time.perf_counter() - start
+            self.stacks[(*(entry[0] for entry in self._open), label)] += elapsed - callees
+            if self._open:
+                self._open[-1][2] += elapsed
+        return self._local
+
+    def enable(self) -> None:
+        self._previous = sys.gettrace()
+        sys.settrace(self._trace)
+
+    def disable(self) -> None:
+        sys.settrace(self._previous)
+        self._previous = None
+        self._open.clear()
+
+    def folded(self) -> list[str]:
+        """``frame;frame;frame microseconds`` lines, heaviest first."""
+        lines = []
+        for stack, seconds in sorted(self.stacks.items(), key=lambda item: item[1], reverse=True):
+            micros = round(seconds * 1_000_000)
+            if micros > 0:
+                lines.append(f"{';'.join(stack)} {micros}")
+        return lines
+
+
+class CallProfile:
+    """Function-level profile of a lint run (``--cprofile`` / ``--flamegraph``).
+
+    Covers the whole run, or with `phase` only the named phase of every file.
+    cProfile collects the pstats output, StackRecorder the collapsed stacks;
+    either one can be left off.
+    """
+
+    def __init__(self, phase: str | None = None, pstats: bool = True, stacks: bool = True) -> None:
+        if phase is not None and phase not in CALL_PHASES:
+            raise ValueError(f"unknown phase {phase!r}; expected one of {', '.join(CALL_PHASES)}")
+        self.only = phase
+        self.profiler = cProfile.Profile() if pstats else None
+        self.recorder = StackRecorder() if stacks else None
+
+    def _enable(self) -> None:
+        if self.recorder is not None:
+            self.recorder.enable()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def _disable(self) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.recorder is not None:
+            self.recorder.disable()
+
+    def start(self) -> None:
+        if self.only is None:
+            self._enable()
+
+    def stop(self) -> None:
+        if self.only is None:
+            self._disable()
+
+    @contextmanager
+    def phase(self, name: str, _file: object = None) -> Iterator[None]:
+        if name != self.only:
+            yield
+            return
+        self._enable()
+        try:
+            yield
+        finally:
+            self._disable()
+
+    def stats(self) -> pstats.Stats:
+        if self.profiler is None:
+            raise ValueError("pstats collection is disabled for this profile")
+        stats = pstats.Stats(self.profiler)
+        stats.stats = {
+            _relative_key(key): (cc, nc, tt, ct, {_relative_key(caller): value for caller, value in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in stats.stats.items()
+        }
+        return stats
+
+    def write_pstats(self, path: str | Path) -> None:
+        self.stats().dump_stats(str(path))
+
+    def write_folded(self, path: str | Path) -> None:
+        if self.recorder is None:
+            raise ValueError("stack collection is disabled for this profile")
+        lines = self.recorder.folded()
+        Path(path).write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
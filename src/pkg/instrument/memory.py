@@ -0,0 +1,168 @@
+# src/pkg/instrument/memory.py
+import gc
+import json
+import sys
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from ..semantic.scope import Scope
+from ..semantic.symbol import Symbol
+from ..vnodes.base_vnode import BaseVNode
+from ..walk.context import Context
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# project types whose live instances are counted at every snapshot; VNodes
+# are counted per concrete class
+TRACKED_TYPES: tuple[type, ...] = (Symbol, Scope, Context, BaseVNode)
+
+_MB = 1024 * 1024
+
+
+def peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size right now; Linux only (None elsewhere)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * resource.getpagesize() if resource is not None else None
+
+
+def live_object_counts() -> dict[str, int]:
+    counts: Counter[str] = Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, TRACKED_TYPES):
+            counts[type(obj).__name__] += 1
+    return dict(counts)
+
+
+class MemorySnapshot:
+    def __init__(
+        self,
+        phase: str,
+        path: str | None,
+        traced_current: int,
+        traced_peak: int,
+        rss: int | None,
+        objects: dict[str, int],
+        top: list[dict[str, Any]],
+    ) -> None:
+        self.phase = phase
+        self.path = path
+        self.traced_current = traced_current
+        self.traced_peak = traced_peak
+        self.rss = rss
+        self.objects = objects
+        self.top = top
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "path": self.path,
+            "traced_current": self.traced_current,
+            "traced_peak": self.traced_peak,
+            "rss": self.rss,
+            "objects": dict(self.objects),
+            "top": list(self.top),
+        }
+
+
+class MemoryProfile:
+    """tracemalloc snapshots taken after parse and walk of (sampled) files and after the rules.
+
+    Syntax rules run inside the walk, so their allocations land in the "walk"
+    snapshot; the "rules" snapshot is taken once, after the symbol and module
+    rules. pyslang trees live in native memory that tracemalloc cannot see -
+    the RSS column is what shows them.
+    """
+
+    def __init__(self, every: int = 1, top: int = 10) -> None:
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        self.every = every
+        self.top = top
+        self.snapshots: list[MemorySnapshot] = []
+        self._files_seen = 0
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def begin_file(self) -> bool:
+        """Advance to the next file; True when this file is sampled."""
+        sampled = self._files_seen % self.every == 0
+        self._files_seen += 1
+        return sampled
+
+    def snapshot(self, phase: str, path: str | Path | None = None) -> MemorySnapshot:
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        ).statistics("lineno")
+        top = [
+            {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "size": stat.size, "count": stat.count}
+            for stat in stats[: self.top]
+        ]
+        snapshot = MemorySnapshot(
+            phase,
+            str(path) if path is not None else None,
+            current,
+            peak,
+            current_rss_bytes(),
+            live_object_counts(),
+            top,
+        )
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "peak_rss": peak_rss_bytes(),
+            "snapshots": [snapshot.to_dict() for snapshot in self.snapshots],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def format_table(self) -> str:
+        type_names = sorted({name for snapshot in self.snapshots for name in snapshot.objects})
+        header = f"{'phase':<8}{'traced MB':>10}{'peak MB':>9}{'rss MB':>8}"
+        header += "".join(f"{name:>{max(len(name) + 2, 8)}}" for name in type_names)
+        lines = [header + "  path"]
+        for snapshot in self.snapshots:
+            rss = f"{snapshot.rss / _MB:>8.1f}" if snapshot.rss is not None else f"{'-':>8}"
+            line = f"{snapshot.phase:<8}{snapshot.traced_current / _MB:>10.1f}{snapshot.traced_peak / _MB:>9.1f}{rss}"
+            line += "".join(f"{snapshot.objects.get(name, 0):>{max(len(name) + 2, 8)}}" for name in type_names)
+            lines.append(f"{line}  {snapshot.path or ''}")
+
+        peak = peak_rss_bytes()
+        if peak is not None:
+            lines.append(f"peak RSS: {peak / _MB:.1f} MB")
+        if self.snapshots:
+            last = self.snapshots[-1]
+            lines.append("")
+            lines.append(f"top allocation sites at the last snapshot ({last.phase}):")
+            for site in last.top:
+                lines.append(f"{site['size'] / 1024:>10.1f} KiB {site['count']:>8} blocks  {site['site']}")
+        return "\n".join(lines)
@@ -0,0 +1,120 @@
+# src/pkg/instrument/metrics.py
+import os
+import time
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .memory import peak_rss_bytes
+from .profile import PHASES, RunProfile
+from .rule_stats import RuleStats
+
+PREFIX = "verilinter"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Exposition:
+    def __init__(self, labels: dict[str, str]) -> None:
+        self.labels = labels
+        self.lines: list[str] = []
+
+    def family(
+        self,
+        name: str,
+        help_text: str,
+        samples: list[tuple[dict[str, str], float]],
+        unit: str | None = None,
+    ) -> None:
+        name = f"{PREFIX}_{name}"
+        self.lines.append(f"# TYPE {name} gauge")
+        if unit is not None:
+            self.lines.append(f"# UNIT {name} {unit}")
+        self.lines.append(f"# HELP {name} {help_text}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels({**self.labels, **labels})} {_number(value)}")
+
+
+def openmetrics(
+    diagnostics: list[Mapping[str, Any]],
+    profile: RunProfile,
+    rule_stats: RuleStats,
+    labels: dict[str, str] | None = None,
+    timestamp: float | None = None,
+) -> str:
+    """One lint run as OpenMetrics text, every value a gauge describing that run.
+
+    `labels` are added to every sample, so runs over different repositories
+    can share one textfile collector directory without colliding. The run has
+    no cache, so there is no cache hit-rate metric.
+    """
+    out = _Exposition(dict(labels or {}))
+    out.family("files", "Files linted in the last run.", [({}, len(profile.files))])
+    out.family("lines", "Source lines linted in the last run.", [({}, sum(f.lines for f in profile.files))])
+    out.family("nodes", "Syntax nodes and tokens visited by the walk.", [({}, sum(f.nodes for f in profile.files))])
+    out.family(
+        "phase_duration_seconds",
+        "Wall time per lint phase.",
+        [({"phase": name}, profile.wall[name]) for name in PHASES],
+        unit="seconds",
+    )
+    out.family(
+        "phase_cpu_seconds",
+        "CPU time per lint phase.",
+        [({"phase": name}, profile.cpu[name]) for name in PHASES],
+        unit="seconds",
+    )
+    ranked = sorted(rule_stats.ranked(), key=lambda stat: stat.code)
+    out.family(
+        "rule_duration_seconds",
+        "Cumulative time spent in each rule.",
+        [({"rule": stat.code, "kind": stat.kind}, stat.seconds) for stat in ranked],
+        unit="seconds",
+    )
+    out.family(
+        "rule_calls",
+        "Rule invocations (per node for syntax rules, per run otherwise).",
+        [({"rule": stat.code, "kind": stat.kind}, stat.calls) for stat in ranked],
+    )
+    out.family(
+        "rule_hits",
+        "Diagnostics reported by each rule.",
+        [({"rule": stat.code, "kind": stat.kind}, stat.hits) for stat in ranked],
+    )
+    by_code = Counter(d["code"] for d in diagnostics)
+    out.family(
+        "diagnostics",
+        "Diagnostics reported per rule code.",
+        [({"code": code}, count) for code, count in sorted(by_code.items())],
+    )
+    peak = peak_rss_bytes()
+    if peak is not None:
+        out.family("peak_rss_bytes", "Peak resident set size of the lint process.", [({}, peak)], unit="bytes")
+    out.family(
+        "last_run_timestamp_seconds",
+        "Unix time the run finished.",
+        [({}, time.time() if timestamp is None else timestamp)],
+        unit="seconds",
+    )
+    return "\n".join([*out.lines, "# EOF"]) + "\n"
+
+
+def write_textfile(path: str | Path, text: str) -> None:
+    """Write atomically, so a collector scraping the directory never reads a partial file."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
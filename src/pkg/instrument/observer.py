@@ -0,0 +1,109 @@
+# src/pkg/instrument/observer.py
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+
+class RunObserver:
+    """Receives lint-run events. Every hook is a no-op; override the ones you need.
+
+    run() emits the file events, Walker the walk events and the rule runners
+    the rule-phase and diagnostic events. Emitters hold the observer in an
+    `observer` attribute and skip all of this with one None check when it is
+    unset.
+    """
+
+    def file_start(self, path: str) -> None:
+        pass
+
+    def file_parsed(self, path: str) -> None:
+        pass
+
+    def walk_start(self, path: str | None) -> None:
+        pass
+
+    def walk_done(self, path: str | None) -> None:
+        pass
+
+    def file_done(self, path: str) -> None:
+        pass
+
+    def rule_phase_start(self, phase: str) -> None:
+        pass
+
+    def rule_phase_done(self, phase: str, diagnostics: int) -> None:
+        pass
+
+    def diagnostic(self, diagnostic: Mapping[str, Any]) -> None:
+        pass
+
+
+class ChromeTraceObserver(RunObserver):
+    """Records events in the Chrome trace-event format (chrome://tracing, Perfetto).
+
+    Files, parse, walk and the post-walk rule phases become duration slices on
+    the emitting process/thread track; diagnostics become instant events. Each
+    worker of a parallel lint can record its own trace - pid/tid keep their
+    tracks apart - and `merge` joins them into one timeline.
+    """
+
+    def __init__(self, process_name: str = "verilinter") -> None:
+        self.pid = os.getpid()
+        self.tid = threading.get_native_id()
+        self.events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "tid": self.tid, "args": {"name": process_name}},
+        ]
+
+    def _event(self, ph: str, name: str, cat: str, args: dict[str, Any] | None = None) -> None:
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": cat,
+            "ph": ph,
+            "ts": time.perf_counter_ns() / 1000,
+            "pid": self.pid,
+            "tid": self.tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def file_start(self, path: str) -> None:
+        self._event("B", Path(path).name, "file", {"path": path})
+        self._event("B", "parse", "phase")
+
+    def file_parsed(self, path: str) -> None:
+        self._event("E", "parse", "phase")
+
+    def walk_start(self, path: str | None) -> None:
+        self._event("B", "walk", "phase")
+
+    def walk_done(self, path: str | None) -> None:
+        self._event("E", "walk", "phase")
+
+    def file_done(self, path: str) -> None:
+        self._event("E", Path(path).name, "file")
+
+    def rule_phase_start(self, phase: str) -> None:
+        self._event("B", phase, "rules")
+
+    def rule_phase_done(self, phase: str, diagnostics: int) -> None:
+        self._event("E", phase, "rules", {"diagnostics": diagnostics})
+
+    def diagnostic(self, diagnostic: Mapping[str, Any]) -> None:
+        event_args = {key: diagnostic[key] for key in ("file", "line", "col", "message") if key in diagnostic}
+        self._event("i", diagnostic.get("code", "diagnostic"), "diagnostic", event_args)
+        self.events[-1]["s"] = "t"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @staticmethod
+    def merge(traces: list["ChromeTraceObserver"]) -> dict[str, Any]:
+        return {"traceEvents": [event for trace in traces for event in trace.events], "displayTimeUnit": "ms"}
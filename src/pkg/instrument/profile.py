@@ -0,0 +1,146 @@
+# src/pkg/instrument/profile.py
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# "walk" excludes the syntax rules run from on_node; they are booked as "rules"
+PHASES = ("parse", "walk", "rules", "symbol_rules", "module_rules")
+FILE_PHASES = ("parse", "walk", "rules")
+
+
+class FileProfile:
+    def __init__(self, path: str, lines: int) -> None:
+        self.path = path
+        self.lines = lines
+        self.nodes = 0
+        self.wall = dict.fromkeys(FILE_PHASES, 0.0)
+        self.cpu = dict.fromkeys(FILE_PHASES, 0.0)
+
+    @property
+    def total_wall(self) -> float:
+        return sum(self.wall.values())
+
+    @property
+    def total_cpu(self) -> float:
+        return sum(self.cpu.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "lines": self.lines,
+            "nodes": self.nodes,
+            "wall": dict(self.wall),
+            "cpu": dict(self.cpu),
+            "total_wall": self.total_wall,
+            "total_cpu": self.total_cpu,
+        }
+
+
+class RunProfile:
+    """Wall and CPU time per lint phase and per file.
+
+    run() only touches this when one is passed in; the per-node timing of the
+    syntax rules is installed by wrapping on_node, so a run without a profile
+    executes exactly the same code as before.
+    """
+
+    def __init__(self) -> None:
+        self.files: list[FileProfile] = []
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        # time booked to a phase nested inside the one currently measured
+        self._nested_wall = 0.0
+        self._nested_cpu = 0.0
+
+    def add_file(self, path: str | Path) -> FileProfile:
+        with open(path, "rb") as f:
+            lines = sum(1 for _ in f)
+        file = FileProfile(str(path), lines)
+        self.files.append(file)
+        return file
+
+    @contextmanager
+    def phase(self, name: str, file: FileProfile | None = None) -> Iterator[None]:
+        nested_wall, nested_cpu = self._nested_wall, self._nested_cpu
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._book(
+                name,
+                wall - (self._nested_wall - nested_wall),
+                cpu - (self._nested_cpu - nested_cpu),
+                file,
+            )
+            # all of this phase is nested time for a phase enclosing it
+            self._nested_wall, self._nested_cpu = nested_wall + wall, nested_cpu + cpu
+
+    def timed_on_node(
+        self,
+        on_node: Callable[[Any, Any], None],
+        file: FileProfile,
+    ) -> Callable[[Any, Any], None]:
+        """Wrap a walker on_node callback so its time is booked as "rules" and nodes are counted."""
+        perf_counter, process_time = time.perf_counter, time.process_time
+
+        def timed(vnode: Any, ctx: Any) -> None:
+            wall, cpu = perf_counter(), process_time()
+            on_node(vnode, ctx)
+            wall, cpu = perf_counter() - wall, process_time() - cpu
+            file.nodes += 1
+            self._nested_wall += wall
+            self._nested_cpu += cpu
+            self._book("rules", wall, cpu, file)
+
+        return timed
+
+    def _book(self, name: str, wall: float, cpu: float, file: FileProfile | None) -> None:
+        self.wall[name] += wall
+        self.cpu[name] += cpu
+        if file is not None:
+            file.wall[name] += wall
+            file.cpu[name] += cpu
+
+    @property
+    def total_wall(self) -> float:
+        return sum(self.wall.values())
+
+    @property
+    def total_cpu(self) -> float:
+        return sum(self.cpu.values())
+
+    def slowest(self, top: int) -> list[FileProfile]:
+        return sorted(self.files, key=lambda f: f.total_wall, reverse=True)[:top]
+
+    def to_dict(self, top: int | None = None) -> dict[str, Any]:
+        files = self.files if top is None else self.slowest(top)
+        return {
+            "phases": {name: {"wall": self.wall[name], "cpu": self.cpu[name]} for name in PHASES},
+            "total_wall": self.total_wall,
+            "total_cpu": self.total_cpu,
+            "files": [f.to_dict() for f in files],
+        }
+
+    def to_json(self, top: int | None = None) -> str:
+        return json.dumps(self.to_dict(top), indent=2)
+
+    def format_table(self, top: int = 10) -> str:
+        total = self.total_wall
+        lines = [f"{'phase':<14}{'wall (s)':>10}{'cpu (s)':>10}{'share':>8}"]
+        for name in PHASES:
+            share = self.wall[name] / total * 100 if total > 0 else 0.0
+            lines.append(f"{name:<14}{self.wall[name]:>10.3f}{self.cpu[name]:>10.3f}{share:>7.1f}%")
+        lines.append(f"{'total':<14}{total:>10.3f}{self.total_cpu:>10.3f}")
+
+        slowest = self.slowest(top)
+        if slowest:
+            lines.append("")
+            lines.append(f"slowest {len(slowest)} of {len(self.files)} files:")
+            lines.append(f"{'wall (s)':>10}{'cpu (s)':>10}{'lines':>8}{'nodes':>9}  path")
+            for f in slowest:
+                lines.append(f"{f.total_wall:>10.3f}{f.total_cpu:>10.3f}{f.lines:>8}{f.nodes:>9}  {f.path}")
+        return "\n".join(lines)
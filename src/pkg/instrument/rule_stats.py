@@ -0,0 +1,87 @@
+# src/pkg/instrument/rule_stats.py
+import json
+from typing import Any
+
+
+class RuleStat:
+    """Counters for one rule: how often it ran, how often it reported, and for how long.
+
+    For syntax rules a call is one applies() on one node; for symbol and module
+    rules it is one run() over the symbol table, and hits count every
+    diagnostic that run returned. `skipped` counts the files a syntax rule was
+    dropped for because none of the node kinds it consumes occur in them.
+    """
+
+    __slots__ = ("code", "kind", "calls", "hits", "seconds", "skipped")
+
+    def __init__(self, code: str, kind: str) -> None:
+        self.code = code
+        self.kind = kind
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+        self.skipped = 0
+
+    @property
+    def seconds_per_call(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "code": self.code,
+            "kind": self.kind,
+            "calls": self.calls,
+            "hits": self.hits,
+            "seconds": self.seconds,
+            "skipped": self.skipped,
+        }
+
+
+class RuleStats:
+    """Per-rule counters collected by rule runners created with `instrumented()`."""
+
+    def __init__(self) -> None:
+        self._stats: dict[str, RuleStat] = {}
+
+    def stat_for(self, code: str, kind: str) -> RuleStat:
+        stat = self._stats.get(code)
+        if stat is None:
+            stat = self._stats[code] = RuleStat(code, kind)
+        return stat
+
+    def __getitem__(self, code: str) -> RuleStat:
+        return self._stats[code]
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._stats
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def ranked(self) -> list[RuleStat]:
+        """Most expensive rule first."""
+        return sorted(self._stats.values(), key=lambda stat: stat.seconds, reverse=True)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(stat.seconds for stat in self._stats.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"total_seconds": self.total_seconds, "rules": [stat.to_dict() for stat in self.ranked()]}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def format_table(self) -> str:
+        total = self.total_seconds
+        lines = [
+            f"{'rule':<34}{'kind':<8}{'calls':>9}{'hits':>7}{'time (s)':>10}{'us/call':>9}{'share':>8}{'skipped':>9}"
+        ]
+        for stat in self.ranked():
+            share = stat.seconds / total * 100 if total > 0 else 0.0
+            lines.append(
+                f"{stat.code:<34}{stat.kind:<8}{stat.calls:>9}{stat.hits:>7}"
+                f"{stat.seconds:>10.3f}{stat.seconds_per_call * 1e6:>9.1f}{share:>7.1f}%{stat.skipped:>9}"
+            )
+        lines.append(f"{'total':<34}{'':<8}{'':>9}{'':>7}{total:>10.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,103 @@
+# src/pkg/instrument/walk_stats.py
+import json
+from collections import Counter
+from typing import Any
+
+from ..parser.syntax import KIND_NAMES
+from ..parser.types import Token
+
+
+class FileWalkStats:
+    """What one walk visited. Nodes inside subtrees pruned by the walk plan are not
+    visited and so not counted; `pruned` counts the skipped subtree roots."""
+
+    def __init__(self, path: str | None) -> None:
+        self.path = path
+        self.syntax_nodes = 0
+        self.tokens = 0
+        self.max_depth = 0
+        self.pruned = 0
+        # keyed by kind name, so the counts refer to nothing read off the tree
+        self.syntax_kinds: Counter[str] = Counter()
+        self.token_kinds: Counter[str] = Counter()
+        self.handlers: Counter[str] = Counter()
+
+    def record(self, raw: object, handler: object, depth: int) -> None:
+        if isinstance(raw, Token):
+            self.tokens += 1
+            self.token_kinds[KIND_NAMES[raw.kind]] += 1
+        else:
+            self.syntax_nodes += 1
+            self.syntax_kinds[KIND_NAMES[raw.kind]] += 1
+        self.handlers[type(handler).__name__] += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    @property
+    def nodes(self) -> int:
+        return self.syntax_nodes + self.tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "nodes": self.nodes,
+            "syntax_nodes": self.syntax_nodes,
+            "tokens": self.tokens,
+            "max_depth": self.max_depth,
+            "pruned": self.pruned,
+            "syntax_kinds": dict(self.syntax_kinds.most_common()),
+            "token_kinds": dict(self.token_kinds.most_common()),
+            "handlers": dict(self.handlers.most_common()),
+        }
+
+
+class WalkStats:
+    """Per-file walk statistics, collected by Walker in the linting pass itself (``--walk-stats``)."""
+
+    def __init__(self) -> None:
+        self.files: list[FileWalkStats] = []
+
+    def begin_file(self, path: str | None) -> FileWalkStats:
+        stats = FileWalkStats(path)
+        self.files.append(stats)
+        return stats
+
+    def total(self) -> FileWalkStats:
+        total = FileWalkStats(None)
+        for stats in self.files:
+            total.syntax_nodes += stats.syntax_nodes
+            total.tokens += stats.tokens
+            total.max_depth = max(total.max_depth, stats.max_depth)
+            total.pruned += stats.pruned
+            total.syntax_kinds.update(stats.syntax_kinds)
+            total.token_kinds.update(stats.token_kinds)
+            total.handlers.update(stats.handlers)
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"total": self.total().to_dict(), "files": [stats.to_dict() for stats in self.files]}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def format_table(self, top: int = 15) -> str:
+        total = self.total()
+        share = total.tokens / total.nodes * 100 if total.nodes else 0.0
+        lines = [
+            f"files: {len(self.files)}  nodes: {total.nodes}  syntax nodes: {total.syntax_nodes}  "
+            f"tokens: {total.tokens} ({share:.1f}%)  max depth: {total.max_depth}  pruned subtrees: {total.pruned}",
+            "",
+            "handler hits:",
+        ]
+        lines.extend(f"{count:>10}  {name}" for name, count in total.handlers.most_common())
+        lines.append("")
+        lines.append(f"top {top} syntax kinds:")
+        lines.extend(f"{count:>10}  {kind}" for kind, count in total.syntax_kinds.most_common(top))
+        lines.append("")
+        lines.append(f"top {top} token kinds:")
+        lines.extend(f"{count:>10}  {kind}" for kind, count in total.token_kinds.most_common(top))
+        lines.append("")
+        lines.append(f"{'nodes':>10}{'tokens':>9}{'depth':>7}  path")
+        for stats in sorted(self.files, key=lambda s: s.nodes, reverse=True)[:top]:
+            lines.append(f"{stats.nodes:>10}{stats.tokens:>9}{stats.max_depth:>7}  {stats.path}")
+        return "\n".join(lines)
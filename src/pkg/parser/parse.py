@@ -1,17 +1,18 @@
 import re
 from pathlib import Path
 
-from .types import SyntaxTree
+from .types import SourceManager, SyntaxTree
 
 DEFAULT_NETTYPE_NONE_RE = re.compile(r"^\s*`default_nettype\s+none\b", re.MULTILINE)
 
 
 def parse_file(path: str) -> SyntaxTree:
-    return SyntaxTree.fromFile(path)
+    # a fresh SourceManager per file: the default one keeps every buffer ever parsed
+    return SyntaxTree.fromFile(path, SourceManager())
 
 
 def parse_text(text: str) -> SyntaxTree:
-    return SyntaxTree.fromText(text)
+    return SyntaxTree.fromText(text, SourceManager())
 
 
 def text_uses_default_nettype_none(text: str) -> bool:
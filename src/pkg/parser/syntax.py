@@ -6,7 +6,6 @@ import pyslang as sl
 from .types import CaseGenerateNode, DefaultCaseItemNode, PortDeclarationNode, ProceduralBlockNode, SyntaxNode, SyntaxTree
 
 if TYPE_CHECKING:
-    from ..vnodes.base_vnode import BaseVNode
     from ..walk.context import Context
 
 
@@ -14,11 +13,24 @@ def _syntax_kind(name: str) -> object | None:
     return getattr(sl.SyntaxKind, name, None)
 
 
+# kind -> name; reading `.name` off a pyslang kind is far slower than this lookup
+KIND_NAMES: dict[object, str] = {
+    kind: name for enum in (sl.SyntaxKind, sl.TokenKind) for name, kind in enum.__members__.items()
+}
+
+
 ALWAYS_BLOCK_KIND = sl.SyntaxKind.AlwaysBlock
 ALWAYS_COMB_BLOCK_KIND = sl.SyntaxKind.AlwaysCombBlock
 ALWAYS_LATCH_BLOCK_KIND = sl.SyntaxKind.AlwaysLatchBlock
 INITIAL_BLOCK_KIND = sl.SyntaxKind.InitialBlock
 FINAL_BLOCK_KIND = sl.SyntaxKind.FinalBlock
+CASE_GENERATE_KIND = sl.SyntaxKind.CaseGenerate
+DECLARATOR_KIND = sl.SyntaxKind.Declarator
+HIERARCHY_INSTANTIATION_KIND = sl.SyntaxKind.HierarchyInstantiation
+PORT_DECLARATION_KIND = sl.SyntaxKind.PortDeclaration
+# non-ANSI port declarations and the ports of an ANSI port list
+PORT_KINDS = frozenset({PORT_DECLARATION_KIND, sl.SyntaxKind.ImplicitAnsiPort, sl.SyntaxKind.ExplicitAnsiPort})
+SIGNAL_EVENT_EXPRESSION_KIND = sl.SyntaxKind.SignalEventExpression
 CONDITIONAL_STATEMENT_KIND = _syntax_kind("ConditionalStatement")
 BLOCK_STATEMENT_KINDS = {
     kind
@@ -29,7 +41,59 @@ BLOCK_STATEMENT_KINDS = {
     )
     if kind is not None
 }
+CASE_STATEMENT_KIND = _syntax_kind("CaseStatement")
+# statements whose sub-statements run on some paths only
+BRANCHING_STATEMENT_KINDS = {
+    kind
+    for kind in (
+        CONDITIONAL_STATEMENT_KIND,
+        CASE_STATEMENT_KIND,
+        _syntax_kind("RandCaseStatement"),
+        _syntax_kind("ForLoopStatement"),
+        _syntax_kind("ForeachLoopStatement"),
+        _syntax_kind("LoopStatement"),
+        _syntax_kind("DoWhileStatement"),
+        _syntax_kind("ForeverStatement"),
+    )
+    if kind is not None
+}
+FOR_LOOP_STATEMENT_KIND = _syntax_kind("ForLoopStatement")
+FOR_VARIABLE_DECLARATION_KIND = _syntax_kind("ForVariableDeclaration")
+LOOP_STATEMENT_KINDS = {
+    kind
+    for kind in (
+        FOR_LOOP_STATEMENT_KIND,
+        _syntax_kind("ForeachLoopStatement"),
+        _syntax_kind("LoopStatement"),
+        _syntax_kind("DoWhileStatement"),
+        _syntax_kind("ForeverStatement"),
+    )
+    if kind is not None
+}
+# loops whose body runs at least once
+ALWAYS_RUNNING_LOOP_KINDS = {
+    kind
+    for kind in (
+        _syntax_kind("DoWhileStatement"),
+        _syntax_kind("ForeverStatement"),
+    )
+    if kind is not None
+}
+# non-statement nodes that hold sub-statements: block item lists, else clauses, case items
+STATEMENT_CONTAINER_KINDS = {
+    kind
+    for kind in (
+        _syntax_kind("SyntaxList"),
+        _syntax_kind("ElseClause"),
+        _syntax_kind("StandardCaseItem"),
+        _syntax_kind("DefaultCaseItem"),
+        _syntax_kind("PatternCaseItem"),
+    )
+    if kind is not None
+}
 ENDCASE_TOKEN_KIND = sl.TokenKind.EndCaseKeyword
+BLOCKING_ASSIGNMENT_TOKEN_KIND = sl.TokenKind.Equals
+NONBLOCKING_ASSIGNMENT_TOKEN_KIND = sl.TokenKind.LessThanEquals
 CASE_TOKEN_KINDS = {
     sl.TokenKind.CaseKeyword,
     sl.TokenKind.CaseXKeyword,
@@ -92,6 +156,141 @@ UNIQUE_PRIORITY_TOKEN_KINDS = {
 }
 DEFPARAM_TOKEN_KIND = _syntax_kind("DefParamKeyword") or sl.TokenKind.DefParamKeyword
 
+MODULE_DECLARATION_KINDS = {
+    sl.SyntaxKind.ModuleDeclaration,
+    sl.SyntaxKind.InterfaceDeclaration,
+    sl.SyntaxKind.ProgramDeclaration,
+    sl.SyntaxKind.PackageDeclaration,
+}
+IDENTIFIER_NAME_KINDS = {
+    sl.SyntaxKind.IdentifierName,
+    sl.SyntaxKind.IdentifierSelectName,
+}
+
+# Kinds the symbol table is built from; symbol rules consume these.
+SYMBOL_SOURCE_KINDS = frozenset(
+    MODULE_DECLARATION_KINDS
+    | IDENTIFIER_NAME_KINDS
+    | {DECLARATOR_KIND, HIERARCHY_INSTANTIATION_KIND}
+)
+# Kinds the module registry is built from; module rules consume these.
+MODULE_SOURCE_KINDS = frozenset(MODULE_DECLARATION_KINDS | {HIERARCHY_INSTANTIATION_KIND})
+
+# --- subtree shapes, used by the walk planner to skip whole subtrees ---
+
+# Literal expressions hold nothing but these tokens.
+LITERAL_EXPRESSION_KINDS = {
+    sl.SyntaxKind.IntegerLiteralExpression,
+    sl.SyntaxKind.IntegerVectorExpression,
+    sl.SyntaxKind.RealLiteralExpression,
+    sl.SyntaxKind.TimeLiteralExpression,
+    sl.SyntaxKind.UnbasedUnsizedLiteralExpression,
+    sl.SyntaxKind.StringLiteralExpression,
+    sl.SyntaxKind.NullLiteralExpression,
+}
+LITERAL_TOKEN_KINDS = {
+    sl.TokenKind.IntegerLiteral,
+    sl.TokenKind.IntegerBase,
+    sl.TokenKind.RealLiteral,
+    sl.TokenKind.TimeLiteral,
+    sl.TokenKind.UnbasedUnsizedLiteral,
+    sl.TokenKind.StringLiteral,
+    sl.TokenKind.NullKeyword,
+}
+
+# Expression-level constructs: their subtrees hold expressions (and at most
+# inline data types), never module items, procedural blocks or case syntax.
+EXPRESSION_LEVEL_KINDS = {
+    sl.SyntaxKind.AttributeInstance,
+    sl.SyntaxKind.ParameterValueAssignment,
+    sl.SyntaxKind.DelayControl,
+    sl.SyntaxKind.EventControl,
+    sl.SyntaxKind.EventControlWithExpression,
+    sl.SyntaxKind.ImplicitEventControl,
+    sl.SyntaxKind.RepeatedEventControl,
+    sl.SyntaxKind.CycleDelay,
+}
+NON_EXPRESSION_KINDS = frozenset(
+    MODULE_DECLARATION_KINDS
+    | PROCEDURAL_BLOCK_KINDS
+    | CASE_TOKEN_KINDS
+    | UNIQUE_PRIORITY_TOKEN_KINDS
+    | {
+        HIERARCHY_INSTANTIATION_KIND,
+        sl.SyntaxKind.HierarchicalInstance,
+        CASE_GENERATE_KIND,
+        PORT_DECLARATION_KIND,
+        sl.SyntaxKind.DefParam,
+        sl.SyntaxKind.ContinuousAssign,
+        sl.SyntaxKind.NetDeclaration,
+        sl.SyntaxKind.DataDeclaration,
+        ENDCASE_TOKEN_KIND,
+        DEFPARAM_TOKEN_KIND,
+    }
+)
+
+# Module headers' port lists and module members that can never hold a module
+# declaration or an instantiation. Generate constructs are deliberately absent.
+STRUCTURE_FREE_KINDS = PROCEDURAL_BLOCK_KINDS | {
+    sl.SyntaxKind.AlwaysFFBlock,
+    sl.SyntaxKind.ParameterPortList,
+    sl.SyntaxKind.AnsiPortList,
+    sl.SyntaxKind.NonAnsiPortList,
+    sl.SyntaxKind.WildcardPortList,
+    sl.SyntaxKind.HierarchicalInstance,
+    PORT_DECLARATION_KIND,
+    sl.SyntaxKind.ContinuousAssign,
+    sl.SyntaxKind.NetDeclaration,
+    sl.SyntaxKind.DataDeclaration,
+    sl.SyntaxKind.UserDefinedNetDeclaration,
+    sl.SyntaxKind.NetTypeDeclaration,
+    sl.SyntaxKind.NetAlias,
+    sl.SyntaxKind.ParameterDeclarationStatement,
+    sl.SyntaxKind.TypedefDeclaration,
+    sl.SyntaxKind.ForwardTypedefDeclaration,
+    sl.SyntaxKind.GenvarDeclaration,
+    sl.SyntaxKind.FunctionDeclaration,
+    sl.SyntaxKind.TaskDeclaration,
+    sl.SyntaxKind.ClassDeclaration,
+    sl.SyntaxKind.ModportDeclaration,
+    sl.SyntaxKind.ClockingDeclaration,
+    sl.SyntaxKind.CovergroupDeclaration,
+    sl.SyntaxKind.PropertyDeclaration,
+    sl.SyntaxKind.SequenceDeclaration,
+    sl.SyntaxKind.LetDeclaration,
+    sl.SyntaxKind.ImmediateAssertionMember,
+    sl.SyntaxKind.ConcurrentAssertionMember,
+    sl.SyntaxKind.PackageImportDeclaration,
+    sl.SyntaxKind.TimeUnitsDeclaration,
+    sl.SyntaxKind.ElabSystemTask,
+    sl.SyntaxKind.DefParam,
+    sl.SyntaxKind.EmptyMember,
+}
+
+
+def subtree_may_contain(kind: object, target: object) -> bool:
+    """Conservatively answer whether a node of `kind` can have a `target`-kind node below it.
+
+    Only kinds with a known subtree shape can answer False; anything else may
+    contain anything.
+    """
+    if kind in LITERAL_EXPRESSION_KINDS:
+        return target in LITERAL_TOKEN_KINDS
+    if kind in EXPRESSION_LEVEL_KINDS:
+        return target not in NON_EXPRESSION_KINDS
+    if kind in STRUCTURE_FREE_KINDS:
+        return target not in MODULE_SOURCE_KINDS
+    return True
+
+
+def prunable_subtree_kinds(consumed: frozenset[object]) -> frozenset[object]:
+    """Kinds whose whole subtree (the node included) holds none of the `consumed` kinds."""
+    return frozenset(
+        kind
+        for kind in LITERAL_EXPRESSION_KINDS | EXPRESSION_LEVEL_KINDS | STRUCTURE_FREE_KINDS
+        if kind not in consumed and not any(subtree_may_contain(kind, target) for target in consumed)
+    )
+
 
 def is_assignment_expression(raw: object) -> bool:
     return getattr(raw, "kind", None) in ASSIGNMENT_KINDS
@@ -138,11 +337,11 @@ def is_internal_inout_port_declaration(raw: object) -> bool:
 
 
 def is_blocking_assignment_token(raw: object) -> bool:
-    return getattr(raw, "kind", None) == sl.TokenKind.Equals
+    return getattr(raw, "kind", None) == BLOCKING_ASSIGNMENT_TOKEN_KIND
 
 
 def is_nonblocking_assignment_token(raw: object) -> bool:
-    return getattr(raw, "kind", None) == sl.TokenKind.LessThanEquals
+    return getattr(raw, "kind", None) == NONBLOCKING_ASSIGNMENT_TOKEN_KIND
 
 
 def is_casex_casez_token(raw: object) -> bool:
@@ -199,17 +398,6 @@ def declarator_has_initializer(raw: object) -> bool:
     return getattr(raw, "initializer", None) is not None
 
 
-def declarator_is_port(ctx: "Context") -> bool:
-    for ancestor in reversed(ctx.stack):
-        raw = ancestor.raw
-        type_name = type(raw).__name__
-        if type_name.endswith("AnsiPortSyntax") or type_name == "PortDeclarationSyntax":
-            return True
-        if type_name.endswith("DataDeclarationSyntax"):
-            return False
-    return False
-
-
 def instantiation_type_name(raw: object) -> str | None:
     type_node = getattr(raw, "type", None)
     value = getattr(type_node, "value", None)
@@ -247,6 +435,72 @@ def conditional_statement_body(raw: object) -> SyntaxNode | None:
     return statement if isinstance(statement, SyntaxNode) else None
 
 
+def _identifier_names(node: SyntaxNode) -> set[str]:
+    names: set[str] = set()
+    if node.kind in IDENTIFIER_NAME_KINDS:
+        name = identifier_name(node)
+        if name is not None:
+            names.add(name)
+    for child in node:
+        if isinstance(child, SyntaxNode):
+            names |= _identifier_names(child)
+    return names
+
+
+def enclosing_module_parameter_names(raw: object) -> set[str]:
+    """Parameters and localparams declared by the module (interface, program, package) around `raw`."""
+    node = getattr(raw, "parent", None)
+    while node is not None and node.kind not in MODULE_DECLARATION_KINDS:
+        node = getattr(node, "parent", None)
+    if node is None:
+        return set()
+
+    declarations: list[object] = []
+    ports = getattr(getattr(node, "header", None), "parameters", None)
+    if ports is not None:
+        declarations.extend(getattr(ports, "declarations", None) or ())
+    for member in getattr(node, "members", None) or ():
+        if getattr(member, "kind", None) == sl.SyntaxKind.ParameterDeclarationStatement:
+            declarations.append(member.parameter)
+
+    names: set[str] = set()
+    for declaration in declarations:
+        for declarator in getattr(declaration, "declarators", None) or ():
+            name = declarator_name(declarator)
+            if name is not None:
+                names.add(name)
+    return names
+
+
+def for_loop_has_constant_bounds(raw: object) -> bool:
+    """Whether a for loop's start values and stop condition read only its loop variables and module parameters."""
+    stop = getattr(raw, "stopExpr", None)
+    if not isinstance(stop, SyntaxNode):
+        return False
+
+    loop_variables: set[str] = set()
+    reads = _identifier_names(stop)
+    for initializer in getattr(raw, "initializers", None) or ():
+        if not isinstance(initializer, SyntaxNode):
+            continue
+        if initializer.kind == FOR_VARIABLE_DECLARATION_KIND:
+            name = declarator_name(initializer.declarator)
+            value = getattr(initializer.declarator.initializer, "expr", None)
+        elif is_assignment_expression(initializer):
+            name = assignment_target_identifier_name(initializer)
+            value = getattr(initializer, "right", None)
+        else:
+            return False
+        if name is None:
+            return False
+        loop_variables.add(name)
+        if isinstance(value, SyntaxNode):
+            reads |= _identifier_names(value)
+
+    reads -= loop_variables
+    return not reads or reads <= enclosing_module_parameter_names(raw)
+
+
 def is_block_statement(raw: object) -> bool:
     return getattr(raw, "kind", None) in BLOCK_STATEMENT_KINDS
 
@@ -327,13 +581,6 @@ def identifier_access_modes(ctx: "Context", raw_identifier: SyntaxNode) -> tuple
     return True, False
 
 
-def enclosing_procedural_block(ctx: "Context") -> "BaseVNode | None":
-    for ancestor in reversed(ctx.stack):
-        if is_procedural_block(ancestor.raw):
-            return ancestor
-    return None
-
-
 def identifier_is_assignment_lhs(ctx: "Context", raw_identifier: SyntaxNode) -> bool:
     _read, write = identifier_access_modes(ctx, raw_identifier)
     return write
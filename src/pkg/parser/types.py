@@ -3,6 +3,7 @@ from typing import TypeAlias
 
 
 SyntaxTree: TypeAlias = sl.SyntaxTree
+SourceManager: TypeAlias = sl.SourceManager
 SyntaxNode: TypeAlias = sl.SyntaxNode
 Token: TypeAlias = sl.Token
 RawNode: TypeAlias = SyntaxNode | Token
@@ -18,3 +19,6 @@ HierarchyInstantiationNode: TypeAlias = sl.HierarchyInstantiationSyntax
 HierarchicalInstanceNode: TypeAlias = sl.HierarchicalInstanceSyntax
 DefaultCaseItemNode: TypeAlias = sl.DefaultCaseItemSyntax
 PortDeclarationNode: TypeAlias = sl.PortDeclarationSyntax
+ImplicitAnsiPortNode: TypeAlias = sl.ImplicitAnsiPortSyntax
+ExplicitAnsiPortNode: TypeAlias = sl.ExplicitAnsiPortSyntax
+StatementNode: TypeAlias = sl.StatementSyntax
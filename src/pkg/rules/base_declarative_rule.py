@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+from ..vnodes.base_vnode import BaseVNode
+from .base_rule import Rule
+
+if TYPE_CHECKING:
+    from ..walk.context import Context, ContextFlag
+
+
+class DeclarativeRule(Rule):
+    """A syntax rule that is only "raw kind is one of `kinds`" and a test of the context flags.
+
+    It applies to a node of one of `kinds` whose context has every flag in
+    `requires_flags` and none in `forbids_flags`. RuleRunner compiles these
+    into a table keyed by kind, so on every other node the rule costs
+    nothing; applies() evaluates the same predicate for callers outside a
+    runner. `consumes` still has to list every kind the rule depends on,
+    including those of the nodes that set its flags.
+    """
+
+    kinds: frozenset[object] = frozenset()
+    requires_flags: frozenset["ContextFlag"] = frozenset()
+    forbids_flags: frozenset["ContextFlag"] = frozenset()
+
+    def applies(self, vnode: BaseVNode, ctx: "Context") -> bool:
+        flags = ctx.flags
+        return (
+            getattr(vnode.raw, "kind", None) in self.kinds
+            and self.requires_flags <= flags
+            and self.forbids_flags.isdisjoint(flags)
+        )
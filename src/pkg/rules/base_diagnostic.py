@@ -1,20 +1,14 @@
 from abc import ABC
-from typing import Any
 
 from ..vnodes.base_vnode import BaseVNode
+from .diagnostic import Diagnostic
 
 
 class BaseDiagnostic(ABC):
     code: str = "UNSPEC"
     message: str = "No message"
+    # raw kinds the rule depends on being walked; None means unknown, which disables walk pruning
+    consumes: frozenset[object] | None = None
 
-    def report(self, vnode: BaseVNode) -> dict[str, Any]:
-        diagnostic: dict[str, Any] = {
-            "code": self.code,
-            "line": vnode.location["line"],
-            "col": vnode.location["col"],
-            "message": self.message,
-        }
-        if "file" in vnode.location:
-            diagnostic["file"] = vnode.location["file"]
-        return diagnostic
+    def report(self, vnode: BaseVNode) -> Diagnostic:
+        return Diagnostic(self.code, vnode.location, self.message)
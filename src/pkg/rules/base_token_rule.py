@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+
+from ..parser.types import SyntaxTree, Token
+from ..vnodes.base_vnode import BaseVNode
+from .base_rule import Rule
+
+if TYPE_CHECKING:
+    from ..walk.context import Context
+
+
+class TokenRule(Rule):
+    """A syntax rule that decides from a single token, never from where it sits in the tree.
+
+    `consumes` lists the token kinds it can apply to. run() evaluates token
+    rules with the token scanner rather than the walk, so they need no VNode
+    or Context per node; applies() still works on a walked token VNode.
+    """
+
+    @abstractmethod
+    def applies_to_token(self, token: Token, tree: SyntaxTree) -> bool: ...
+
+    def applies(self, vnode: BaseVNode, ctx: "Context | None") -> bool:
+        # spec'd test doubles of BaseVNode have no instance attributes
+        return self.applies_to_token(vnode.raw, getattr(vnode, "tree", None))
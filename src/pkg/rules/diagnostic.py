@@ -0,0 +1,63 @@
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from ..vnodes.base_vnode import Location
+
+
+class Diagnostic(Mapping[str, Any]):
+    """One reported issue, with its message formatted only when it is read.
+
+    Rules pass a `str.format` template and its arguments rather than the
+    finished text, so a run that only counts or filters its diagnostics never
+    builds the messages. It reads like the dict diagnostics used to be
+    (``d["code"]``, ``d.get("file")``, comparison with a dict), and
+    `to_dict()` gives that dict.
+    """
+
+    __slots__ = ("code", "line", "col", "file", "_template", "_args", "_message")
+
+    def __init__(self, code: str, location: Location, template: str, *args: Any) -> None:
+        self.code = code
+        self.line = location.get("line", 0)
+        self.col = location.get("col", 0)
+        self.file: str | None = location.get("file")
+        self._template = template
+        self._args = args
+        self._message: str | None = None if args else template
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._template.format(*self._args)
+            self._args = ()
+        return self._message
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "code":
+            return self.code
+        if key == "line":
+            return self.line
+        if key == "col":
+            return self.col
+        if key == "message":
+            return self.message
+        if key == "file" and self.file is not None:
+            return self.file
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from ("code", "line", "col", "message")
+        if self.file is not None:
+            yield "file"
+
+    def __len__(self) -> int:
+        return 4 if self.file is None else 5
+
+    def to_dict(self) -> dict[str, Any]:
+        diagnostic: dict[str, Any] = {"code": self.code, "line": self.line, "col": self.col, "message": self.message}
+        if self.file is not None:
+            diagnostic["file"] = self.file
+        return diagnostic
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.to_dict()!r})"
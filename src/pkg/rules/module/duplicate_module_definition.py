@@ -1,6 +1,6 @@
-from typing import Any
-
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import MODULE_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .module_rule_runner import module_rule_runner
 
@@ -8,9 +8,10 @@ from .module_rule_runner import module_rule_runner
 class DuplicateModuleDefinitionRule(BaseSymbolRule):
     code = "DUPLICATE_MODULE"
     message = "Duplicate module definition"
+    consumes = MODULE_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for name, scopes in symbol_table.modules.items():
             if len(scopes) <= 1:
@@ -21,14 +22,8 @@ class DuplicateModuleDefinitionRule(BaseSymbolRule):
 
             for scope in scopes[1:]:
                 loc = scope.location or {"line": 0, "col": 0}
-                diagnostic = {
-                    "code": self.code,
-                    "line": loc.get("line", 0),
-                    "col": loc.get("col", 0),
-                    "message": f"Duplicate module '{name}' (first defined in {first_file})",
-                }
-                if "file" in loc:
-                    diagnostic["file"] = loc["file"]
-                diagnostics.append(diagnostic)
+                diagnostics.append(
+                    Diagnostic(self.code, loc, "Duplicate module '{}' (first defined in {})", name, first_file)
+                )
 
         return diagnostics
@@ -1,6 +1,6 @@
-from typing import Any
-
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import MODULE_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .module_rule_runner import module_rule_runner
 
@@ -8,22 +8,15 @@ from .module_rule_runner import module_rule_runner
 class UndefinedModuleRule(BaseSymbolRule):
     code = "UNDEFINED_MODULE"
     message = "Instantiation of undefined module"
+    consumes = MODULE_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for name, loc in symbol_table.module_references:
             if symbol_table.lookup_module(name) is not None:
                 continue
 
-            diagnostic = {
-                "code": self.code,
-                "line": loc.get("line", 0),
-                "col": loc.get("col", 0),
-                "message": f"Instantiation of undefined module '{name}'",
-            }
-            if "file" in loc:
-                diagnostic["file"] = loc["file"]
-            diagnostics.append(diagnostic)
+            diagnostics.append(Diagnostic(self.code, loc, "Instantiation of undefined module '{}'", name))
 
         return diagnostics
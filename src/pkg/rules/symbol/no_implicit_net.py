@@ -1,6 +1,6 @@
-from typing import Any
-
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import SYMBOL_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .symbol_rule_runner import symbol_rule_runner
 
@@ -8,9 +8,10 @@ from .symbol_rule_runner import symbol_rule_runner
 @symbol_rule_runner.register
 class NoImplicitNetRule(BaseSymbolRule):
     code = "NO_IMPLICIT_NET"
+    consumes = SYMBOL_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for scope in symbol_table.scopes:
             for sym in scope.symbols.values():
@@ -18,14 +19,6 @@ class NoImplicitNetRule(BaseSymbolRule):
                     continue
 
                 loc = sym.uses[0]
-                diagnostic = {
-                    "code": self.code,
-                    "line": loc["line"],
-                    "col": loc["col"],
-                    "message": f"Implicit net '{sym.name}' is not allowed",
-                }
-                if "file" in loc:
-                    diagnostic["file"] = loc["file"]
-                diagnostics.append(diagnostic)
+                diagnostics.append(Diagnostic(self.code, loc, "Implicit net '{}' is not allowed", sym.name))
 
         return diagnostics
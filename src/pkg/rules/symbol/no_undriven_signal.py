@@ -1,6 +1,6 @@
-from typing import Any
-
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import SYMBOL_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .symbol_rule_runner import symbol_rule_runner
 
@@ -8,9 +8,10 @@ from .symbol_rule_runner import symbol_rule_runner
 @symbol_rule_runner.register
 class NoUndrivenSignalRule(BaseSymbolRule):
     code = "NO_UNDRIVEN_SIGNAL"
+    consumes = SYMBOL_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for scope in symbol_table.scopes:
             for sym in scope.symbols.values():
@@ -20,14 +21,6 @@ class NoUndrivenSignalRule(BaseSymbolRule):
                     continue
 
                 loc = sym.declarations[0]
-                diagnostic = {
-                    "code": self.code,
-                    "line": loc["line"],
-                    "col": loc["col"],
-                    "message": f"Signal '{sym.name}' is read but never driven",
-                }
-                if "file" in loc:
-                    diagnostic["file"] = loc["file"]
-                diagnostics.append(diagnostic)
+                diagnostics.append(Diagnostic(self.code, loc, "Signal '{}' is read but never driven", sym.name))
 
         return diagnostics
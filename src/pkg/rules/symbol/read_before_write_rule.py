@@ -1,4 +1,6 @@
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import SYMBOL_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .symbol_rule_runner import symbol_rule_runner
 
@@ -7,9 +9,10 @@ from .symbol_rule_runner import symbol_rule_runner
 class ReadBeforeWriteRule(BaseSymbolRule):
     code = "READ_BEFORE_WRITE"
     message = "Variable read before write"
+    consumes = SYMBOL_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict]:
-        diagnostics = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for scope in symbol_table.scopes:
             for sym in scope.symbols.values():
@@ -20,15 +23,7 @@ class ReadBeforeWriteRule(BaseSymbolRule):
                 for event in sym.use_events:
                     if event["read"] and not seen_write:
                         loc = event["location"]
-                        diagnostic = {
-                            "code": self.code,
-                            "line": loc["line"],
-                            "col": loc["col"],
-                            "message": f"Variable '{sym.name}' read before write",
-                        }
-                        if "file" in loc:
-                            diagnostic["file"] = loc["file"]
-                        diagnostics.append(diagnostic)
+                        diagnostics.append(Diagnostic(self.code, loc, "Variable '{}' read before write", sym.name))
                         break
                     if event["write"]:
                         seen_write = True
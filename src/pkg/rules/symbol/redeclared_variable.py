@@ -1,28 +1,26 @@
-from typing import Any
-
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
+from ...parser.syntax import SYMBOL_SOURCE_KINDS
 from ...semantic.symbol_table import SymbolTable
 from .symbol_rule_runner import symbol_rule_runner
 
 @symbol_rule_runner.register
 class RedeclaredVariableRule(BaseSymbolRule):
     code = "REDECLARED_VARIABLE"
+    consumes = SYMBOL_SOURCE_KINDS
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for scope in symbol_table.scopes:
             for sym in scope.symbols.values():
                 if not sym.is_implicit and len(sym.declarations) > 1:
+                    first_line = sym.declarations[0]["line"]
                     for loc in sym.declarations[1:]:
-                        diagnostic = {
-                            "code": self.code,
-                            "line": loc["line"],
-                            "col": loc["col"],
-                            "message": f"Redeclared symbol '{sym.name}' (first declared at line {sym.declarations[0]['line']})",
-                        }
-                        if "file" in loc:
-                            diagnostic["file"] = loc["file"]
-                        diagnostics.append(diagnostic)
+                        diagnostics.append(
+                            Diagnostic(
+                                self.code, loc, "Redeclared symbol '{}' (first declared at line {})", sym.name, first_line
+                            )
+                        )
 
         return diagnostics
@@ -1,19 +1,70 @@
-from typing import Any
+import time
+from collections.abc import Collection
 
+from ...instrument.observer import RunObserver
+from ...instrument.rule_stats import RuleStat, RuleStats
 from ...semantic.symbol_table import SymbolTable
 from ..base_symbol_rule import BaseSymbolRule
+from ..diagnostic import Diagnostic
 
 
 class SymbolRuleRunner:
     def __init__(self) -> None:
         self._rules: list[BaseSymbolRule] = []
+        self._stats: list[RuleStat] | None = None
+        self.observer: RunObserver | None = None
 
     def register(self, rule_cls: type[BaseSymbolRule]) -> type[BaseSymbolRule]:
         self._rules.append(rule_cls())
         return rule_cls
 
-    def run(self, symbol_table: SymbolTable) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    @property
+    def rules(self) -> list[BaseSymbolRule]:
+        return list(self._rules)
+
+    def select(self, codes: Collection[str]) -> "SymbolRuleRunner":
+        runner = SymbolRuleRunner()
+        runner._rules = [rule for rule in self._rules if rule.code in codes]
+        return runner
+
+    def instrumented(self, stats: RuleStats) -> "SymbolRuleRunner":
+        """A copy of this runner that records per-rule calls, hits and time into `stats`."""
+        runner = SymbolRuleRunner()
+        runner._rules = list(self._rules)
+        runner.observer = self.observer
+        runner._stats = [stats.stat_for(rule.code, "symbol") for rule in self._rules]
+        return runner
+
+    def observed(self, observer: RunObserver) -> "SymbolRuleRunner":
+        """A copy of this runner that reports its phase and every diagnostic to `observer`."""
+        runner = SymbolRuleRunner()
+        runner._rules = list(self._rules)
+        runner._stats = self._stats
+        runner.observer = observer
+        return runner
+
+    def run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        observer = self.observer
+        if observer is not None:
+            observer.rule_phase_start("symbol_rules")
+        diagnostics = self._run(symbol_table)
+        if observer is not None:
+            for diagnostic in diagnostics:
+                observer.diagnostic(diagnostic)
+            observer.rule_phase_done("symbol_rules", len(diagnostics))
+        return diagnostics
+
+    def _run(self, symbol_table: SymbolTable) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
+        if self._stats is not None:
+            for rule, stat in zip(self._rules, self._stats):
+                start = time.perf_counter()
+                found = rule.run(symbol_table)
+                stat.seconds += time.perf_counter() - start
+                stat.calls += 1
+                stat.hits += len(found)
+                diagnostics.extend(found)
+            return diagnostics
         for rule in self._rules:
             diagnostics.extend(rule.run(symbol_table))
         return diagnostics
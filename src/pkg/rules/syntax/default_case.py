@@ -1,14 +1,13 @@
-from ...parser.syntax import is_endcase_token
+from ...parser.syntax import CASE_GENERATE_KIND, ENDCASE_TOKEN_KIND
 from ...walk.context import ContextFlag
-from ..base_rule import Rule
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 @rule_runner.register
-class DefaultCaseRule(Rule):
+class DefaultCaseRule(DeclarativeRule):
     code = "DEFAULT_CASE"
     message = "Case statement missing default case"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_endcase_token(vnode.raw) \
-            and ctx.has(ContextFlag.CASE_GENERATE) \
-            and not ctx.has(ContextFlag.DEFAULT)
+    consumes = frozenset({ENDCASE_TOKEN_KIND, CASE_GENERATE_KIND})
+    kinds = frozenset({ENDCASE_TOKEN_KIND})
+    requires_flags = frozenset({ContextFlag.CASE_GENERATE})
+    forbids_flags = frozenset({ContextFlag.DEFAULT})
@@ -1,12 +1,11 @@
-from ...parser.syntax import is_always_latch_block
-from ..base_rule import Rule
+from ...parser.syntax import ALWAYS_LATCH_BLOCK_KIND
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoAlwaysLatchRule(Rule):
+class NoAlwaysLatchRule(DeclarativeRule):
     code = "NO_ALWAYS_LATCH"
     message = "Use of always_latch can hide unintended latch-oriented design choices"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_always_latch_block(vnode.raw)
+    consumes = frozenset({ALWAYS_LATCH_BLOCK_KIND})
+    kinds = consumes
@@ -1,13 +1,12 @@
-from ...parser.syntax import is_blocking_assignment_token
-from ...vnodes.base_vnode import BaseVNode
-from ...walk.context import Context, ContextFlag
-from ..base_rule import Rule
+from ...parser.syntax import ALWAYS_BLOCK_KIND, BLOCKING_ASSIGNMENT_TOKEN_KIND
+from ...walk.context import ContextFlag
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 @rule_runner.register
-class NoBlockingAssignmentInSequentialRule(Rule):
+class NoBlockingAssignmentInSequentialRule(DeclarativeRule):
     code = "NO_BLOCKING_SEQUENTIAL"
     message = "Blocking assignment used in sequential logic"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_blocking_assignment_token(vnode.raw) and ctx.has(ContextFlag.ALWAYS)
+    consumes = frozenset({BLOCKING_ASSIGNMENT_TOKEN_KIND, ALWAYS_BLOCK_KIND})
+    kinds = frozenset({BLOCKING_ASSIGNMENT_TOKEN_KIND})
+    requires_flags = frozenset({ContextFlag.ALWAYS})
@@ -1,12 +1,11 @@
-from ...parser.syntax import is_case_generate_node
-from ..base_rule import Rule
+from ...parser.syntax import CASE_GENERATE_KIND
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoCaseGenerateRule(Rule):
+class NoCaseGenerateRule(DeclarativeRule):
     code = "NO_CASE_GENERATE"
     message = "Use of case generate can make structural intent harder to follow"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_case_generate_node(vnode.raw)
+    consumes = frozenset({CASE_GENERATE_KIND})
+    kinds = consumes
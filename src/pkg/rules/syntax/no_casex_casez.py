@@ -1,12 +1,14 @@
-from ...parser.syntax import is_casex_casez_token
-from ..base_rule import Rule
+from ...parser.syntax import CASE_STYLE_TOKEN_KINDS, is_casex_casez_token
+from ...parser.types import SyntaxTree, Token
+from ..base_token_rule import TokenRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoCaseXCaseZRule(Rule):
+class NoCaseXCaseZRule(TokenRule):
     code = "NO_CASEX_CASEZ"
     message = "Use of casex/casez can hide X/Z mismatches"
+    consumes = frozenset(CASE_STYLE_TOKEN_KINDS)
 
-    def applies(self, vnode, ctx) -> bool:
-        return is_casex_casez_token(vnode.raw)
+    def applies_to_token(self, token: Token, tree: SyntaxTree) -> bool:
+        return is_casex_casez_token(token)
@@ -1,12 +1,14 @@
-from ...parser.syntax import is_defparam_token
-from ..base_rule import Rule
+from ...parser.syntax import DEFPARAM_TOKEN_KIND, is_defparam_token
+from ...parser.types import SyntaxTree, Token
+from ..base_token_rule import TokenRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoDefparamRule(Rule):
+class NoDefparamRule(TokenRule):
     code = "NO_DEFPARAM"
     message = "Use of defparam is discouraged; prefer explicit parameter overrides at instantiation"
+    consumes = frozenset({DEFPARAM_TOKEN_KIND})
 
-    def applies(self, vnode, ctx) -> bool:
-        return is_defparam_token(vnode.raw)
+    def applies_to_token(self, token: Token, tree: SyntaxTree) -> bool:
+        return is_defparam_token(token)
@@ -1,12 +1,11 @@
-from ...parser.syntax import is_final_block
-from ..base_rule import Rule
+from ...parser.syntax import FINAL_BLOCK_KIND
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoFinalBlockRule(Rule):
+class NoFinalBlockRule(DeclarativeRule):
     code = "NO_FINAL_BLOCK"
     message = "Use of final blocks is usually not appropriate in synthesizable RTL"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_final_block(vnode.raw)
+    consumes = frozenset({FINAL_BLOCK_KIND})
+    kinds = consumes
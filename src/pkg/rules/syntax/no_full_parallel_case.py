@@ -1,12 +1,14 @@
-from ...parser.syntax import has_full_parallel_case_pragma, is_case_keyword_token
-from ..base_rule import Rule
+from ...parser.syntax import CASE_TOKEN_KINDS, has_full_parallel_case_pragma, is_case_keyword_token
+from ...parser.types import SyntaxTree, Token
+from ..base_token_rule import TokenRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoFullParallelCaseRule(Rule):
+class NoFullParallelCaseRule(TokenRule):
     code = "NO_FULL_PARALLEL_CASE"
     message = "Use of full_case / parallel_case pragmas can hide real case coverage issues"
+    consumes = frozenset(CASE_TOKEN_KINDS)
 
-    def applies(self, vnode, ctx) -> bool:
-        return is_case_keyword_token(vnode.raw) and has_full_parallel_case_pragma(vnode.raw, vnode.tree)
+    def applies_to_token(self, token: Token, tree: SyntaxTree) -> bool:
+        return is_case_keyword_token(token) and has_full_parallel_case_pragma(token, tree)
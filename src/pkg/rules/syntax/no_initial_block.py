@@ -1,12 +1,11 @@
-from ...parser.syntax import is_initial_block
-from ..base_rule import Rule
+from ...parser.syntax import INITIAL_BLOCK_KIND
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoInitialBlockRule(Rule):
+class NoInitialBlockRule(DeclarativeRule):
     code = "NO_INITIAL_BLOCK"
     message = "Use of initial blocks can be unsafe in synthesizable RTL"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_initial_block(vnode.raw)
+    consumes = frozenset({INITIAL_BLOCK_KIND})
+    kinds = consumes
@@ -1,4 +1,4 @@
-from ...parser.syntax import is_internal_inout_port_declaration
+from ...parser.syntax import PORT_DECLARATION_KIND, is_internal_inout_port_declaration
 from ...vnodes.base_vnode import BaseVNode
 from ..base_rule import Rule
 from .rule_runner import rule_runner
@@ -8,6 +8,7 @@ from .rule_runner import rule_runner
 class NoInternalInoutRule(Rule):
     code = "NO_INOUT_INTERNAL"
     message = "Internal inout declarations are not allowed"
+    consumes = frozenset({PORT_DECLARATION_KIND})
 
     def applies(self, vnode: BaseVNode, ctx) -> bool:
         return is_internal_inout_port_declaration(vnode.raw)
@@ -1,12 +1,12 @@
-from ...parser.syntax import is_nonblocking_assignment_token
+from ...parser.syntax import ALWAYS_COMB_BLOCK_KIND, NONBLOCKING_ASSIGNMENT_TOKEN_KIND
 from ...walk.context import ContextFlag
-from ..base_rule import Rule
+from ..base_declarative_rule import DeclarativeRule
 from .rule_runner import rule_runner
 
 @rule_runner.register
-class NoNonBlockingAssignmentInCombRule(Rule):
+class NoNonBlockingAssignmentInCombRule(DeclarativeRule):
     code = "NO_NONBLOCKING_COMBINATIONAL"
     message = "Non-blocking assignment used in combinational logic"
-
-    def applies(self, vnode, ctx) -> bool:
-        return is_nonblocking_assignment_token(vnode.raw) and ctx.has(ContextFlag.ALWAYS_COMB)
+    consumes = frozenset({NONBLOCKING_ASSIGNMENT_TOKEN_KIND, ALWAYS_COMB_BLOCK_KIND})
+    kinds = frozenset({NONBLOCKING_ASSIGNMENT_TOKEN_KIND})
+    requires_flags = frozenset({ContextFlag.ALWAYS_COMB})
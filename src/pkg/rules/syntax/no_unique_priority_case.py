@@ -1,12 +1,14 @@
-from ...parser.syntax import is_unique_priority_case_token
-from ..base_rule import Rule
+from ...parser.syntax import UNIQUE_PRIORITY_TOKEN_KINDS, is_unique_priority_case_token
+from ...parser.types import SyntaxTree, Token
+from ..base_token_rule import TokenRule
 from .rule_runner import rule_runner
 
 
 @rule_runner.register
-class NoUniquePriorityCaseRule(Rule):
+class NoUniquePriorityCaseRule(TokenRule):
     code = "NO_UNIQUE_PRIORITY_CASE"
     message = "Use of unique/priority case can overstate case completeness or exclusivity"
+    consumes = frozenset(UNIQUE_PRIORITY_TOKEN_KINDS)
 
-    def applies(self, vnode, ctx) -> bool:
-        return is_unique_priority_case_token(vnode.raw)
+    def applies_to_token(self, token: Token, tree: SyntaxTree) -> bool:
+        return is_unique_priority_case_token(token)
@@ -1,24 +1,154 @@
 # src/pkg/rules/syntax/rule_runner.py
+import time
+from collections.abc import Collection
 from typing import Any
 
+from ...instrument.observer import RunObserver
+from ...parser.syntax import KIND_NAMES
+from ...instrument.rule_stats import RuleStat, RuleStats
 from ...vnodes.base_vnode import BaseVNode
 from ...walk.context import Context
+from ..base_declarative_rule import DeclarativeRule
 from ..base_rule import Rule
+from ..base_token_rule import TokenRule
+from ..diagnostic import Diagnostic
+
+# rule, its stat when instrumented, and for a DeclarativeRule its required and
+# forbidden flags (None for rules evaluated with applies())
+_Entry = tuple[Rule, RuleStat | None, frozenset[Any] | None, frozenset[Any] | None]
 
 
 class RuleRunner:
     def __init__(self) -> None:
         self._rules: list[Rule] = []
+        # parallel to _rules when instrumented; None keeps check() on the plain path
+        self._stats: list[RuleStat] | None = None
+        self.observer: RunObserver | None = None
+        # compiled on the first check(), once the rule list is final
+        self._table: tuple[dict[object, list[_Entry]], list[_Entry]] | None = None
 
     def register(self, rule_cls: type[Rule]) -> type[Rule]:
         self._rules.append(rule_cls())
+        self._table = None
         return rule_cls
 
-    def check(self, vnode: BaseVNode, ctx: Context) -> list[dict[str, Any]]:
-        return [rule.report(vnode) for rule in self._rules if rule.applies(vnode, ctx)]
+    @property
+    def rules(self) -> list[Rule]:
+        return list(self._rules)
+
+    def select(self, codes: Collection[str]) -> "RuleRunner":
+        runner = RuleRunner()
+        runner._rules = [rule for rule in self._rules if rule.code in codes]
+        return runner
+
+    def walk_rules(self) -> "RuleRunner":
+        """A copy keeping the rules that need the walk: all but the TokenRules."""
+        return self._subset([not isinstance(rule, TokenRule) for rule in self._rules])
+
+    def token_rules(self) -> "RuleRunner":
+        """A copy keeping only the TokenRules, for the token scanner."""
+        return self._subset([isinstance(rule, TokenRule) for rule in self._rules])
+
+    def for_kinds(self, present: Collection[str]) -> "RuleRunner":
+        """A copy without the rules none of whose `consumes` kinds are named in `present`.
+
+        Built per file from the kinds in its tree: such a rule cannot apply to
+        any node of it. Rules that declare no `consumes` are always kept. An
+        instrumented runner counts each dropped rule as skipped for the file.
+        """
+        keep = [
+            getattr(rule, "consumes", None) is None or any(KIND_NAMES[kind] in present for kind in rule.consumes)
+            for rule in self._rules
+        ]
+        if self._stats is not None:
+            for stat, kept in zip(self._stats, keep):
+                if not kept:
+                    stat.skipped += 1
+        return self._subset(keep)
+
+    def _subset(self, keep: list[bool]) -> "RuleRunner":
+        runner = RuleRunner()
+        runner._rules = [rule for rule, kept in zip(self._rules, keep) if kept]
+        if self._stats is not None:
+            runner._stats = [stat for stat, kept in zip(self._stats, keep) if kept]
+        runner.observer = self.observer
+        return runner
+
+    def instrumented(self, stats: RuleStats) -> "RuleRunner":
+        """A copy of this runner that records per-rule calls, hits and time into `stats`."""
+        runner = RuleRunner()
+        runner._rules = list(self._rules)
+        runner._stats = [stats.stat_for(rule.code, "syntax") for rule in self._rules]
+        runner.observer = self.observer
+        return runner
+
+    def observed(self, observer: RunObserver) -> "RuleRunner":
+        """A copy of this runner that reports every diagnostic to `observer`."""
+        runner = RuleRunner()
+        runner._rules = list(self._rules)
+        runner._stats = self._stats
+        runner.observer = observer
+        return runner
+
+    def _compile(self) -> tuple[dict[object, list[_Entry]], list[_Entry]]:
+        """The rules to evaluate per raw kind, and for every other kind, in registration order.
+
+        DeclarativeRules are only listed under their own kinds, so a node of
+        any other kind never reaches them; the others are listed everywhere.
+        """
+        stats = self._stats if self._stats is not None else [None] * len(self._rules)
+        entries: list[tuple[_Entry, frozenset[object] | None]] = []
+        for rule, stat in zip(self._rules, stats):
+            if isinstance(rule, DeclarativeRule):
+                entries.append(((rule, stat, rule.requires_flags, rule.forbids_flags), rule.kinds))
+            else:
+                entries.append(((rule, stat, None, None), None))
+        declared = {kind for _entry, kinds in entries if kinds is not None for kind in kinds}
+        table = {
+            kind: [entry for entry, kinds in entries if kinds is None or kind in kinds] for kind in declared
+        }
+        return table, [entry for entry, kinds in entries if kinds is None]
+
+    def check(self, vnode: BaseVNode, ctx: Context) -> list[Diagnostic]:
+        if self._table is None:
+            self._table = self._compile()
+        table, general = self._table
+        entries = table.get(vnode.raw.kind, general) if table else general
+        if self._stats is not None:
+            diagnostics = self._check_instrumented(entries, vnode, ctx)
+        else:
+            flags = ctx.flags if table else None
+            diagnostics = [
+                rule.report(vnode)
+                for rule, _stat, requires, forbids in entries
+                if (
+                    rule.applies(vnode, ctx)
+                    if requires is None
+                    else requires <= flags and forbids.isdisjoint(flags)
+                )
+            ]
+        if self.observer is not None:
+            for diagnostic in diagnostics:
+                self.observer.diagnostic(diagnostic)
+        return diagnostics
+
+    def _check_instrumented(self, entries: list[_Entry], vnode: BaseVNode, ctx: Context) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
+        for rule, stat, requires, forbids in entries:
+            start = time.perf_counter()
+            if requires is None:
+                applies = rule.applies(vnode, ctx)
+            else:
+                applies = requires <= ctx.flags and forbids.isdisjoint(ctx.flags)
+            if applies:
+                diagnostics.append(rule.report(vnode))
+                stat.hits += 1
+            stat.seconds += time.perf_counter() - start
+            stat.calls += 1
+        return diagnostics
 
-    def run(self, walk_results: list[tuple[BaseVNode, Context]]) -> list[dict[str, Any]]:
-        diagnostics: list[dict[str, Any]] = []
+    def run(self, walk_results: list[tuple[BaseVNode, Context]]) -> list[Diagnostic]:
+        diagnostics: list[Diagnostic] = []
 
         for vnode, ctx in walk_results:
             diagnostics.extend(self.check(vnode, ctx))
@@ -1,5 +1,6 @@
 """The semantic model accumulated during a walk: Symbol (a declared/used
 name), Scope (a lexical scope containing symbols, module/block/etc.), and
 SymbolTable (the registry of all scopes plus the module/instantiation
-registries used for cross-file checks).
+registries used for cross-file checks). SymbolIndex is the table's inverted
+name -> (scope, symbol) index, kept current by Scope.define.
 """
@@ -1,9 +1,14 @@
 # src/pkg/semantic/scope.py
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ..vnodes.base_vnode import Location
 from .symbol import Symbol
 
+if TYPE_CHECKING:
+    from .symbol_index import SymbolIndex
+
 class Scope:
     """Represents a scope (module, block, always block, etc.) containing symbols."""
 
@@ -15,11 +20,43 @@ class Scope:
         self.symbols: dict[str, Symbol] = {}
         self.parent: Scope | None = None
         self.children: list[Scope] = []
+        self._child_set: set[Scope] = set()  # membership index over children
+        self._children_by_name: dict[str, Scope] = {}  # first child registered under each name
+        self.index: SymbolIndex | None = None  # owning table's global index, if any
 
     def set_parent(self, parent: Scope | None = None) -> None:
         self.parent = parent
-        if parent is not None and self not in parent.children:
+        if parent is not None and self not in parent._child_set:
+            parent._child_set.add(self)
             parent.children.append(self)
+            if self.name is not None:
+                parent._children_by_name.setdefault(self.name, self)
+        if parent is not None and parent.index is not None and self.index is None:
+            self._attach_index(parent.index)
+
+    def _attach_index(self, index: SymbolIndex) -> None:
+        """Join the index of the table this scope was attached to, with its subtree."""
+        self.index = index
+        for symbol in self.symbols.values():
+            index.add(self, symbol)
+        for child in self.children:
+            if child.index is None:
+                child._attach_index(index)
+
+    def remove_child(self, child: Scope) -> None:
+        if child not in self._child_set:
+            return
+        self._child_set.discard(child)
+        self.children.remove(child)
+        if child.name is not None and self._children_by_name.get(child.name) is child:
+            del self._children_by_name[child.name]
+            replacement = next((c for c in self.children if c.name == child.name), None)
+            if replacement is not None:
+                self._children_by_name[child.name] = replacement
+
+    def child(self, name: str) -> Scope | None:
+        """Return the first child scope registered under ``name``, or None."""
+        return self._children_by_name.get(name)
 
     def define(self, symbol: Symbol) -> None:
         if symbol.name in self.symbols:
@@ -27,6 +64,8 @@ class Scope:
             existing.declarations.extend(symbol.declarations)
             existing.uses.extend(symbol.uses)
             existing.use_events.extend(symbol.use_events)
+            for driver_id, loc in symbol.drivers.items():
+                existing.drivers.setdefault(driver_id, loc)
             existing.is_read |= symbol.is_read
             existing.is_written |= symbol.is_written
             existing.is_port |= symbol.is_port
@@ -37,6 +76,8 @@ class Scope:
 
         symbol.scope = self
         self.symbols[symbol.name] = symbol
+        if self.index is not None:
+            self.index.add(self, symbol)
 
     def lookup(self, name: str) -> Symbol | None:
         if name in self.symbols:
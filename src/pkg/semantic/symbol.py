@@ -13,8 +13,7 @@ class UseEvent(TypedDict):
     location: Location
     read: bool
     write: bool
-    driver_id: NotRequired[str]
-    driver_location: NotRequired[Location]
+    driver_id: NotRequired[int]
 
 class Symbol:
     """Represents a declared symbol (variable, signal, etc.) in the design."""
@@ -27,6 +26,8 @@ class Symbol:
         self.declarations: list[Location] = []
         self.uses: list[Location] = []
         self.use_events: list[UseEvent] = []
+        # driver id -> location of its first write, in order of first write
+        self.drivers: dict[int, Location] = {}
 
         self.is_implicit: bool = False
         self.is_port: bool = False
@@ -44,15 +45,13 @@ class Symbol:
         loc: Location,
         read: bool = False,
         write: bool = False,
-        driver_id: str | None = None,
-        driver_location: Location | None = None,
+        driver_id: int | None = None,
     ) -> None:
         self.uses.append(loc)
         event: UseEvent = {"location": loc, "read": read, "write": write}
         if driver_id is not None:
             event["driver_id"] = driver_id
-        if driver_location is not None:
-            event["driver_location"] = driver_location
+            self.drivers.setdefault(driver_id, loc)
         self.use_events.append(event)
         self.is_read |= read
         self.is_written |= write
@@ -0,0 +1,61 @@
+# src/pkg/semantic/symbol_index.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from .scope import Scope
+    from .symbol import Symbol
+
+
+class SymbolIndex:
+    """Inverted index over every scope of a SymbolTable: name -> [(scope, symbol), ...].
+
+    Entries are appended by Scope.define in definition order, so the first entry
+    for a name is the earliest definition anywhere in the table.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, list[tuple[Scope, Symbol]]] = {}
+
+    def add(self, scope: Scope, symbol: Symbol) -> None:
+        self._entries.setdefault(symbol.name, []).append((scope, symbol))
+
+    def first(self, name: str) -> Symbol | None:
+        entries = self._entries.get(name)
+        return entries[0][1] if entries else None
+
+    def entries(self, name: str) -> list[tuple[Scope, Symbol]]:
+        return list(self._entries.get(name, ()))
+
+    def remove_scopes(self, scopes: Iterable[Scope]) -> None:
+        """Drop every entry contributed by the given scopes."""
+        for scope in scopes:
+            for name in scope.symbols:
+                entries = self._entries.get(name)
+                if entries is None:
+                    continue
+                entries[:] = [entry for entry in entries if entry[0] is not scope]
+                if not entries:
+                    del self._entries[name]
+
+    def remove_latest(self, scope: Scope) -> None:
+        """Drop the entries of `scope`, which must be the latest ones for each of its names.
+
+        That holds for a scope right after it was walked, as nothing else has
+        defined a symbol since; unlike remove_scopes this costs O(symbols in scope).
+        """
+        for name in scope.symbols:
+            entries = self._entries.get(name)
+            if entries is None:
+                continue
+            while entries and entries[-1][0] is scope:
+                entries.pop()
+            if not entries:
+                del self._entries[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,22 +1,32 @@
 # src/pkg/semantic/symbol_table.py
 from __future__ import annotations
 
+import copy
+from collections.abc import Callable
+
 from ..vnodes.base_vnode import Location
 from .symbol import Symbol
 from .scope import Scope
+from .symbol_index import SymbolIndex
 
 
 class SymbolTable:
     """Manages multiple scopes and provides symbol lookup across the hierarchy."""
 
     def __init__(self) -> None:
+        self.index = SymbolIndex()  # name -> (scope, symbol) across every scope in the table
         self.global_scope: Scope = Scope(kind="global")
+        self.global_scope.index = self.index
         self.scopes: list[Scope] = [self.global_scope]  # registry - all scopes ever created
         self._scope_stack: list[Scope] = [self.global_scope]  # traversal stack
         self.modules: dict[str, list[Scope]] = {}  # module name -> all scopes defining it, across files
         self.module_references: list[tuple[str, Location]] = []
+        self._module_reference_files: list[str | None] = []  # parallel to module_references
+        self.drivers: list[Location] = []  # driver id -> location of the driving construct
         self.current_file: str | None = None
         self._file_default_nettype_none: dict[str, bool] = {}
+        # called by the walk with each module scope once the module has been walked
+        self.on_module_exit: Callable[[Scope], None] | None = None
 
     def set_current_file(self, path: str) -> None:
         """Signal that a new file is about to be walked. Stamps all subsequent scopes."""
@@ -45,6 +55,7 @@ class SymbolTable:
 
         scope = Scope(kind=kind, name=name, location=location)
         scope.file = self.current_file
+        scope.index = self.index
         scope.set_parent(parent)
         self.scopes.append(scope)
         self._scope_stack.append(scope)
@@ -65,6 +76,60 @@ class SymbolTable:
     def register_module_reference(self, name: str, location: Location) -> None:
         """Record an instantiation site referencing a module type by name."""
         self.module_references.append((name, location))
+        self._module_reference_files.append(self.current_file)
+
+    def add_driver(self, location: Location) -> int:
+        """Register a construct that drives signals (a procedural block) and return its driver id."""
+        self.drivers.append(location)
+        return len(self.drivers) - 1
+
+    def remove_file(self, path: str) -> None:
+        """Forget every scope, module definition and reference recorded while `path` was current."""
+        removed = [scope for scope in self.scopes if scope.file == path]
+        if not removed:
+            return
+        removed_set = set(removed)
+
+        for scope in removed:
+            if scope.parent is not None and scope.parent not in removed_set:
+                scope.parent.remove_child(scope)
+        self.index.remove_scopes(removed)
+        self.scopes = [scope for scope in self.scopes if scope not in removed_set]
+
+        for name in list(self.modules):
+            remaining = [scope for scope in self.modules[name] if scope not in removed_set]
+            if remaining:
+                self.modules[name] = remaining
+            else:
+                del self.modules[name]
+
+        kept = [
+            (ref, ref_file)
+            for ref, ref_file in zip(self.module_references, self._module_reference_files)
+            if ref_file != path
+        ]
+        self.module_references = [ref for ref, _ref_file in kept]
+        self._module_reference_files = [ref_file for _ref, ref_file in kept]
+        self._file_default_nettype_none.pop(path, None)
+
+    def view(self, scopes: list[Scope]) -> SymbolTable:
+        """A table sharing all of this one's state except that `scopes` lists only the given scopes.
+
+        Symbol rules only look at `scopes`, so running them on a view checks
+        just that part of the design.
+        """
+        view = copy.copy(self)
+        view.scopes = list(scopes)
+        return view
+
+    def release_module(self, scope: Scope) -> None:
+        """Drop the symbols of a module scope that has just been walked and checked.
+
+        The scope itself stays in the registries with its name, file and
+        location, so module rules still see the definition.
+        """
+        self.index.remove_latest(scope)
+        scope.symbols = {}
 
     def lookup_module(self, name: str) -> Scope | None:
         """Return the first scope for a named module, or None if not yet seen."""
@@ -95,22 +160,22 @@ class SymbolTable:
             return None
         current: Scope | None = self.global_scope
         for segment in path[:-1]:
-            current = next((c for c in current.children if c.name == segment), None)
+            current = current.child(segment)
             if current is None:
                 return None
         return current.lookup(path[-1])
 
     def lookup_global(self, name: str) -> Symbol | None:
-        """DFS from global scope through the entire scope tree."""
-
-        def _search(scope: Scope) -> Symbol | None:
-            found = scope.lookup(name)
-            if found:
-                return found
-            for child in scope.children:
-                found = _search(child)
-                if found:
-                    return found
-            return None
-
-        return _search(self.global_scope)
+        """Return the global scope's symbol with this name, else the earliest-defined one in any scope."""
+        found = self.global_scope.lookup(name)
+        if found is not None:
+            return found
+        return self.index.first(name)
+
+    def lookup_all(self, name: str) -> list[tuple[Scope, Symbol]]:
+        """Return every (scope, symbol) pair defining this name, in definition order."""
+        return self.index.entries(name)
+
+    def scopes_declaring(self, name: str) -> list[Scope]:
+        """Return every scope holding an explicit declaration of this name."""
+        return [scope for scope, symbol in self.index.entries(name) if symbol.is_declared]
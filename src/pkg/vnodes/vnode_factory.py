@@ -1,5 +1,5 @@
 # vnode/vnode_factory.py
-from typing import Any, Type, TypeVar
+from typing import Any, Callable, Type, TypeVar
 
 from ..parser.types import RawNode, SyntaxTree, Token
 from .base_vnode import BaseVNode
@@ -12,28 +12,54 @@ _VNodeT = TypeVar('_VNodeT', bound=BaseVNode)
 class VNodeFactory:
     # registry: maps raw parser types --> vnode classes
     _node_map: dict[type[Any], type[BaseVNode]] = {}
+    # cache: concrete raw type --> resolved vnode class (cleared on register)
+    _resolved: dict[type[Any], type[BaseVNode]] = {}
+    # callbacks run whenever the registry changes, so derived tables can drop stale entries
+    _listeners: list[Callable[[], None]] = []
 
     @classmethod
     def register(cls, raw_type: type[Any]) -> Type[Type[_VNodeT]]:
         def decorator(vnode_class: Type[_VNodeT]) -> Type[_VNodeT]:
             cls._node_map[raw_type] = vnode_class
+            cls._invalidate()
             return vnode_class
         return decorator
 
+    @classmethod
+    def add_listener(cls, callback: Callable[[], None]) -> None:
+        cls._listeners.append(callback)
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        cls._resolved.clear()
+        for callback in cls._listeners:
+            callback()
+
+    @classmethod
+    def vnode_class(cls, raw: RawNode) -> type[BaseVNode]:
+        """Resolve the vnode class for ``raw``, cached per concrete raw type."""
+        raw_cls = type(raw)
+        vnode_cls = cls._resolved.get(raw_cls)
+        if vnode_cls is not None:
+            return vnode_cls
+
+        for base in raw_cls.__mro__:
+            if base in cls._node_map:
+                vnode_cls = cls._node_map[base]
+                break
+        else:
+            vnode_cls = TokenVNode if isinstance(raw, Token) else SyntaxVNode
+
+        cls._resolved[raw_cls] = vnode_cls
+        return vnode_cls
+
     @classmethod
     def create(cls, raw: RawNode, tree: SyntaxTree) -> BaseVNode:
         # if a vnode is passed in, return it unchanged
         if isinstance(raw, BaseVNode):
             return raw
 
-        for base in type(raw).__mro__:
-            if base in cls._node_map:
-                return cls._node_map[base](raw, tree)
-
-        if isinstance(raw, Token):
-            return TokenVNode(raw, tree)
-
-        return SyntaxVNode(raw, tree)
+        return cls.vnode_class(raw)(raw, tree)
 
 
 vnode_factory = VNodeFactory()
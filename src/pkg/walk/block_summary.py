@@ -0,0 +1,206 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from ..parser.syntax import (
+    ALWAYS_RUNNING_LOOP_KINDS,
+    ASSIGNMENT_KINDS,
+    BRANCHING_STATEMENT_KINDS,
+    CASE_STATEMENT_KIND,
+    CONDITIONAL_STATEMENT_KIND,
+    FOR_LOOP_STATEMENT_KIND,
+    IDENTIFIER_NAME_KINDS,
+    LOOP_STATEMENT_KINDS,
+    READ_WRITE_ASSIGNMENT_KINDS,
+    STATEMENT_CONTAINER_KINDS,
+    assignment_target_identifier_name,
+    conditional_statement_has_else,
+    for_loop_has_constant_bounds,
+    has_default_case_item,
+    identifier_name,
+    procedural_block_statement,
+)
+from ..parser.types import ProceduralBlockNode, StatementNode, SyntaxNode
+from ..vnodes.base_vnode import BaseVNode
+
+if TYPE_CHECKING:
+    from .context import Context
+
+
+class _BlockScan:
+    """Everything BlockSummary knows about a block body, gathered in one pre-order pass.
+
+    `statement` works bottom-up: each statement returns the names it assigns
+    on every path through it, built from its sub-statements' sets, so every
+    node is visited once however deeply the if/case chains nest.
+    """
+
+    def __init__(self) -> None:
+        self.assignments: list[SyntaxNode] = []
+        # assignment target names in source order, repeats included
+        self.writes: list[str] = []
+        self.unconditional_targets: set[str] = set()
+        self.reads: set[str] = set()
+        # names assigned inside a loop that may or may not run
+        self.unknown: set[str] = set()
+
+    def statement(self, node: SyntaxNode, branching: bool) -> set[str]:
+        """Visit `node` and return the names it definitely assigns."""
+        kind = node.kind
+        subs: list[set[str]] = []
+        direct: set[str] = set()
+        start = len(self.writes)
+        self._parts(node, branching or kind in BRANCHING_STATEMENT_KINDS, subs, direct)
+
+        if kind == CONDITIONAL_STATEMENT_KIND:
+            complete = conditional_statement_has_else(node) and len(subs) == 2
+        elif kind == CASE_STATEMENT_KIND:
+            complete = has_default_case_item(node) and bool(subs)
+        elif kind in LOOP_STATEMENT_KINDS:
+            if kind in ALWAYS_RUNNING_LOOP_KINDS or (
+                kind == FOR_LOOP_STATEMENT_KIND and for_loop_has_constant_bounds(node)
+            ):
+                for sub in subs:
+                    direct |= sub
+            else:
+                # the body may run zero times: its targets are neither definite nor latches
+                self.unknown.update(self.writes[start:])
+            return direct
+        elif kind in BRANCHING_STATEMENT_KINDS:
+            return direct
+        else:
+            for sub in subs:
+                direct |= sub
+            return direct
+
+        # every branch runs on some path: only names all of them assign are definite
+        if complete:
+            direct |= set.intersection(*subs)
+        return direct
+
+    def _parts(self, node: SyntaxNode, branching: bool, subs: list[set[str]], direct: set[str]) -> None:
+        for child in node:
+            if not isinstance(child, SyntaxNode) or isinstance(child, ProceduralBlockNode):
+                continue
+            if isinstance(child, StatementNode):
+                subs.append(self.statement(child, branching))
+            elif child.kind in STATEMENT_CONTAINER_KINDS:
+                self._parts(child, branching, subs, direct)
+            else:
+                start = len(self.writes)
+                self.visit(child, branching, False, False)
+                direct.update(self.writes[start:])
+
+    def visit(self, node: SyntaxNode, branching: bool, lhs: bool, read_lhs: bool) -> None:
+        kind = node.kind
+        if kind in IDENTIFIER_NAME_KINDS:
+            name = identifier_name(node)
+            if name is not None and (not lhs or read_lhs):
+                self.reads.add(name)
+            # select expressions (a[i]) are read even on the left-hand side
+            lhs = read_lhs = False
+        elif kind in ASSIGNMENT_KINDS:
+            self.assignments.append(node)
+            name = assignment_target_identifier_name(node)
+            if name is not None:
+                self.writes.append(name)
+                if not branching:
+                    self.unconditional_targets.add(name)
+            left = getattr(node, "left", None)
+            read_write = kind in READ_WRITE_ASSIGNMENT_KINDS
+            for child in node:
+                if isinstance(child, SyntaxNode):
+                    if child is left:
+                        self.visit(child, branching, True, read_write)
+                    else:
+                        self.visit(child, branching, False, False)
+            return
+
+        for child in node:
+            if isinstance(child, SyntaxNode) and not isinstance(child, ProceduralBlockNode):
+                self.visit(child, branching, lhs, read_lhs)
+
+
+class BlockSummary:
+    """Facts about one procedural block, shared through `Context.block` by everything below it.
+
+    Every field is computed the first time it is read; the body facts all
+    come from one pass over the block, so a lint that consumes none of them
+    never pays for it.
+    """
+
+    def __init__(self, vnode: BaseVNode) -> None:
+        self.vnode = vnode
+        # set by the walk: the block's id in SymbolTable.drivers
+        self.driver_id: int | None = None
+
+    @cached_property
+    def location(self) -> dict:
+        return self.vnode.location
+
+    @cached_property
+    def _scan(self) -> tuple[_BlockScan, frozenset[str]]:
+        scan = _BlockScan()
+        statement = procedural_block_statement(self.vnode.raw)
+        if statement is None:
+            return scan, frozenset()
+        return scan, frozenset(scan.statement(statement, False))
+
+    @property
+    def assignments(self) -> list[SyntaxNode]:
+        """Assignment expressions in source order, nested procedural blocks excluded."""
+        return self._scan[0].assignments
+
+    @cached_property
+    def assignment_kinds(self) -> frozenset[object]:
+        return frozenset(node.kind for node in self.assignments)
+
+    @cached_property
+    def mix_trigger(self) -> SyntaxNode | None:
+        """The first assignment whose kind differs from the block's first assignment."""
+        assignments = self.assignments
+        if not assignments:
+            return None
+        first = assignments[0].kind
+        return next((node for node in assignments if node.kind != first), None)
+
+    @cached_property
+    def targets(self) -> frozenset[str]:
+        """Names assigned anywhere in the block."""
+        return frozenset(self._scan[0].writes)
+
+    @property
+    def unconditional_targets(self) -> set[str]:
+        """Names assigned outside every branch or loop of the block."""
+        return self._scan[0].unconditional_targets
+
+    @property
+    def conditional_targets(self) -> frozenset[str]:
+        """Names only ever assigned inside a branch or loop."""
+        return self.targets - self._scan[0].unconditional_targets
+
+    @property
+    def definitely_assigned(self) -> frozenset[str]:
+        """Names the block assigns on every path through it."""
+        return self._scan[1]
+
+    @property
+    def unknown_targets(self) -> set[str]:
+        """Names assigned inside a loop whose trip count is not known to be nonzero."""
+        return self._scan[0].unknown
+
+    @cached_property
+    def latch_targets(self) -> frozenset[str]:
+        """Names assigned on some paths but not all: they keep their old value on the others."""
+        return self.targets - self.definitely_assigned - self.unknown_targets
+
+    @property
+    def reads(self) -> set[str]:
+        return self._scan[0].reads
+
+
+def block_summary(vnode: BaseVNode, ctx: "Context") -> BlockSummary:
+    """The summary of procedural block `vnode`: the shared one on `ctx` when it is for this block."""
+    block = ctx.block
+    if block is not None and block.vnode is vnode:
+        return block
+    return BlockSummary(vnode)
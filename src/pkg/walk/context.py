@@ -1,7 +1,11 @@
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 from ..vnodes.base_vnode import BaseVNode
 from ..semantic.scope import Scope
 
+if TYPE_CHECKING:
+    from .block_summary import BlockSummary
+
 class ContextFlag(Enum):
 
     # --- Timing / sensitivity ---
@@ -27,11 +31,16 @@ class ContextFlag(Enum):
 class Context:
 
     def __init__(self, flags: set[ContextFlag] | None = None, scope: Scope | None = None,
-                 *, _parent: "Context | None" = None, _vnode: BaseVNode | None = None):
+                 *, block: "BlockSummary | None" = None, port: BaseVNode | None = None,
+                 _parent: "Context | None" = None, _vnode: BaseVNode | None = None):
         self._parent = _parent
         self._vnode = _vnode
         self.flags = flags if flags is not None else set()
         self._scope = scope
+        # summary of the enclosing procedural block, None outside one
+        self.block = block
+        # the port declaration or ANSI port being walked, None outside one
+        self.port = port
 
     @property
     def stack(self) -> list[BaseVNode]:
@@ -45,16 +54,27 @@ class Context:
         return nodes
 
     def push(self, vnode: BaseVNode) -> "Context":
-        return Context(flags=self.flags, scope=self._scope, _parent=self, _vnode=vnode)
+        return Context(flags=self.flags, scope=self._scope, block=self.block, port=self.port,
+                       _parent=self, _vnode=vnode)
 
     def with_flag(self, flag: ContextFlag) -> "Context":
-        return Context(flags=self.flags | {flag}, scope=self._scope, _parent=self._parent, _vnode=self._vnode)
+        return Context(flags=self.flags | {flag}, scope=self._scope, block=self.block, port=self.port,
+                       _parent=self._parent, _vnode=self._vnode)
 
     def has(self, flag: ContextFlag) -> bool:
         return flag in self.flags
 
     def with_scope(self, scope: Scope) -> "Context":
-        return Context(flags=self.flags, scope=scope, _parent=self._parent, _vnode=self._vnode)
+        return Context(flags=self.flags, scope=scope, block=self.block, port=self.port,
+                       _parent=self._parent, _vnode=self._vnode)
+
+    def with_block(self, block: "BlockSummary") -> "Context":
+        return Context(flags=self.flags, scope=self._scope, block=block, port=self.port,
+                       _parent=self._parent, _vnode=self._vnode)
+
+    def with_port(self, port: BaseVNode) -> "Context":
+        return Context(flags=self.flags, scope=self._scope, block=self.block, port=port,
+                       _parent=self._parent, _vnode=self._vnode)
 
     def scope(self) -> Scope:
         if self._scope is None:
@@ -3,7 +3,9 @@ from typing import Any, Callable
 
 from ..handlers.base_handler import BaseHandler
 from ..handlers.default_handler import DefaultHandler
+from ..parser.types import RawNode
 from ..vnodes.base_vnode import BaseVNode
+from ..vnodes.vnode_factory import vnode_factory
 
 
 class Dispatch:
@@ -11,17 +13,50 @@ class Dispatch:
         self._default: BaseHandler[BaseVNode] = DefaultHandler()
         self._registry: dict[type[Any], BaseHandler[BaseVNode]] = {}
         self._resolved: dict[type[Any], BaseHandler[BaseVNode]] = {}
+        # fused table: raw type -> (vnode class, handler), so the walker pays one
+        # dict lookup per node. Dropped whenever either registry changes.
+        self._table: dict[type[Any], tuple[type[BaseVNode], BaseHandler[BaseVNode]]] = {}
+        vnode_factory.add_listener(self._table.clear)
 
     def register(self, raw_cls: type[Any]) -> Callable[[type[BaseHandler[BaseVNode]]], type[BaseHandler[BaseVNode]]]:
         def decorator(handler_cls: type[BaseHandler[BaseVNode]]) -> type[BaseHandler[BaseVNode]]:
             self._registry[raw_cls] = handler_cls()
             self._resolved.clear()
+            self._table.clear()
             return handler_cls
 
         return decorator
 
+    def handlers(self) -> list[BaseHandler[BaseVNode]]:
+        """Every handler the walker can route to, the default included."""
+        return [*self._registry.values(), self._default]
+
+    def restricted_to(self, kinds: frozenset[object]) -> "Dispatch":
+        """A copy keeping only handlers whose declared `consumes` fall within `kinds`.
+
+        Raw types whose handler is dropped fall back to the default handler, so
+        the walk still descends through them.
+        """
+        restricted = Dispatch()
+        restricted._registry = {
+            raw_cls: handler
+            for raw_cls, handler in self._registry.items()
+            if handler.consumes is not None and handler.consumes <= kinds
+        }
+        return restricted
+
     def get(self, vnode: BaseVNode) -> BaseHandler[BaseVNode]:
-        raw_cls = type(vnode.raw)
+        return self._handler_for(type(vnode.raw))
+
+    def resolve(self, raw: RawNode) -> tuple[type[BaseVNode], BaseHandler[BaseVNode]]:
+        """Return the (vnode class, handler) pair for a raw pyslang node."""
+        entry = self._table.get(type(raw))
+        if entry is None:
+            entry = (vnode_factory.vnode_class(raw), self._handler_for(type(raw)))
+            self._table[type(raw)] = entry
+        return entry
+
+    def _handler_for(self, raw_cls: type[Any]) -> BaseHandler[BaseVNode]:
         handler = self._resolved.get(raw_cls)
         if handler is not None:
             return handler
@@ -0,0 +1,46 @@
+# src/pkg/walk/plan.py
+from collections.abc import Iterable
+
+from ..parser.syntax import prunable_subtree_kinds
+
+
+class WalkPlan:
+    """Which raw node kinds the walker may skip, subtree and all.
+
+    Built once per run from the `consumes` declarations of the active handlers
+    and rules. If any of them leaves `consumes` as None (unknown), nothing is
+    skipped and the walk is exactly the full walk.
+    """
+
+    def __init__(self, skip_kinds: frozenset[object] = frozenset()) -> None:
+        self.skip_kinds = skip_kinds
+
+    @classmethod
+    def full(cls) -> "WalkPlan":
+        return cls()
+
+    @classmethod
+    def from_consumers(cls, consumers: Iterable[object]) -> "WalkPlan":
+        consumed = consumed_kinds(consumers)
+        if consumed is None:
+            return cls.full()
+        return cls(prunable_subtree_kinds(consumed))
+
+    @property
+    def is_full(self) -> bool:
+        return not self.skip_kinds
+
+    def __repr__(self) -> str:
+        names = sorted(getattr(kind, "name", str(kind)) for kind in self.skip_kinds)
+        return f"WalkPlan(skip={names})"
+
+
+def consumed_kinds(consumers: Iterable[object]) -> frozenset[object] | None:
+    """Union of every consumer's `consumes` set, or None if any consumer did not declare one."""
+    kinds: set[object] = set()
+    for consumer in consumers:
+        declared = getattr(consumer, "consumes", None)
+        if declared is None:
+            return None
+        kinds.update(declared)
+    return frozenset(kinds)
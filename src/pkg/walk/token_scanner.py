@@ -0,0 +1,62 @@
+from typing import Any, Protocol
+
+from ..parser.syntax import KIND_NAMES
+from ..parser.types import SyntaxTree
+from ..rules.diagnostic import Diagnostic
+from ..vnodes.base_vnode import BaseVNode
+from ..vnodes.token_vnode import TokenVNode
+from .plan import consumed_kinds
+
+
+class _TokenChecker(Protocol):
+    @property
+    def rules(self) -> list[Any]: ...
+
+    def check(self, vnode: BaseVNode, ctx: None) -> list[Diagnostic]: ...
+
+
+class TokenScanner:
+    """Evaluates token rules over a tree's tokens, without a walk.
+
+    pyslang's own visitor goes through the tree in C++; the callback only
+    compares each kind against the consumed token kinds, and a TokenVNode is
+    built just for the tokens a rule can apply to. Rules see no Context.
+    """
+
+    def __init__(self, runner: _TokenChecker) -> None:
+        self.runner = runner
+        self.kinds = consumed_kinds(runner.rules)
+        if self.kinds is None:
+            raise ValueError("token rules must declare the token kinds they consume")
+
+    def scan(self, tree: SyntaxTree, present: set[str] | None = None) -> list[Diagnostic]:
+        """Run the token rules over `tree`; with `present`, also add the name of every kind in the tree to it.
+
+        Collecting the kinds rides on the same visit, so a caller gating its
+        walk rules per file gets them for a set add per node. Only names are
+        kept, so `present` refers to nothing read off the tree.
+        """
+        diagnostics: list[Diagnostic] = []
+        kinds, check = self.kinds, self.runner.check
+
+        # token kinds and syntax kinds never compare equal, so one test covers both
+        if present is not None:
+            add, name = present.add, KIND_NAMES.__getitem__
+
+            def visit(node: object) -> None:
+                kind = node.kind
+                add(name(kind))
+                if kind in kinds:
+                    diagnostics.extend(check(TokenVNode(node, tree), None))
+
+        elif kinds:
+
+            def visit(node: object) -> None:
+                if node.kind in kinds:
+                    diagnostics.extend(check(TokenVNode(node, tree), None))
+
+        else:
+            return diagnostics
+
+        tree.root.visit(visit)
+        return diagnostics
@@ -2,6 +2,10 @@ from typing import Callable
 
 from .dispatch import Dispatch
 from .context import Context
+from .plan import WalkPlan
+
+from ..instrument.observer import RunObserver
+from ..instrument.walk_stats import WalkStats
 
 from ..vnodes.register_vnodes import *
 from ..vnodes.base_vnode import BaseVNode
@@ -11,12 +15,19 @@ from ..parser.types import RawNode, SyntaxTree
 
 
 class Walker:
-    def __init__(self, dispatch: Dispatch) -> None:
+    def __init__(self, dispatch: Dispatch, plan: WalkPlan | None = None) -> None:
         self._dispatch = dispatch
+        self.plan = plan
+        self.observer: RunObserver | None = None
+        self.stats: WalkStats | None = None
         self._results: list[tuple[BaseVNode, Context]] = []
 
     @property
     def results(self) -> list[tuple[BaseVNode, Context]]:
+        """(vnode, ctx) of every node of the walks run without on_node.
+
+        These keep the walked trees alive until the caller clears the list.
+        """
         return self._results
 
     def walk(
@@ -27,9 +38,18 @@ class Walker:
         symbol_table: SymbolTable,
         on_node: Callable[[BaseVNode, Context], None] | None = None,
     ) -> None:
+        resolve = self._dispatch.resolve
+        skip_kinds = self.plan.skip_kinds if self.plan is not None and not self.plan.is_full else None
+
         def _walk(node: RawNode | BaseVNode, ctx: Context) -> None:
-            vnode = node if isinstance(node, BaseVNode) else vnode_factory.create(node, tree)
-            handler = self._dispatch.get(vnode)
+            if isinstance(node, BaseVNode):
+                vnode = node
+                handler = self._dispatch.get(vnode)
+            else:
+                if skip_kinds is not None and node.kind in skip_kinds:
+                    return
+                vnode_cls, handler = resolve(node)
+                vnode = vnode_cls(node, tree)
             ctx = handler.update_context(ctx, vnode, symbol_table)
             if on_node is not None:
                 on_node(vnode, ctx)
@@ -39,4 +59,43 @@ class Walker:
                 _walk(child, ctx)
             handler.on_exit(ctx, vnode, symbol_table)
 
-        _walk(raw_node, ctx)
+        # same walk, also counting kinds, handler hits, depth and pruned subtrees;
+        # chosen once per walk so the plain walk above carries no stats checks
+        file_stats = self.stats.begin_file(symbol_table.current_file) if self.stats is not None else None
+
+        def _walk_counted(node: RawNode | BaseVNode, ctx: Context, depth: int) -> None:
+            if isinstance(node, BaseVNode):
+                vnode = node
+                handler = self._dispatch.get(vnode)
+            else:
+                if skip_kinds is not None and node.kind in skip_kinds:
+                    file_stats.pruned += 1
+                    return
+                vnode_cls, handler = resolve(node)
+                vnode = vnode_cls(node, tree)
+            file_stats.record(vnode.raw, handler, depth)
+            ctx = handler.update_context(ctx, vnode, symbol_table)
+            if on_node is not None:
+                on_node(vnode, ctx)
+            else:
+                self._results.append((vnode, ctx))
+            for child in handler.children(vnode):
+                _walk_counted(child, ctx, depth + 1)
+            handler.on_exit(ctx, vnode, symbol_table)
+
+        observer = self.observer
+        if observer is not None:
+            observer.walk_start(symbol_table.current_file)
+        root = raw_node if isinstance(raw_node, BaseVNode) else vnode_factory.create(raw_node, tree)
+        try:
+            if file_stats is None:
+                _walk(root, ctx)
+            else:
+                _walk_counted(root, ctx, 0)
+        finally:
+            # the recursive closures reference themselves through their cells, a
+            # cycle that would keep `tree` alive until the next gc run; emptying
+            # the cells frees it as soon as the caller lets go
+            del _walk, _walk_counted
+        if observer is not None:
+            observer.walk_done(symbol_table.current_file)
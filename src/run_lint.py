@@ -1,12 +1,27 @@
 import argparse
+import heapq
+import re
 import sys
+from collections.abc import Collection
+from contextlib import nullcontext
 from pathlib import Path
 
 from pkg.walk.walker import Walker
 from pkg.walk.context import Context
 from pkg.semantic.symbol_table import SymbolTable
 from pkg.walk.dispatch import dispatch
+from pkg.walk.plan import WalkPlan
+from pkg.walk.token_scanner import TokenScanner
+from pkg.parser.syntax import MODULE_SOURCE_KINDS
+from pkg.instrument.profile import RunProfile
+from pkg.instrument.rule_stats import RuleStats
+from pkg.instrument.memory import MemoryProfile
+from pkg.instrument.observer import ChromeTraceObserver, RunObserver
+from pkg.instrument.walk_stats import WalkStats
+from pkg.instrument.calls import CALL_PHASES, CallProfile
+from pkg.instrument.metrics import openmetrics, write_textfile
 from pkg.parser.parse import file_uses_default_nettype_none, parse_file
+from pkg.rules.diagnostic import Diagnostic
 from pkg.vnodes.register_vnodes import *
 from pkg.handlers.register_handlers import *
 from pkg.rules.register_rules import *
@@ -24,7 +39,37 @@ def collect_paths(raw: list[str]) -> list[Path]:
     return paths
 
 
-def run(paths: list[Path], jobs: int = 1) -> list[dict]:
+def all_rule_codes() -> list[str]:
+    return [rule.code for rule in [*rule_runner.rules, *symbol_rule_runner.rules, *module_rule_runner.rules]]
+
+
+def _metrics_label(value: str) -> tuple[str, str]:
+    key, sep, label = value.partition("=")
+    if not sep or not re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", key):
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE with a valid label name, got {value!r}")
+    return key, label
+
+
+def _source_order(diagnostic: Diagnostic) -> tuple[int, int]:
+    return diagnostic["line"], diagnostic["col"]
+
+
+def _untimed(_name: str, _file: object = None) -> nullcontext:
+    return nullcontext()
+
+
+def run(
+    paths: list[Path],
+    jobs: int = 1,
+    rules: Collection[str] | None = None,
+    profile: RunProfile | None = None,
+    rule_stats: RuleStats | None = None,
+    memory: MemoryProfile | None = None,
+    observer: RunObserver | None = None,
+    walk_stats: WalkStats | None = None,
+    calls: CallProfile | None = None,
+    stream_symbols: bool = False,
+) -> list[Diagnostic]:
     if jobs < 1:
         raise ValueError(f"jobs must be >= 1, got {jobs}")
     if jobs > 1:
@@ -33,25 +78,123 @@ def run(paths: list[Path], jobs: int = 1) -> list[dict]:
             "see Docs/07_02_26/PARALLEL_LINTING_PLAN.md for the design and rollout plan"
         )
 
+    syntax_rules, symbol_rules, module_rules = rule_runner, symbol_rule_runner, module_rule_runner
+    active_dispatch = dispatch
+    if rules is not None:
+        unknown = sorted(set(rules) - set(all_rule_codes()))
+        if unknown:
+            raise ValueError(f"unknown rule code(s): {', '.join(unknown)}")
+        syntax_rules = rule_runner.select(rules)
+        symbol_rules = symbol_rule_runner.select(rules)
+        module_rules = module_rule_runner.select(rules)
+    # token rules run on each tree's token stream; only the others need the walk
+    token_rules = syntax_rules.token_rules()
+    syntax_rules = syntax_rules.walk_rules()
+    walks = bool(syntax_rules.rules or symbol_rules.rules or module_rules.rules)
+    if not syntax_rules.rules and not symbol_rules.rules:
+        # module rules only need the module registry: walk module headers and
+        # instantiations, nothing else
+        active_dispatch = dispatch.restricted_to(MODULE_SOURCE_KINDS)
+    if rule_stats is not None:
+        syntax_rules = syntax_rules.instrumented(rule_stats)
+        token_rules = token_rules.instrumented(rule_stats)
+        symbol_rules = symbol_rules.instrumented(rule_stats)
+        module_rules = module_rules.instrumented(rule_stats)
+    if observer is not None:
+        syntax_rules = syntax_rules.observed(observer)
+        token_rules = token_rules.observed(observer)
+        symbol_rules = symbol_rules.observed(observer)
+        module_rules = module_rules.observed(observer)
+
     symbol_table = SymbolTable()
     ctx = Context(scope=symbol_table.global_scope)
-    walker = Walker(dispatch)
+    plan = WalkPlan.from_consumers(
+        [*active_dispatch.handlers(), *syntax_rules.rules, *symbol_rules.rules, *module_rules.rules]
+    )
+    walker = Walker(active_dispatch)
+    walker.plan = plan
+    walker.observer = observer
+    walker.stats = walk_stats
+    scanner = TokenScanner(token_rules)
+    # the token scan also collects the kinds in each tree, and the walk rules
+    # none of whose kinds occur in a file are dropped for it
+    gate = bool(syntax_rules.rules)
+    file_rules = syntax_rules
 
-    ast_diagnostics: list[dict] = []
+    ast_diagnostics: list[Diagnostic] = []
 
     def on_node(vnode, node_ctx) -> None:
-        ast_diagnostics.extend(rule_runner.check(vnode, node_ctx))
-
-    for path in paths:
-        if not path.exists():
-            raise FileNotFoundError(f"file not found: {path}")
-        symbol_table.set_current_file(str(path))
-        symbol_table.set_current_file_default_nettype_none(file_uses_default_nettype_none(str(path)))
-        tree = parse_file(str(path))
-        walker.walk(tree.root, tree, ctx, symbol_table, on_node=on_node)
-
-    symbol_diagnostics = symbol_rule_runner.run(symbol_table)
-    module_diagnostics = module_rule_runner.run(symbol_table)
+        ast_diagnostics.extend(file_rules.check(vnode, node_ctx))
+
+    phase = profile.phase if profile is not None else _untimed
+    profiled = calls.phase if calls is not None else _untimed
+
+    streamed_diagnostics: list[Diagnostic] = []
+    if stream_symbols:
+        # symbol rules only look within a scope: check each module as soon as it
+        # has been walked, then drop its symbols so only the module registry and
+        # references are kept for the whole batch
+        def on_module_exit(scope) -> None:
+            with phase("symbol_rules"), profiled("symbol_rules"):
+                streamed_diagnostics.extend(symbol_rules.run(symbol_table.view([scope])))
+            symbol_table.release_module(scope)
+
+        symbol_table.on_module_exit = on_module_exit
+
+    if memory is not None:
+        memory.start()
+    if calls is not None:
+        calls.start()
+    try:
+        for path in paths:
+            if not path.exists():
+                raise FileNotFoundError(f"file not found: {path}")
+            symbol_table.set_current_file(str(path))
+            symbol_table.set_current_file_default_nettype_none(file_uses_default_nettype_none(str(path)))
+            file_profile = profile.add_file(path) if profile is not None else None
+            sampled = memory is not None and memory.begin_file()
+            if observer is not None:
+                observer.file_start(str(path))
+            with phase("parse", file_profile), profiled("parse"):
+                tree = parse_file(str(path))
+            if observer is not None:
+                observer.file_parsed(str(path))
+            if sampled:
+                memory.snapshot("parse", path)
+            present = set() if gate else None
+            with phase("rules", file_profile), profiled("walk"):
+                token_diagnostics = scanner.scan(tree, present)
+            if present is not None:
+                file_rules = syntax_rules.for_kinds(present)
+            start = len(ast_diagnostics)
+            if walks:
+                file_on_node = on_node if file_profile is None else profile.timed_on_node(on_node, file_profile)
+                with phase("walk", file_profile), profiled("walk"):
+                    walker.walk(tree.root, tree, ctx, symbol_table, on_node=file_on_node)
+            # both lists are in source order: interleave them as one walk over
+            # nodes and tokens would have reported them
+            ast_diagnostics[start:] = heapq.merge(ast_diagnostics[start:], token_diagnostics, key=_source_order)
+            # nothing the walk leaves behind (symbols, diagnostics, module registry)
+            # refers to the tree or its VNodes: free it now rather than when the
+            # next file's tree replaces it
+            del tree
+            if sampled:
+                memory.snapshot("walk", path)
+            if observer is not None:
+                observer.file_done(str(path))
+
+        with phase("symbol_rules"), profiled("symbol_rules"):
+            # with stream_symbols only symbols outside any module are left here
+            symbol_diagnostics = streamed_diagnostics + symbol_rules.run(symbol_table)
+        with phase("module_rules"), profiled("module_rules"):
+            module_diagnostics = module_rules.run(symbol_table)
+        if memory is not None:
+            memory.snapshot("rules")
+    finally:
+        if calls is not None:
+            calls.stop()
+        if memory is not None:
+            memory.stop()
     return ast_diagnostics + symbol_diagnostics + module_diagnostics
 
 
@@ -71,6 +214,110 @@ def main(argv: list[str] | None = None) -> int:
         help="number of worker processes to lint with (default: 1, sequential; "
         "parallel execution with N > 1 is not implemented yet)",
     )
+    parser.add_argument(
+        "--rules",
+        type=lambda value: [code.strip() for code in value.split(",") if code.strip()],
+        default=None,
+        metavar="CODE[,CODE...]",
+        help="only run these rule codes; selecting only module rules "
+        "(DUPLICATE_MODULE, UNDEFINED_MODULE) walks module headers and instantiations only",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report wall/CPU time per phase and the slowest files on stderr",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="number of slowest files listed by --profile (default: 10)",
+    )
+    parser.add_argument(
+        "--rule-stats",
+        action="store_true",
+        help="report per-rule calls, hits, cumulative time and the number of files each syntax rule "
+        "was skipped for (none of its node kinds occur in them) on stderr",
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="take tracemalloc snapshots after parse and walk of each file and after the rules; "
+        "report traced memory, RSS, live project objects and top allocation sites on stderr",
+    )
+    parser.add_argument(
+        "--memory-profile-every",
+        type=int,
+        default=1,
+        metavar="N",
+        help="with --memory-profile, only snapshot every Nth file (default: 1, every file)",
+    )
+    parser.add_argument(
+        "--walk-stats",
+        action="store_true",
+        help="report node counts by kind, tree depth, token/node split and handler hits "
+        "per file and in total on stderr",
+    )
+    parser.add_argument(
+        "--instrument-format",
+        default="text",
+        choices=["text", "json"],
+        help="format of the --profile, --rule-stats, --memory-profile and --walk-stats "
+        "reports: a table (default) or JSON",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="profile the run with cProfile and write the pstats to FILE (paths relative to pkg)",
+    )
+    parser.add_argument(
+        "--flamegraph",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="write the run's call stacks as collapsed stacks (microseconds of self time) "
+        "to FILE, for flamegraph.pl, speedscope or inferno",
+    )
+    parser.add_argument(
+        "--profile-phase",
+        default=None,
+        choices=list(CALL_PHASES),
+        help="limit --cprofile and --flamegraph to one phase (default: the whole run; "
+        "walk includes the syntax rules)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="write OpenMetrics text (files, lines, nodes, phase and rule durations, peak RSS, "
+        "diagnostics per code) to FILE, e.g. for the node-exporter textfile collector",
+    )
+    parser.add_argument(
+        "--metrics-label",
+        type=_metrics_label,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="label added to every --metrics-file sample, e.g. repo=name (repeatable)",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="write a Chrome/Perfetto trace-event JSON timeline of the run to FILE",
+    )
+    parser.add_argument(
+        "--stream-symbols",
+        action="store_true",
+        help="run the symbol rules on each module as soon as it has been walked and then "
+        "release its symbols, so memory is bounded by the largest module rather than the "
+        "whole batch (diagnostics are the same, in a different order)",
+    )
     args = parser.parse_args(argv)
 
     paths = collect_paths(args.paths)
@@ -79,11 +326,69 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     try:
-        diagnostics = run(paths, jobs=args.jobs)
+        options = {"rules": args.rules} if args.rules is not None else {}
+        if args.stream_symbols:
+            options["stream_symbols"] = True
+        # --metrics-file reports phase and rule timings, so it collects them too
+        metrics = args.metrics_file is not None
+        profile = RunProfile() if args.profile or metrics else None
+        if profile is not None:
+            options["profile"] = profile
+        rule_stats = RuleStats() if args.rule_stats or metrics else None
+        if rule_stats is not None:
+            options["rule_stats"] = rule_stats
+        memory = MemoryProfile(every=args.memory_profile_every) if args.memory_profile else None
+        if memory is not None:
+            options["memory"] = memory
+        trace = ChromeTraceObserver() if args.trace is not None else None
+        if trace is not None:
+            options["observer"] = trace
+        walk_stats = WalkStats() if args.walk_stats else None
+        if walk_stats is not None:
+            options["walk_stats"] = walk_stats
+        calls = None
+        if args.cprofile is not None or args.flamegraph is not None:
+            calls = CallProfile(
+                phase=args.profile_phase,
+                pstats=args.cprofile is not None,
+                stacks=args.flamegraph is not None,
+            )
+            options["calls"] = calls
+        diagnostics = run(paths, jobs=args.jobs, **options)
     except (ValueError, NotImplementedError, FileNotFoundError) as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    as_json = args.instrument_format == "json"
+    if args.profile:
+        if as_json:
+            print(profile.to_json(top=args.profile_top), file=sys.stderr)
+        else:
+            print(profile.format_table(top=args.profile_top), file=sys.stderr)
+    if args.rule_stats:
+        if as_json:
+            print(rule_stats.to_json(), file=sys.stderr)
+        else:
+            print(rule_stats.format_table(), file=sys.stderr)
+    if walk_stats is not None:
+        if as_json:
+            print(walk_stats.to_json(), file=sys.stderr)
+        else:
+            print(walk_stats.format_table(), file=sys.stderr)
+    if trace is not None:
+        trace.write(args.trace)
+    if metrics:
+        write_textfile(args.metrics_file, openmetrics(diagnostics, profile, rule_stats, dict(args.metrics_label)))
+    if args.cprofile is not None:
+        calls.write_pstats(args.cprofile)
+    if args.flamegraph is not None:
+        calls.write_folded(args.flamegraph)
+    if memory is not None:
+        if as_json:
+            print(memory.to_json(), file=sys.stderr)
+        else:
+            print(memory.format_table(), file=sys.stderr)
+
     if not diagnostics:
         print("No issues found.")
     else:
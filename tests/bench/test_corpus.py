@@ -0,0 +1,70 @@
+"""Test suite for the synthetic benchmark corpus generator."""
+
+from pathlib import Path
+
+import pytest
+
+from src.pkg.bench.corpus import CorpusSpec, generate, generate_module, write_corpus
+from src.pkg.parser.parse import parse_text
+from src.run_lint import run
+
+
+class TestCorpusSpec:
+    def test_children_form_a_tree(self) -> None:
+        spec = CorpusSpec(modules=7, fanout=2)
+
+        assert spec.children(0) == [1, 2]
+        assert spec.children(2) == [5, 6]
+        assert spec.children(3) == []
+
+    def test_zero_fanout_has_no_children(self) -> None:
+        assert CorpusSpec(modules=4, fanout=0).children(0) == []
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"modules": 0}, {"blocks": 0}, {"signals": 2, "blocks": 3}, {"depth": -1}, {"fanout": -1}],
+    )
+    def test_invalid_spec_raises_value_error(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            CorpusSpec(**kwargs)
+
+
+class TestGenerate:
+    def test_output_is_deterministic(self) -> None:
+        spec = CorpusSpec(modules=9, signals=6, blocks=3, depth=3, fanout=3, files=4)
+
+        assert generate(spec) == generate(CorpusSpec(**spec.as_dict()))
+
+    def test_modules_are_spread_over_files(self) -> None:
+        sources = generate(CorpusSpec(modules=10, files=3))
+
+        assert sorted(sources) == ["bench_0000.sv", "bench_0001.sv", "bench_0002.sv"]
+        assert sum(text.count("endmodule") for text in sources.values()) == 10
+
+    def test_module_shape_follows_spec(self) -> None:
+        spec = CorpusSpec(modules=3, signals=5, blocks=2, depth=3, fanout=2)
+
+        text = generate_module(spec, 0)
+
+        assert text.count("always_ff") == 1
+        assert text.count("always_comb") == 1
+        assert text.count("logic [7:0] s") == 5
+        assert "m1 u_m1(" in text and "m2 u_m2(" in text
+        assert "if (din[2])" in text and "if (din[3])" not in text
+
+    def test_generated_modules_parse_cleanly(self) -> None:
+        spec = CorpusSpec(modules=4, signals=4, blocks=4, depth=2, fanout=3)
+
+        for index in range(spec.modules):
+            tree = parse_text(generate_module(spec, index))
+            assert not list(tree.diagnostics)
+
+
+class TestWriteCorpus:
+    def test_corpus_has_no_structural_diagnostics(self, tmp_path: Path) -> None:
+        paths = write_corpus(CorpusSpec(modules=7, signals=4, blocks=2, depth=1, fanout=2, files=3), tmp_path)
+
+        diagnostics = run(paths)
+
+        codes = {d["code"] for d in diagnostics}
+        assert not codes & {"DUPLICATE_MODULE", "UNDEFINED_MODULE", "NO_MULTIPLE_DRIVERS", "NO_LATCH_IN_ALWAYS_COMB"}
@@ -0,0 +1,56 @@
+"""Test suite for the phase-by-phase lint benchmark."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.pkg.bench.corpus import CorpusSpec, write_corpus
+from src.pkg.bench.harness import PHASES, benchmark, main
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+class TestBenchmark:
+    def test_report_covers_every_phase(self, tmp_path: Path) -> None:
+        spec = CorpusSpec(modules=3, signals=4, blocks=2, depth=1, fanout=1)
+        paths = write_corpus(spec, tmp_path)
+
+        report = benchmark(paths, spec=spec)
+
+        assert list(report["phases"]) == list(PHASES)
+        assert report["spec"] == spec.as_dict()
+        assert report["files"] == 3
+        assert report["lines"] > 0
+        assert report["nodes"] > 0
+        assert report["total_seconds"] == pytest.approx(
+            sum(phase["seconds"] for phase in report["phases"].values())
+        )
+
+    def test_diagnostic_count_matches_data(self) -> None:
+        report = benchmark([DATA / "dup_module_a.v", DATA / "dup_module_b.v"])
+
+        assert report["spec"] is None
+        assert report["diagnostics"] >= 1
+
+    def test_repeat_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="repeat must be >= 1"):
+            benchmark([DATA / "simple.v"], repeat=0)
+
+
+class TestMain:
+    def test_main_writes_json_report(self, tmp_path: Path) -> None:
+        output = tmp_path / "report.json"
+
+        result = main(["--modules", "2", "--signals", "2", "--blocks", "1", "--output", str(output)])
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert result == 0
+        assert report["spec"]["modules"] == 2
+        assert set(report["phases"]) == set(PHASES)
+
+    def test_main_rejects_empty_corpus(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main(["--corpus", str(tmp_path)])
+
+        assert result == 1
+        assert "no .v or .sv files" in capsys.readouterr().err
@@ -0,0 +1,63 @@
+"""Opt-in memory suite: linting many files must not keep per-file state alive.
+
+Lints thousands of generated files with ``stream_symbols`` and samples RSS
+after every file. Past a warm-up quarter, RSS may only grow by what the run
+deliberately keeps per module (its module-registry entry); a leaked syntax
+tree or source buffer costs more than the whole file and trips the budget.
+RSS is machine-sensitive, so the suite only runs with SCALING_TESTS=1:
+
+    SCALING_TESTS=1 python -m pytest tests/bench/test_memory_growth.py
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.pkg.instrument.memory import current_rss_bytes
+from src.pkg.instrument.observer import RunObserver
+from src.run_lint import run
+
+pytestmark = pytest.mark.skipif(not os.environ.get("SCALING_TESTS"), reason="set SCALING_TESTS=1 to run")
+
+FILES = 3000
+# a license header makes each file ~9 KB of source around a tiny module, so a
+# leaked buffer is easy to tell from the retained registry entry
+HEADER_LINES = 120
+RETAINED_BYTES_PER_MODULE = 4 * 1024
+
+
+class _RssSampler(RunObserver):
+    def __init__(self) -> None:
+        self.rss: list[int] = []
+
+    def file_done(self, path: str) -> None:
+        self.rss.append(current_rss_bytes())
+
+
+def _write_files(out_dir: Path) -> list[Path]:
+    header = "".join(
+        f'// {i:03d} Licensed under the Apache License, Version 2.0 (the "License");\n' for i in range(HEADER_LINES)
+    )
+    paths = []
+    for index in range(FILES):
+        path = out_dir / f"m{index}.sv"
+        path.write_text(
+            f"{header}module m{index}(output logic [7:0] q);\n  assign q = 8'd{index % 256};\nendmodule\n",
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.skipif(current_rss_bytes() is None, reason="needs /proc/self/statm")
+class TestMemoryGrowth:
+    def test_rss_is_flat_apart_from_the_module_registry(self, tmp_path: Path) -> None:
+        paths = _write_files(tmp_path)
+        sampler = _RssSampler()
+
+        assert run(paths, observer=sampler, stream_symbols=True) == []
+
+        warm = len(sampler.rss) // 4
+        per_file = (sampler.rss[-1] - sampler.rss[warm]) / (len(sampler.rss) - warm)
+        assert per_file < RETAINED_BYTES_PER_MODULE < paths[0].stat().st_size
@@ -0,0 +1,94 @@
+"""Opt-in scaling suite: lint time must grow near-linearly with input size.
+
+Each dimension lints generated inputs at 1x, 4x and 16x its base size and
+fails when quadrupling the input costs more than ``4 * LINEAR_SLACK`` times
+the time; a quadratic path costs ~16x and trips it. Timings are slow and
+machine-sensitive, so the suite only runs with SCALING_TESTS=1:
+
+    SCALING_TESTS=1 python -m pytest tests/bench/test_scaling.py
+"""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.pkg.bench.corpus import CorpusSpec, write_corpus
+from src.pkg.bench.harness import measure
+
+pytestmark = pytest.mark.skipif(not os.environ.get("SCALING_TESTS"), reason="set SCALING_TESTS=1 to run")
+
+FACTORS = (1, 4, 16)
+LINEAR_SLACK = 2.0
+REPEAT = 3
+
+
+def _corpus(make_spec: Callable[[int], CorpusSpec]) -> Callable[[int, Path], list[Path]]:
+    return lambda factor, out_dir: write_corpus(make_spec(factor), out_dir)
+
+
+def _signal_uses(factor: int, out_dir: Path) -> list[Path]:
+    """One signal read by 32 * factor continuous assignments."""
+    uses = 32 * factor
+    lines = ["module uses(input logic [7:0] din, output logic [7:0] dout);", "  logic [7:0] x;", "  assign x = din;"]
+    lines.extend(f"  logic [7:0] y{i};" for i in range(uses))
+    lines.extend(f"  assign y{i} = x;" for i in range(uses))
+    lines.extend(["  assign dout = y0;", "endmodule", ""])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / "uses.sv"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return [path]
+
+
+def _decoder_items(factor: int, out_dir: Path) -> list[Path]:
+    """One always_comb decoder whose case has 64 * factor items."""
+    items = 64 * factor
+    lines = ["module decoder(input logic [15:0] sel, output logic [15:0] y, output logic hit);", "  always_comb begin"]
+    lines.append("    case (sel)")
+    lines.extend(f"      16'd{i}: begin y = 16'd{i}; if (sel[0]) hit = 1'b1; else hit = 1'b0; end" for i in range(items))
+    lines.extend(["      default: begin y = '0; hit = 1'b0; end", "    endcase", "  end", "endmodule", ""])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / "decoder.sv"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return [path]
+
+
+DIMENSIONS = {
+    "file_length": _corpus(lambda k: CorpusSpec(modules=4 * k, signals=8, blocks=2, depth=1, fanout=0, files=1)),
+    "nesting_depth": _corpus(lambda k: CorpusSpec(modules=1, signals=4, blocks=2, depth=4 * k, fanout=0)),
+    "assignments_per_block": _corpus(lambda k: CorpusSpec(modules=1, signals=8 * k, blocks=1, depth=0, fanout=0)),
+    "modules_per_batch": _corpus(lambda k: CorpusSpec(modules=8 * k, signals=4, blocks=2, depth=1, fanout=2)),
+    "uses_per_signal": _signal_uses,
+    "decoder_case_items": _decoder_items,
+}
+
+# known quadratic paths; strict, so fixing one fails here until its marker is removed
+KNOWN_SUPERLINEAR: dict[str, str] = {}
+
+
+def _seconds(paths: list[Path]) -> float:
+    measure(paths)
+    return min(sum(measure(paths)["seconds"].values()) for _ in range(REPEAT))
+
+
+class TestScaling:
+    @pytest.mark.parametrize(
+        "dimension",
+        [
+            pytest.param(name, marks=pytest.mark.xfail(reason=KNOWN_SUPERLINEAR[name], strict=True))
+            if name in KNOWN_SUPERLINEAR
+            else name
+            for name in DIMENSIONS
+        ],
+    )
+    def test_lint_time_scales_linearly(self, dimension: str, tmp_path: Path) -> None:
+        generate = DIMENSIONS[dimension]
+        times = [_seconds(generate(factor, tmp_path / f"x{factor}")) for factor in FACTORS]
+
+        for (small, t_small), (large, t_large) in zip(zip(FACTORS, times), zip(FACTORS[1:], times[1:])):
+            bound = large / small * LINEAR_SLACK
+            assert t_large / t_small <= bound, (
+                f"{dimension}: {small}x -> {large}x took {t_small:.4f}s -> {t_large:.4f}s "
+                f"({t_large / t_small:.1f}x, bound {bound:.1f}x)"
+            )
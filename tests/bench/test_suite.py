@@ -0,0 +1,113 @@
+"""Test suite for the benchmark suite and its regression gate."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.pkg.bench.suite import BASELINE_VERSION, compare, main, run_suite, summarize
+
+
+def _results(**medians: float) -> dict:
+    return {
+        "version": BASELINE_VERSION,
+        "benchmarks": {
+            "flat": {"phases": {phase: {"median": m, "iqr": 0.001, "samples": [m]} for phase, m in medians.items()}}
+        },
+    }
+
+
+class TestSummarize:
+    def test_median_and_iqr(self) -> None:
+        summary = summarize([1.0, 2.0, 3.0, 4.0, 100.0])
+
+        assert summary["median"] == 3.0
+        assert summary["iqr"] == pytest.approx(2.0)
+
+    def test_single_sample_has_zero_iqr(self) -> None:
+        assert summarize([0.5])["iqr"] == 0.0
+
+
+class TestCompare:
+    def test_slowdown_beyond_threshold_regresses(self) -> None:
+        regressions, lines = compare(_results(walk=1.0), _results(walk=1.2), threshold=0.10)
+
+        assert [(r.benchmark, r.phase) for r in regressions] == [("flat", "walk")]
+        assert regressions[0].change == pytest.approx(0.2)
+        assert "REGRESSED" in lines[1]
+
+    def test_slowdown_within_threshold_passes(self) -> None:
+        regressions, _lines = compare(_results(walk=1.0), _results(walk=1.05), threshold=0.10)
+
+        assert regressions == []
+
+    def test_tiny_phases_are_ignored(self) -> None:
+        regressions, _lines = compare(_results(module_rules=0.0001), _results(module_rules=0.0003), min_seconds=0.005)
+
+        assert regressions == []
+
+    def test_millisecond_phases_are_gated_by_default(self) -> None:
+        baseline = _results(symbol_rules=0.001)
+        current = _results(symbol_rules=0.003)
+        for results in (baseline, current):
+            results["benchmarks"]["flat"]["phases"]["symbol_rules"]["iqr"] = 0.0001
+
+        regressions, _lines = compare(baseline, current)
+
+        assert [r.phase for r in regressions] == ["symbol_rules"]
+
+    def test_slowdown_within_noise_passes(self) -> None:
+        baseline = _results(walk=1.0)
+        baseline["benchmarks"]["flat"]["phases"]["walk"]["iqr"] = 0.5
+
+        regressions, _lines = compare(baseline, _results(walk=1.3), threshold=0.10)
+
+        assert regressions == []
+
+    def test_unknown_baseline_version_raises(self) -> None:
+        with pytest.raises(ValueError, match="unsupported baseline version"):
+            compare({"version": 0, "benchmarks": {}}, _results(walk=1.0))
+
+
+class TestRunSuite:
+    def test_results_cover_every_phase(self) -> None:
+        results = run_suite(["deep"], warmup=0, repeat=2)
+
+        phases = results["benchmarks"]["deep"]["phases"]
+        assert set(phases) == {"parse", "walk", "rules", "symbol_rules", "module_rules", "total"}
+        assert all(len(stats["samples"]) == 2 for stats in phases.values())
+
+    def test_unknown_benchmark_raises(self) -> None:
+        with pytest.raises(ValueError, match="unknown benchmark"):
+            run_suite(["nope"], repeat=1)
+
+
+class TestMain:
+    def test_store_then_compare(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        baseline = tmp_path / "baseline.json"
+        args = ["--only", "deep", "--warmup", "0", "--repeat", "1"]
+
+        assert main([*args, "--output", str(baseline)]) == 0
+        assert main([*args, "--compare", str(baseline), "--threshold", "100"]) == 0
+        assert "deep" in capsys.readouterr().out
+
+    def test_compare_fails_on_regression(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        baseline = tmp_path / "baseline.json"
+        args = ["--only", "deep", "--warmup", "0", "--repeat", "1"]
+        main([*args, "--output", str(baseline)])
+        stored = json.loads(baseline.read_text(encoding="utf-8"))
+        for stats in stored["benchmarks"]["deep"]["phases"].values():
+            stats["median"] /= 100
+        baseline.write_text(json.dumps(stored), encoding="utf-8")
+
+        result = main([*args, "--compare", str(baseline), "--min-seconds", "0"])
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert "deep/total" in captured.err
+
+    def test_missing_baseline_is_an_error(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main(["--only", "deep", "--compare", str(tmp_path / "missing.json")])
+
+        assert result == 1
+        assert "Error:" in capsys.readouterr().err
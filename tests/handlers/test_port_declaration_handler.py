@@ -0,0 +1,64 @@
+import pyslang as sl
+import pytest
+
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.walk.walker import Walker
+from src.pkg.handlers.register_handlers import *
+
+ANSI = """
+module m(input logic clk, output logic [7:0] q);
+  logic [7:0] r;
+  always_ff @(posedge clk) q <= r;
+endmodule
+"""
+
+NON_ANSI = """
+module m(clk, q);
+  input clk;
+  output reg q;
+  wire w;
+endmodule
+"""
+
+
+def _walk(code: str) -> tuple[Walker, SymbolTable]:
+    symbol_table = SymbolTable()
+    walker = Walker(dispatch)
+    tree = sl.SyntaxTree.fromText(code)
+    walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+    return walker, symbol_table
+
+
+def _ports(symbol_table: SymbolTable) -> dict[str, bool]:
+    return {sym.name: sym.is_port for sym in symbol_table.lookup_module("m").symbols.values() if sym.is_declared}
+
+
+class TestPortDeclarationHandler:
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            (ANSI, {"clk": True, "q": True, "r": False}),
+            (NON_ANSI, {"clk": True, "q": True, "w": False}),
+        ],
+    )
+    def test_declarators_under_a_port_are_ports(self, code: str, expected: dict[str, bool]) -> None:
+        _walker, symbol_table = _walk(code)
+
+        assert _ports(symbol_table) == expected
+
+    def test_port_is_set_only_below_the_port(self) -> None:
+        walker, _symbol_table = _walk(ANSI)
+
+        ports = [vnode for vnode, _ctx in walker.results if vnode.raw.kind == sl.SyntaxKind.ImplicitAnsiPort]
+        declarator_ports = [ctx.port for vnode, ctx in walker.results if vnode.raw.kind == sl.SyntaxKind.Declarator]
+        outside = [
+            ctx.port
+            for vnode, ctx in walker.results
+            if vnode.raw.kind in (sl.SyntaxKind.DataDeclaration, sl.SyntaxKind.AlwaysFFBlock)
+        ]
+
+        assert len(ports) == 2
+        assert declarator_ports == [*ports, None]
+        assert outside == [None, None]
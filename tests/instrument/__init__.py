@@ -0,0 +1 @@
+"""Instrumentation tests package (profiling, rule stats, run observers)."""
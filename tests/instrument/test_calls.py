@@ -0,0 +1,90 @@
+"""Test suite for the cProfile / collapsed-stack call profile."""
+
+import pstats
+from pathlib import Path
+
+import pytest
+
+from src.pkg.instrument.calls import CallProfile, StackRecorder, relative_path
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def _inner() -> int:
+    return sum(range(1000))
+
+
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+class TestStackRecorder:
+    def test_records_nested_stacks_with_self_time(self) -> None:
+        recorder = StackRecorder()
+
+        recorder.enable()
+        try:
+            _outer()
+        finally:
+            recorder.disable()
+
+        stacks = {tuple(label.split(" ")[0] for label in stack): seconds for stack, seconds in recorder.stacks.items()}
+        assert ("_outer",) in stacks
+        assert ("_outer", "_inner") in stacks
+        assert all(seconds >= 0 for seconds in stacks.values())
+
+    def test_folded_lines(self) -> None:
+        recorder = StackRecorder()
+        recorder.stacks[("a (x.py:1)", "b (x.py:2)")] = 0.002
+        recorder.stacks[("a (x.py:1)",)] = 0.0000001
+
+        assert recorder.folded() == ["a (x.py:1);b (x.py:2) 2000"]
+
+
+class TestCallProfile:
+    def test_unknown_phase_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="unknown phase"):
+            CallProfile(phase="lexing")
+
+    def test_whole_run_profiles_every_phase(self, tmp_path: Path) -> None:
+        calls = CallProfile()
+
+        run([DATA / "simple.v"], calls=calls)
+        calls.write_pstats(tmp_path / "run.pstats")
+        calls.write_folded(tmp_path / "run.folded")
+
+        files = {filename for filename, _line, _name in pstats.Stats(str(tmp_path / "run.pstats")).stats}
+        folded = (tmp_path / "run.folded").read_text(encoding="utf-8")
+        assert "pkg/walk/walker.py" in files
+        assert "pkg/parser/parse.py" in files
+        assert "pkg/rules/module/module_rule_runner.py" in files
+        assert "_walk (pkg/walk/walker.py:" in folded
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.splitlines())
+
+    def test_single_phase_profiles_only_that_phase(self) -> None:
+        calls = CallProfile(phase="symbol_rules")
+
+        run([DATA / "simple.v"], calls=calls)
+
+        files = {filename for filename, _line, _name in calls.stats().stats}
+        roots = {stack[0].split(" ")[0] for stack in calls.recorder.stacks}
+        assert "pkg/rules/symbol/symbol_rule_runner.py" in files
+        assert "pkg/walk/walker.py" not in files
+        assert roots == {"run"}
+
+    def test_disabled_outputs_raise(self, tmp_path: Path) -> None:
+        calls = CallProfile(pstats=False, stacks=False)
+
+        run([DATA / "simple.v"], calls=calls)
+
+        with pytest.raises(ValueError):
+            calls.write_pstats(tmp_path / "run.pstats")
+        with pytest.raises(ValueError):
+            calls.write_folded(tmp_path / "run.folded")
+
+    def test_relative_path(self) -> None:
+        assert relative_path(str(Path(__file__).resolve().parents[2] / "src" / "pkg" / "walk" / "walker.py")) == (
+            "pkg/walk/walker.py"
+        )
+        assert relative_path("<string>") == "<string>"
@@ -0,0 +1,86 @@
+"""Test suite for MemoryProfile, the --memory-profile tracemalloc snapshots."""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from src.pkg.instrument.memory import MemoryProfile, live_object_counts
+from src.pkg.semantic.symbol import Symbol
+import src.run_lint as run_lint_module
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+class TestMemoryProfile:
+    def test_every_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="every must be >= 1"):
+            MemoryProfile(every=0)
+
+    def test_begin_file_samples_every_nth_file(self) -> None:
+        profile = MemoryProfile(every=3)
+
+        assert [profile.begin_file() for _ in range(7)] == [True, False, False, True, False, False, True]
+
+    def test_live_object_counts_include_project_types(self) -> None:
+        symbols = [Symbol(f"s{i}", "logic") for i in range(3)]
+
+        counts = live_object_counts()
+
+        assert counts["Symbol"] >= len(symbols)
+
+    def test_stop_leaves_existing_tracing_running(self) -> None:
+        tracemalloc.start()
+        try:
+            profile = MemoryProfile()
+            profile.start()
+            profile.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestRunWithMemoryProfile:
+    # run() counts the project objects it creates itself, which are classes of
+    # the `pkg` package it imports rather than of `src.pkg`: profile it with
+    # the MemoryProfile it imports too
+    def test_run_snapshots_parse_walk_and_rules(self) -> None:
+        paths = [DATA / "simple.v", DATA / "initial_block.v"]
+        profile = run_lint_module.MemoryProfile(top=5)
+
+        diagnostics = run(paths, memory=profile)
+
+        assert diagnostics == run(paths)
+        assert [(s.phase, s.path) for s in profile.snapshots] == [
+            ("parse", str(paths[0])),
+            ("walk", str(paths[0])),
+            ("parse", str(paths[1])),
+            ("walk", str(paths[1])),
+            ("rules", None),
+        ]
+        assert profile.snapshots[-1].objects["Symbol"] > 0
+        assert 0 < len(profile.snapshots[-1].top) <= 5
+        assert not tracemalloc.is_tracing()
+
+    def test_run_honours_sampling(self) -> None:
+        profile = run_lint_module.MemoryProfile(every=2)
+
+        run([DATA / "simple.v", DATA / "initial_block.v", DATA / "final_block.v"], memory=profile)
+
+        assert [s.path for s in profile.snapshots if s.phase == "parse"] == [
+            str(DATA / "simple.v"),
+            str(DATA / "final_block.v"),
+        ]
+
+    def test_reports_render(self) -> None:
+        profile = run_lint_module.MemoryProfile()
+        run([DATA / "simple.v"], memory=profile)
+
+        report = json.loads(profile.to_json())
+        table = profile.format_table()
+
+        assert [s["phase"] for s in report["snapshots"]] == ["parse", "walk", "rules"]
+        assert "Symbol" in table
+        assert "top allocation sites" in table
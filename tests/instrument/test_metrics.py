@@ -0,0 +1,61 @@
+"""Test suite for the OpenMetrics export of lint runs."""
+
+from pathlib import Path
+
+from src.pkg.instrument.metrics import openmetrics, write_textfile
+from src.pkg.instrument.profile import RunProfile
+from src.pkg.instrument.rule_stats import RuleStats
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def _samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class TestOpenMetrics:
+    def _export(self, **kwargs) -> str:
+        profile, rule_stats = RunProfile(), RuleStats()
+        diagnostics = run([DATA / "initial_block.v", DATA / "simple.v"], profile=profile, rule_stats=rule_stats)
+        return openmetrics(diagnostics, profile, rule_stats, **kwargs)
+
+    def test_reports_run_totals_phases_rules_and_diagnostics(self) -> None:
+        samples = _samples(self._export(timestamp=1700000000.0))
+
+        assert samples["verilinter_files"] == 2
+        assert samples["verilinter_lines"] > 0
+        assert samples["verilinter_nodes"] > 0
+        assert 'verilinter_phase_duration_seconds{phase="walk"}' in samples
+        assert samples['verilinter_rule_hits{rule="NO_INITIAL_BLOCK",kind="syntax"}'] >= 1
+        assert samples['verilinter_rule_calls{rule="UNDEFINED_MODULE",kind="module"}'] == 1
+        assert samples['verilinter_diagnostics{code="NO_INITIAL_BLOCK"}'] >= 1
+        assert samples["verilinter_last_run_timestamp_seconds"] == 1700000000.0
+
+    def test_every_family_is_typed_and_the_text_ends_with_eof(self) -> None:
+        text = self._export()
+
+        names = {line.split("{")[0].split(" ")[0] for line in text.splitlines() if not line.startswith("#")}
+        typed = {line.split(" ")[2] for line in text.splitlines() if line.startswith("# TYPE ")}
+        assert names <= typed
+        assert text.endswith("# EOF\n")
+
+    def test_extra_labels_are_escaped_and_added_to_every_sample(self) -> None:
+        text = self._export(labels={"repo": 'a"b\\c'})
+
+        samples = [line for line in text.splitlines() if not line.startswith("#")]
+        assert samples
+        assert all('repo="a\\"b\\\\c"' in line for line in samples)
+
+    def test_write_textfile_replaces_atomically(self, tmp_path: Path) -> None:
+        path = tmp_path / "lint.prom"
+        path.write_text("old", encoding="utf-8")
+
+        write_textfile(path, "# EOF\n")
+
+        assert path.read_text(encoding="utf-8") == "# EOF\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["lint.prom"]
@@ -0,0 +1,151 @@
+"""Test suite for the run observer hooks and the Chrome trace-event observer."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from src.pkg.handlers.register_handlers import *
+from src.pkg.instrument.observer import ChromeTraceObserver, RunObserver
+from src.pkg.parser.parse import parse_file
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.walk.walker import Walker
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+class _RecordingObserver(RunObserver):
+    def __init__(self) -> None:
+        self.events: list[tuple[Any, ...]] = []
+
+    def file_start(self, path: str) -> None:
+        self.events.append(("file_start", Path(path).name))
+
+    def file_parsed(self, path: str) -> None:
+        self.events.append(("file_parsed", Path(path).name))
+
+    def walk_start(self, path: str | None) -> None:
+        self.events.append(("walk_start", Path(path).name if path else None))
+
+    def walk_done(self, path: str | None) -> None:
+        self.events.append(("walk_done", Path(path).name if path else None))
+
+    def file_done(self, path: str) -> None:
+        self.events.append(("file_done", Path(path).name))
+
+    def rule_phase_start(self, phase: str) -> None:
+        self.events.append(("rule_phase_start", phase))
+
+    def rule_phase_done(self, phase: str, diagnostics: int) -> None:
+        self.events.append(("rule_phase_done", phase, diagnostics))
+
+    def diagnostic(self, diagnostic: dict[str, Any]) -> None:
+        self.events.append(("diagnostic", diagnostic["code"]))
+
+
+class TestRunObserver:
+    def test_run_emits_events_in_order(self) -> None:
+        observer = _RecordingObserver()
+
+        run([DATA / "initial_block.v", DATA / "dup_module_a.v", DATA / "dup_module_b.v"], observer=observer)
+
+        names = [event[:2] for event in observer.events if event[0] != "diagnostic"]
+        assert names == [
+            ("file_start", "initial_block.v"),
+            ("file_parsed", "initial_block.v"),
+            ("walk_start", "initial_block.v"),
+            ("walk_done", "initial_block.v"),
+            ("file_done", "initial_block.v"),
+            ("file_start", "dup_module_a.v"),
+            ("file_parsed", "dup_module_a.v"),
+            ("walk_start", "dup_module_a.v"),
+            ("walk_done", "dup_module_a.v"),
+            ("file_done", "dup_module_a.v"),
+            ("file_start", "dup_module_b.v"),
+            ("file_parsed", "dup_module_b.v"),
+            ("walk_start", "dup_module_b.v"),
+            ("walk_done", "dup_module_b.v"),
+            ("file_done", "dup_module_b.v"),
+            ("rule_phase_start", "symbol_rules"),
+            ("rule_phase_done", "symbol_rules"),
+            ("rule_phase_start", "module_rules"),
+            ("rule_phase_done", "module_rules"),
+        ]
+
+    def test_rule_phase_counts_its_diagnostics(self) -> None:
+        observer = _RecordingObserver()
+
+        run([DATA / "dup_module_a.v", DATA / "dup_module_b.v"], observer=observer)
+
+        start = observer.events.index(("rule_phase_start", "module_rules"))
+        done = observer.events[-1]
+        reported = [event for event in observer.events[start + 1 : -1] if event[0] == "diagnostic"]
+        assert done == ("rule_phase_done", "module_rules", len(reported))
+        assert reported == [("diagnostic", "DUPLICATE_MODULE")]
+
+    def test_every_diagnostic_is_reported(self) -> None:
+        observer = _RecordingObserver()
+
+        diagnostics = run(sorted(DATA.glob("*.v")), observer=observer)
+
+        reported = [event[1] for event in observer.events if event[0] == "diagnostic"]
+        assert sorted(reported) == sorted(d["code"] for d in diagnostics)
+
+    def test_walker_without_observer_emits_nothing(self) -> None:
+        symbol_table = SymbolTable()
+        symbol_table.set_current_file(str(DATA / "simple.v"))
+        tree = parse_file(str(DATA / "simple.v"))
+        walker = Walker(dispatch)
+
+        walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+
+        assert walker.observer is None
+        assert walker.results
+
+
+class TestChromeTraceObserver:
+    def test_trace_slices_are_balanced(self) -> None:
+        trace = ChromeTraceObserver()
+
+        run([DATA / "simple.v", DATA / "initial_block.v"], observer=trace)
+
+        depth = 0
+        for event in trace.events:
+            if event["ph"] == "B":
+                depth += 1
+            elif event["ph"] == "E":
+                depth -= 1
+            assert depth >= 0
+        assert depth == 0
+        assert [e["name"] for e in trace.events if e["ph"] == "B" and e["cat"] == "file"] == ["simple.v", "initial_block.v"]
+
+    def test_timestamps_are_monotonic(self) -> None:
+        trace = ChromeTraceObserver()
+
+        run([DATA / "simple.v"], observer=trace)
+
+        stamps = [event["ts"] for event in trace.events if "ts" in event]
+        assert stamps == sorted(stamps)
+
+    def test_diagnostics_become_instant_events(self) -> None:
+        trace = ChromeTraceObserver()
+
+        run([DATA / "initial_block.v"], observer=trace)
+
+        instants = [event for event in trace.events if event["ph"] == "i"]
+        assert any(event["name"] == "NO_INITIAL_BLOCK" for event in instants)
+        assert all(event["s"] == "t" for event in instants)
+
+    def test_write_and_merge(self, tmp_path: Path) -> None:
+        first, second = ChromeTraceObserver("worker-1"), ChromeTraceObserver("worker-2")
+        run([DATA / "simple.v"], observer=first)
+        run([DATA / "final_block.v"], observer=second)
+        output = tmp_path / "trace.json"
+
+        first.write(output)
+        merged = ChromeTraceObserver.merge([first, second])
+
+        assert json.loads(output.read_text(encoding="utf-8"))["traceEvents"] == first.events
+        assert len(merged["traceEvents"]) == len(first.events) + len(second.events)
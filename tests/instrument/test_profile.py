@@ -0,0 +1,96 @@
+"""Test suite for RunProfile, the --profile phase/file timer."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.pkg.instrument.profile import FILE_PHASES, PHASES, RunProfile
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+class TestRunProfile:
+    def test_phase_books_time_to_run_and_file(self, tmp_path: Path) -> None:
+        source = tmp_path / "a.v"
+        source.write_text("module a;\nendmodule\n", encoding="utf-8")
+        profile = RunProfile()
+        file = profile.add_file(source)
+
+        with profile.phase("parse", file):
+            sum(range(10_000))
+
+        assert file.lines == 2
+        assert profile.wall["parse"] > 0
+        assert file.wall["parse"] == profile.wall["parse"]
+
+    def test_nested_rule_time_is_not_double_counted(self, tmp_path: Path) -> None:
+        source = tmp_path / "a.v"
+        source.write_text("module a;\nendmodule\n", encoding="utf-8")
+        profile = RunProfile()
+        file = profile.add_file(source)
+        on_node = profile.timed_on_node(lambda _vnode, _ctx: sum(range(50_000)), file)
+
+        with profile.phase("walk", file):
+            for _ in range(3):
+                on_node(None, None)
+
+        assert file.nodes == 3
+        assert profile.wall["rules"] > 0
+        assert profile.total_wall == pytest.approx(profile.wall["walk"] + profile.wall["rules"])
+        assert profile.wall["walk"] < profile.wall["rules"]
+
+    def test_nested_phase_is_not_double_counted(self) -> None:
+        profile = RunProfile()
+
+        with profile.phase("walk"):
+            with profile.phase("symbol_rules"):
+                sum(range(200_000))
+
+        assert profile.wall["symbol_rules"] > 0
+        assert profile.total_wall == pytest.approx(profile.wall["walk"] + profile.wall["symbol_rules"])
+        assert profile.wall["walk"] < profile.wall["symbol_rules"]
+
+    def test_slowest_orders_files_by_wall_time(self) -> None:
+        profile = RunProfile()
+        for path, seconds in (("fast.v", 0.1), ("slow.v", 0.5), ("mid.v", 0.3)):
+            file = profile.add_file(DATA / "simple.v")
+            file.path = path
+            file.wall["parse"] = seconds
+
+        assert [f.path for f in profile.slowest(2)] == ["slow.v", "mid.v"]
+
+
+class TestRunWithProfile:
+    def test_run_records_every_phase_and_file(self) -> None:
+        paths = [DATA / "simple.v", DATA / "initial_block.v"]
+        profile = RunProfile()
+
+        diagnostics = run(paths, profile=profile)
+
+        assert diagnostics == run(paths)
+        assert [f.path for f in profile.files] == [str(p) for p in paths]
+        assert all(f.nodes > 0 and f.lines > 0 for f in profile.files)
+        assert all(set(f.wall) == set(FILE_PHASES) for f in profile.files)
+        assert profile.wall["walk"] > 0 and profile.wall["rules"] > 0
+
+    def test_json_report_is_limited_to_top_files(self) -> None:
+        profile = RunProfile()
+        run(sorted(DATA.glob("*.v")), profile=profile)
+
+        report = json.loads(profile.to_json(top=3))
+
+        assert list(report["phases"]) == list(PHASES)
+        assert len(report["files"]) == 3
+
+    def test_table_lists_phases_and_slowest_files(self) -> None:
+        profile = RunProfile()
+        run([DATA / "simple.v"], profile=profile)
+
+        table = profile.format_table(top=5)
+
+        for name in PHASES:
+            assert name in table
+        assert "slowest 1 of 1 files" in table
+        assert "simple.v" in table
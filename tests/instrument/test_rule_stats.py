@@ -0,0 +1,116 @@
+"""Test suite for per-rule cost accounting (RuleStats and instrumented runners)."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from src.pkg.instrument.rule_stats import RuleStats
+from src.pkg.rules.base_rule import Rule
+from src.pkg.rules.base_symbol_rule import BaseSymbolRule
+from src.pkg.rules.module.module_rule_runner import ModuleRuleRunner
+from src.pkg.rules.symbol.symbol_rule_runner import SymbolRuleRunner
+from src.pkg.rules.syntax.rule_runner import RuleRunner
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+class _EveryOtherRule(Rule):
+    code = "EVERY_OTHER"
+    message = "every other node"
+
+    def __init__(self) -> None:
+        self.seen = 0
+
+    def applies(self, _vnode: Any, _ctx: Any) -> bool:
+        self.seen += 1
+        return self.seen % 2 == 0
+
+    def report(self, _vnode: Any) -> dict[str, Any]:
+        return {"code": self.code, "line": 1, "col": 1, "message": self.message}
+
+
+class _TwoHitsRule(BaseSymbolRule):
+    code = "TWO_HITS"
+    message = "two hits"
+
+    def run(self, _symbol_table: Any) -> list[dict[str, Any]]:
+        return [{"code": self.code, "line": n, "col": 1, "message": self.message} for n in (1, 2)]
+
+
+class TestInstrumentedRuleRunner:
+    def test_counts_calls_and_hits(self) -> None:
+        runner = RuleRunner()
+        runner.register(_EveryOtherRule)
+        stats = RuleStats()
+        instrumented = runner.instrumented(stats)
+
+        diagnostics = [d for _ in range(5) for d in instrumented.check(Mock(), Mock())]
+
+        stat = stats["EVERY_OTHER"]
+        assert (stat.kind, stat.calls, stat.hits) == ("syntax", 5, 2)
+        assert len(diagnostics) == 2
+        assert stat.seconds > 0
+
+    def test_original_runner_is_not_instrumented(self) -> None:
+        runner = RuleRunner()
+        runner.register(_EveryOtherRule)
+        stats = RuleStats()
+        runner.instrumented(stats)
+
+        runner.check(Mock(), Mock())
+
+        assert stats["EVERY_OTHER"].calls == 0
+
+
+class TestInstrumentedSymbolRunners:
+    def test_symbol_runner_counts_each_diagnostic_as_a_hit(self) -> None:
+        runner = SymbolRuleRunner()
+        runner.register(_TwoHitsRule)
+        stats = RuleStats()
+
+        diagnostics = runner.instrumented(stats).run(Mock())
+
+        stat = stats["TWO_HITS"]
+        assert (stat.kind, stat.calls, stat.hits) == ("symbol", 1, 2)
+        assert len(diagnostics) == 2
+
+    def test_module_runner_records_module_kind(self) -> None:
+        runner = ModuleRuleRunner()
+        runner.register(_TwoHitsRule)
+        stats = RuleStats()
+
+        runner.instrumented(stats).run(Mock())
+
+        assert stats["TWO_HITS"].kind == "module"
+
+
+class TestRuleStatsReport:
+    def test_run_collects_stats_for_every_rule(self) -> None:
+        stats = RuleStats()
+
+        diagnostics = run([DATA / "initial_block.v", DATA / "dup_module_a.v", DATA / "dup_module_b.v"], rule_stats=stats)
+
+        assert {stat.kind for stat in stats.ranked()} == {"syntax", "symbol", "module"}
+        assert stats["NO_INITIAL_BLOCK"].hits == sum(d["code"] == "NO_INITIAL_BLOCK" for d in diagnostics)
+        assert stats["DUPLICATE_MODULE"].hits == 1
+
+    def test_run_counts_files_a_rule_was_skipped_for(self) -> None:
+        stats = RuleStats()
+
+        run([DATA / "initial_block.v", DATA / "dup_module_a.v", DATA / "dup_module_b.v"], rule_stats=stats)
+
+        assert stats["NO_INITIAL_BLOCK"].skipped == 2
+        assert stats["NO_FINAL_BLOCK"].skipped == 3
+        assert stats["NO_FINAL_BLOCK"].calls == 0
+        assert stats["NO_FINAL_BLOCK"].to_dict()["skipped"] == 3
+
+    def test_ranked_orders_by_time(self) -> None:
+        stats = RuleStats()
+        stats.stat_for("CHEAP", "syntax").seconds = 0.1
+        stats.stat_for("COSTLY", "syntax").seconds = 0.9
+
+        assert [stat.code for stat in stats.ranked()] == ["COSTLY", "CHEAP"]
+        assert json.loads(stats.to_json())["rules"][0]["code"] == "COSTLY"
+        assert stats.format_table().splitlines()[1].startswith("COSTLY")
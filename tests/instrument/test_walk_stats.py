@@ -0,0 +1,77 @@
+"""Test suite for the walk statistics collected by Walker (--walk-stats)."""
+
+from pathlib import Path
+
+from src.pkg.handlers.register_handlers import *
+from src.pkg.instrument.walk_stats import WalkStats
+from src.pkg.parser.parse import parse_file
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.walk.walker import Walker
+from src.run_lint import run
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def _walk(path: Path, stats: WalkStats | None) -> Walker:
+    symbol_table = SymbolTable()
+    symbol_table.set_current_file(str(path))
+    tree = parse_file(str(path))
+    walker = Walker(dispatch)
+    walker.stats = stats
+    walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+    return walker
+
+
+class TestWalkStats:
+    def test_counts_match_the_plain_walk(self) -> None:
+        stats = WalkStats()
+
+        counted = _walk(DATA / "simple.v", stats)
+        plain = _walk(DATA / "simple.v", None)
+
+        file_stats = stats.files[0]
+        assert len(counted.results) == len(plain.results) == file_stats.nodes
+        assert file_stats.syntax_nodes + file_stats.tokens == file_stats.nodes
+        assert sum(file_stats.syntax_kinds.values()) == file_stats.syntax_nodes
+        assert sum(file_stats.token_kinds.values()) == file_stats.tokens
+        assert sum(file_stats.handlers.values()) == file_stats.nodes
+        assert file_stats.pruned == 0
+
+    def test_records_depth_handlers_and_path(self) -> None:
+        stats = WalkStats()
+
+        _walk(DATA / "simple.v", stats)
+
+        file_stats = stats.files[0]
+        assert file_stats.path == str(DATA / "simple.v")
+        assert file_stats.max_depth > 2
+        assert file_stats.handlers["ModuleDeclarationHandler"] == 1
+        assert file_stats.handlers["TokenHandler"] == file_stats.tokens
+
+    def test_run_aggregates_files_and_counts_pruned_subtrees(self) -> None:
+        stats = WalkStats()
+        paths = [DATA / "simple.v", DATA / "initial_block.v"]
+
+        run(paths, walk_stats=stats)
+
+        total = stats.total()
+        assert [s.path for s in stats.files] == [str(p) for p in paths]
+        assert total.nodes == sum(s.nodes for s in stats.files)
+        assert total.max_depth == max(s.max_depth for s in stats.files)
+        assert total.pruned > 0
+        assert total.handlers["ModuleDeclarationHandler"] == 2
+
+    def test_reports(self) -> None:
+        stats = WalkStats()
+        _walk(DATA / "simple.v", stats)
+
+        report = stats.to_dict()
+        table = stats.format_table(top=3)
+
+        assert report["total"]["nodes"] == stats.files[0].nodes
+        assert report["files"][0]["syntax_kinds"]["ModuleDeclaration"] == 1
+        assert "handler hits:" in table
+        assert "ModuleDeclarationHandler" in table
+        assert "top 3 syntax kinds:" in table
@@ -52,20 +52,12 @@ class TestNoMultipleDriversRule:
 
     def test_flags_symbol_written_from_two_driver_sources(self, rule: NoMultipleDriversRule) -> None:
         st = SymbolTable()
+        first = st.add_driver({"line": 3, "col": 3, "file": "a.sv"})
+        second = st.add_driver({"line": 6, "col": 3, "file": "a.sv"})
         sym = Symbol(name="x", kind="variable")
         sym.add_declaration({"line": 2, "col": 9})
-        sym.add_use(
-            {"line": 4, "col": 5},
-            write=True,
-            driver_id="always:a.sv:3:3",
-            driver_location={"line": 3, "col": 3, "file": "a.sv"},
-        )
-        sym.add_use(
-            {"line": 7, "col": 5},
-            write=True,
-            driver_id="always:a.sv:6:3",
-            driver_location={"line": 6, "col": 3, "file": "a.sv"},
-        )
+        sym.add_use({"line": 4, "col": 5}, write=True, driver_id=first)
+        sym.add_use({"line": 7, "col": 5}, write=True, driver_id=second)
         st.global_scope.define(sym)
 
         diagnostics = rule.run(st)
@@ -78,20 +70,11 @@ class TestNoMultipleDriversRule:
 
     def test_does_not_flag_same_driver_block_writing_multiple_times(self, rule: NoMultipleDriversRule) -> None:
         st = SymbolTable()
+        driver = st.add_driver({"line": 3, "col": 3, "file": "a.sv"})
         sym = Symbol(name="x", kind="variable")
         sym.add_declaration({"line": 2, "col": 9})
-        sym.add_use(
-            {"line": 4, "col": 5},
-            write=True,
-            driver_id="always:a.sv:3:3",
-            driver_location={"line": 3, "col": 3, "file": "a.sv"},
-        )
-        sym.add_use(
-            {"line": 5, "col": 5},
-            write=True,
-            driver_id="always:a.sv:3:3",
-            driver_location={"line": 3, "col": 3, "file": "a.sv"},
-        )
+        sym.add_use({"line": 4, "col": 5}, write=True, driver_id=driver)
+        sym.add_use({"line": 5, "col": 5}, write=True, driver_id=driver)
         st.global_scope.define(sym)
 
         assert rule.run(st) == []
@@ -1,10 +1,15 @@
 from typing import Any
+import pyslang as sl
 import pytest
 from unittest.mock import Mock
 
+from src.pkg.instrument.rule_stats import RuleStats
 from src.pkg.rules.syntax.rule_runner import RuleRunner
+from src.pkg.rules.base_declarative_rule import DeclarativeRule
 from src.pkg.rules.base_rule import Rule
+from src.pkg.rules.base_token_rule import TokenRule
 from src.pkg.vnodes.base_vnode import BaseVNode
+from src.pkg.walk.context import Context, ContextFlag
 
 
 @pytest.fixture
@@ -194,3 +199,162 @@ class TestRuleRunner:
 
         # 2 vnodes × 2 rules = 4 diagnostics
         assert len(diagnostics) == 4
+
+
+class TestRuleRunnerTokenRules:
+    @staticmethod
+    def _runner() -> RuleRunner:
+        runner = RuleRunner()
+
+        @runner.register
+        class WalkRule(Rule):
+            code = "WALK_RULE"
+
+            def applies(self, vnode: Any, ctx: Any) -> bool:
+                return True
+
+        @runner.register
+        class KeywordRule(TokenRule):
+            code = "TOKEN_RULE"
+            consumes = frozenset({sl.TokenKind.DefParamKeyword})
+
+            def applies_to_token(self, token: Any, tree: Any) -> bool:
+                return True
+
+        return runner
+
+    def test_walk_and_token_rules_partition_the_rules(self) -> None:
+        runner = self._runner()
+
+        assert [rule.code for rule in runner.walk_rules().rules] == ["WALK_RULE"]
+        assert [rule.code for rule in runner.token_rules().rules] == ["TOKEN_RULE"]
+        assert len(runner.rules) == 2
+
+    def test_partition_keeps_stats_aligned(self) -> None:
+        stats = RuleStats()
+        runner = self._runner().instrumented(stats)
+        vnode = Mock(spec=BaseVNode)
+        vnode.raw = Mock()
+        vnode.location = {"line": 1, "col": 1}
+
+        runner.token_rules().check(vnode, None)
+
+        assert stats["TOKEN_RULE"].calls == 1
+        assert stats["WALK_RULE"].calls == 0
+
+
+class TestRuleRunnerForKinds:
+    @staticmethod
+    def _runner() -> RuleRunner:
+        runner = RuleRunner()
+
+        @runner.register
+        class InitialRule(Rule):
+            code = "INITIAL_RULE"
+            consumes = frozenset({sl.SyntaxKind.InitialBlock})
+
+            def applies(self, vnode: Any, ctx: Any) -> bool:
+                return True
+
+        @runner.register
+        class UndeclaredRule(Rule):
+            code = "UNDECLARED_RULE"
+
+            def applies(self, vnode: Any, ctx: Any) -> bool:
+                return True
+
+        return runner
+
+    def test_drops_rules_whose_kinds_are_absent(self) -> None:
+        runner = self._runner()
+
+        assert [rule.code for rule in runner.for_kinds({"ModuleDeclaration"}).rules] == [
+            "UNDECLARED_RULE"
+        ]
+        assert [rule.code for rule in runner.for_kinds({"InitialBlock"}).rules] == [
+            "INITIAL_RULE",
+            "UNDECLARED_RULE",
+        ]
+
+    def test_instrumented_runner_counts_skipped_files(self) -> None:
+        stats = RuleStats()
+        runner = self._runner().instrumented(stats)
+
+        runner.for_kinds(set())
+        runner.for_kinds(set())
+        runner.for_kinds({"InitialBlock"})
+
+        assert stats["INITIAL_RULE"].skipped == 2
+        assert stats["UNDECLARED_RULE"].skipped == 0
+
+
+class TestRuleRunnerDeclarativeRules:
+    @staticmethod
+    def _runner() -> RuleRunner:
+        runner = RuleRunner()
+
+        @runner.register
+        class SequentialEquals(DeclarativeRule):
+            code = "SEQUENTIAL_EQUALS"
+            kinds = frozenset({sl.TokenKind.Equals})
+            requires_flags = frozenset({ContextFlag.ALWAYS})
+            forbids_flags = frozenset({ContextFlag.ALWAYS_COMB})
+
+        @runner.register
+        class Everywhere(Rule):
+            code = "EVERYWHERE"
+
+            def applies(self, vnode: Any, ctx: Any) -> bool:
+                return True
+
+        return runner
+
+    @staticmethod
+    def _vnode(kind: object) -> Mock:
+        vnode = Mock(spec=BaseVNode)
+        vnode.raw = Mock(kind=kind)
+        vnode.location = {"line": 1, "col": 1}
+        return vnode
+
+    def test_evaluates_kinds_and_flags_in_registration_order(self) -> None:
+        runner = self._runner()
+        equals = self._vnode(sl.TokenKind.Equals)
+        always = Context().with_flag(ContextFlag.ALWAYS)
+
+        assert [d["code"] for d in runner.check(equals, always)] == ["SEQUENTIAL_EQUALS", "EVERYWHERE"]
+        assert [d["code"] for d in runner.check(equals, Context())] == ["EVERYWHERE"]
+        assert [d["code"] for d in runner.check(equals, always.with_flag(ContextFlag.ALWAYS_COMB))] == ["EVERYWHERE"]
+        assert [d["code"] for d in runner.check(self._vnode(sl.TokenKind.LessThanEquals), always)] == ["EVERYWHERE"]
+
+    def test_matches_applies(self) -> None:
+        rule = self._runner().rules[0]
+        always = Context().with_flag(ContextFlag.ALWAYS)
+
+        assert rule.applies(self._vnode(sl.TokenKind.Equals), always) is True
+        assert rule.applies(self._vnode(sl.TokenKind.Equals), Context()) is False
+        assert rule.applies(self._vnode(sl.TokenKind.LessThanEquals), always) is False
+
+    def test_instrumented_runner_only_counts_nodes_of_the_rule_kinds(self) -> None:
+        stats = RuleStats()
+        runner = self._runner().instrumented(stats)
+        always = Context().with_flag(ContextFlag.ALWAYS)
+
+        runner.check(self._vnode(sl.TokenKind.Equals), always)
+        runner.check(self._vnode(sl.TokenKind.LessThanEquals), always)
+
+        assert (stats["SEQUENTIAL_EQUALS"].calls, stats["SEQUENTIAL_EQUALS"].hits) == (1, 1)
+        assert stats["EVERYWHERE"].calls == 2
+
+    def test_register_recompiles_the_table(self) -> None:
+        runner = self._runner()
+        runner.check(self._vnode(sl.TokenKind.Equals), Context())
+
+        @runner.register
+        class Blocks(DeclarativeRule):
+            code = "BLOCKS"
+            kinds = frozenset({sl.SyntaxKind.InitialBlock})
+
+        assert [d["code"] for d in runner.check(self._vnode(sl.SyntaxKind.InitialBlock), Context())] == [
+            "EVERYWHERE",
+            "BLOCKS",
+        ]
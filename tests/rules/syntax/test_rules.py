@@ -628,6 +628,96 @@ class TestNoLatchInAlwaysCombRule:
 
         assert rule.applies(mock_vnode, Context()) is False
 
+    def test_applies_returns_true_for_case_without_default(self, rule: NoLatchInAlwaysCombRule) -> None:
+        tree = sl.SyntaxTree.fromText(
+            """
+            module top(input logic [1:0] s, input logic b, c, output logic y);
+                always_comb begin
+                    case (s)
+                        2'd0: y = b;
+                        2'd1: y = c;
+                    endcase
+                end
+            endmodule
+            """
+        )
+
+        def walk(node):
+            if isinstance(node, sl.ProceduralBlockSyntax):
+                return node
+            if hasattr(node, "__iter__"):
+                for child in node:
+                    found = walk(child)
+                    if found is not None:
+                        return found
+            return None
+
+        raw_node = walk(tree.root)
+        assert raw_node is not None
+
+        mock_vnode = Mock(spec=BaseVNode)
+        mock_vnode.raw = raw_node
+
+        assert rule.applies(mock_vnode, Context()) is True
+
+    def test_applies_returns_false_for_for_loop_filling_a_vector(self, rule: NoLatchInAlwaysCombRule) -> None:
+        tree = sl.SyntaxTree.fromText(
+            """
+            module top #(parameter N = 4)(input logic [N-1:0] a, output logic [N-1:0] y);
+                always_comb begin
+                    for (int i = 0; i < N; i++) y[i] = a[i];
+                end
+            endmodule
+            """
+        )
+
+        def walk(node):
+            if isinstance(node, sl.ProceduralBlockSyntax):
+                return node
+            if hasattr(node, "__iter__"):
+                for child in node:
+                    found = walk(child)
+                    if found is not None:
+                        return found
+            return None
+
+        raw_node = walk(tree.root)
+        assert raw_node is not None
+
+        mock_vnode = Mock(spec=BaseVNode)
+        mock_vnode.raw = raw_node
+
+        assert rule.applies(mock_vnode, Context()) is False
+
+    def test_applies_returns_false_for_do_while_body(self, rule: NoLatchInAlwaysCombRule) -> None:
+        tree = sl.SyntaxTree.fromText(
+            """
+            module top(input logic a, b, output logic y);
+                always_comb begin
+                    do y = a; while (b);
+                end
+            endmodule
+            """
+        )
+
+        def walk(node):
+            if isinstance(node, sl.ProceduralBlockSyntax):
+                return node
+            if hasattr(node, "__iter__"):
+                for child in node:
+                    found = walk(child)
+                    if found is not None:
+                        return found
+            return None
+
+        raw_node = walk(tree.root)
+        assert raw_node is not None
+
+        mock_vnode = Mock(spec=BaseVNode)
+        mock_vnode.raw = raw_node
+
+        assert rule.applies(mock_vnode, Context()) is False
+
     def test_applies_returns_false_for_non_always_comb_block(self, rule: NoLatchInAlwaysCombRule) -> None:
         mock_vnode = Mock(spec=BaseVNode)
         mock_vnode.raw = Mock()
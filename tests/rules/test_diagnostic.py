@@ -0,0 +1,45 @@
+import pytest
+
+from src.pkg.rules.diagnostic import Diagnostic
+
+
+class _CountingName:
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __format__(self, spec: str) -> str:
+        self.formatted += 1
+        return "q"
+
+
+class TestDiagnostic:
+    def test_message_is_formatted_only_when_read(self) -> None:
+        name = _CountingName()
+        diagnostic = Diagnostic("UNUSED_VARIABLE", {"line": 3, "col": 7}, "Unused variable '{}'", name)
+
+        assert diagnostic.code == "UNUSED_VARIABLE"
+        assert name.formatted == 0
+        assert diagnostic["message"] == "Unused variable 'q'"
+        assert diagnostic.message == "Unused variable 'q'"
+        assert name.formatted == 1
+
+    def test_reads_like_the_dict_it_replaces(self) -> None:
+        diagnostic = Diagnostic("X", {"line": 1, "col": 2, "file": "a.sv"}, "{} {}", "two", "words")
+        expected = {"code": "X", "line": 1, "col": 2, "message": "two words", "file": "a.sv"}
+
+        assert diagnostic == expected
+        assert diagnostic.to_dict() == expected
+        assert list(diagnostic) == list(expected)
+        assert diagnostic.get("file") == "a.sv"
+
+    def test_file_is_absent_without_one(self) -> None:
+        diagnostic = Diagnostic("X", {"line": 1, "col": 2}, "plain {braces} kept")
+
+        assert "file" not in diagnostic
+        assert diagnostic.get("file") is None
+        assert diagnostic.to_dict() == {"code": "X", "line": 1, "col": 2, "message": "plain {braces} kept"}
+        with pytest.raises(KeyError):
+            diagnostic["file"]
+
+    def test_has_no_instance_dict(self) -> None:
+        assert not hasattr(Diagnostic("X", {"line": 1, "col": 1}, "m"), "__dict__")
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import Mock
 
 from src.pkg.rules.base_rule import Rule
+from src.pkg.rules.diagnostic import Diagnostic
 from src.pkg.vnodes.base_vnode import BaseVNode
 
 
@@ -58,7 +59,7 @@ class TestRule:
         """Test that report() generates a proper diagnostic dictionary."""
         result = rule.report(mock_vnode)
         
-        assert isinstance(result, dict)
+        assert isinstance(result, Diagnostic)
         assert "line" in result
         assert "col" in result
         assert "code" in result
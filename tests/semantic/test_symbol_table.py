@@ -537,3 +537,283 @@ class TestLookupGlobal:
 
         found = st.lookup_global("nowhere")
         assert found is None
+
+    def test_prefers_global_scope_over_earlier_nested_definition(self) -> None:
+        st = SymbolTable()
+        top = st.new_scope(kind="module", name="top")
+        top.define(self._sym("g"))
+        sym = self._sym("g")
+        st.global_scope.define(sym)
+
+        found = st.lookup_global("g")
+        assert found is sym
+
+    def test_finds_symbol_in_scope_attached_with_set_parent(self) -> None:
+        st = SymbolTable()
+        mod = Scope(kind="module", name="top")
+        block = Scope(kind="always")
+        block.set_parent(mod)
+        sym = self._sym("late")
+        block.define(sym)
+        mod.set_parent(st.global_scope)
+
+        found = st.lookup_global("late")
+        assert found is sym
+        assert block.index is st.index
+
+
+# ---------------------------------------------------------------------------
+# Scope child index
+# ---------------------------------------------------------------------------
+
+class TestScopeChildIndex:
+    """Tests for the name-keyed child index behind Scope.child and lookup_qualified."""
+
+    def test_child_returns_registered_scope_by_name(self) -> None:
+        parent = Scope(kind="global")
+        child = Scope(kind="module", name="top")
+        child.set_parent(parent)
+
+        assert parent.child("top") is child
+
+    def test_child_returns_none_for_unknown_name(self) -> None:
+        parent = Scope(kind="global")
+
+        assert parent.child("missing") is None
+
+    def test_child_keeps_first_scope_for_duplicate_names(self) -> None:
+        st = SymbolTable()
+        first = st.new_scope(kind="module", name="dup")
+        st.pop_scope()
+        second = st.new_scope(kind="module", name="dup")
+
+        assert st.global_scope.child("dup") is first
+        assert st.global_scope.children == [first, second]
+
+    def test_unnamed_children_are_not_indexed(self) -> None:
+        parent = Scope(kind="module", name="top")
+        child = Scope(kind="always")
+        child.set_parent(parent)
+
+        assert child in parent.children
+        assert parent._children_by_name == {}
+
+
+class TestScopeScaling:
+    """Registering N module scopes under global_scope must stay linear."""
+
+    N = 100_000
+
+    def _build_modules(self, count: int) -> SymbolTable:
+        st = SymbolTable()
+        for i in range(count):
+            st.new_scope(kind="module", name=f"m{i}")
+            st.pop_scope()
+        return st
+
+    def test_registers_100k_module_scopes(self) -> None:
+        st = self._build_modules(self.N)
+
+        assert len(st.global_scope.children) == self.N
+        assert st.global_scope.child(f"m{self.N - 1}") is st.global_scope.children[-1]
+
+    def test_lookup_qualified_resolves_last_of_100k_modules(self) -> None:
+        st = self._build_modules(self.N)
+        last = st.global_scope.children[-1]
+        sym = Symbol(name="clk", kind="wire")
+        sym.add_declaration({"line": 1, "col": 1})
+        last.define(sym)
+
+        assert st.lookup_qualified([f"m{self.N - 1}", "clk"]) is sym
+
+    def test_registration_never_compares_scopes(self) -> None:
+        # a list scan (`child in parent.children`) would call __eq__ on every
+        # earlier sibling; the set/dict indexes only hash, so registering N
+        # children stays O(N) whatever the machine's timing
+        comparisons = 0
+
+        class CountingScope(Scope):
+            __hash__ = Scope.__hash__
+
+            def __eq__(self, other: object) -> bool:
+                nonlocal comparisons
+                comparisons += 1
+                return self is other
+
+        parent = CountingScope(kind="global")
+        children = [CountingScope(kind="module", name=f"m{i}") for i in range(1_000)]
+        for child in children:
+            child.set_parent(parent)
+            child.set_parent(parent)
+
+        assert comparisons == 0
+        assert parent.children == children
+        assert parent.child("m999") is children[-1]
+
+
+# ---------------------------------------------------------------------------
+# Global symbol index
+# ---------------------------------------------------------------------------
+
+class TestSymbolIndex:
+    """Tests for the inverted name index behind lookup_global / lookup_all."""
+
+    def _sym(self, name: str) -> Symbol:
+        s = Symbol(name=name, kind="wire")
+        s.add_declaration({"line": 1, "col": 1})
+        return s
+
+    def test_define_adds_index_entry(self) -> None:
+        st = SymbolTable()
+        top = st.new_scope(kind="module", name="top")
+        sym = self._sym("clk")
+        top.define(sym)
+
+        assert st.lookup_all("clk") == [(top, sym)]
+
+    def test_lookup_all_lists_every_defining_scope_in_order(self) -> None:
+        st = SymbolTable()
+        a = st.new_scope(kind="module", name="a")
+        sym_a = self._sym("clk")
+        a.define(sym_a)
+        st.pop_scope()
+        b = st.new_scope(kind="module", name="b")
+        sym_b = self._sym("clk")
+        b.define(sym_b)
+
+        assert st.lookup_all("clk") == [(a, sym_a), (b, sym_b)]
+        assert st.lookup_global("clk") is sym_a
+
+    def test_merged_definition_keeps_single_entry(self) -> None:
+        st = SymbolTable()
+        top = st.new_scope(kind="module", name="top")
+        implicit = Symbol(name="x", kind="implicit_net")
+        implicit.is_implicit = True
+        implicit.add_use({"line": 2, "col": 1}, read=True)
+        top.define(implicit)
+        top.define(self._sym("x"))
+
+        entries = st.lookup_all("x")
+        assert len(entries) == 1
+        assert entries[0][1] is implicit
+        assert implicit.is_declared
+
+    def test_scopes_declaring_skips_use_only_symbols(self) -> None:
+        st = SymbolTable()
+        a = st.new_scope(kind="module", name="a")
+        a.define(self._sym("sig"))
+        st.pop_scope()
+        b = st.new_scope(kind="module", name="b")
+        used = Symbol(name="sig", kind="variable")
+        used.add_use({"line": 3, "col": 1}, read=True)
+        b.define(used)
+
+        assert st.scopes_declaring("sig") == [a]
+
+    def test_standalone_scope_has_no_index(self) -> None:
+        scope = Scope(kind="module", name="top")
+        scope.define(self._sym("clk"))
+
+        assert scope.index is None
+
+
+class TestRemoveFile:
+    """Tests for SymbolTable.remove_file keeping registries and the index consistent."""
+
+    def _build(self) -> tuple[SymbolTable, Scope, Scope]:
+        st = SymbolTable()
+        st.set_current_file("a.sv")
+        a = st.new_scope(kind="module", name="dup")
+        st.register_module("dup", a)
+        a.define(Symbol(name="clk", kind="variable"))
+        st.register_module_reference("child", {"line": 4, "col": 3})
+        st.pop_scope()
+
+        st.set_current_file("b.sv")
+        b = st.new_scope(kind="module", name="dup")
+        st.register_module("dup", b)
+        b.define(Symbol(name="clk", kind="variable"))
+        st.pop_scope()
+        return st, a, b
+
+    def test_remove_file_drops_scopes_and_index_entries(self) -> None:
+        st, a, b = self._build()
+
+        st.remove_file("a.sv")
+
+        assert a not in st.scopes
+        assert [scope for scope, _sym in st.lookup_all("clk")] == [b]
+        assert st.lookup_global("clk") is b.symbols["clk"]
+
+    def test_remove_file_updates_child_index(self) -> None:
+        st, a, b = self._build()
+
+        st.remove_file("a.sv")
+
+        assert st.global_scope.children == [b]
+        assert st.global_scope.child("dup") is b
+        assert st.lookup_qualified(["dup", "clk"]) is b.symbols["clk"]
+
+    def test_remove_file_updates_module_registries(self) -> None:
+        st, _a, b = self._build()
+
+        st.remove_file("a.sv")
+
+        assert st.modules == {"dup": [b]}
+        assert st.is_duplicate_module("dup") is False
+        assert st.module_references == []
+
+    def test_remove_unknown_file_is_a_no_op(self) -> None:
+        st, a, b = self._build()
+
+        st.remove_file("missing.sv")
+
+        assert st.global_scope.children == [a, b]
+        assert len(st.lookup_all("clk")) == 2
+
+
+class TestReleaseModule:
+    """Tests for SymbolTable.view and release_module, used by streamed symbol rules."""
+
+    def _build(self) -> tuple[SymbolTable, Scope, Scope]:
+        st = SymbolTable()
+        st.global_scope.define(Symbol(name="clk", kind="variable"))
+        a = st.new_scope(kind="module", name="a")
+        st.register_module("a", a)
+        a.define(Symbol(name="clk", kind="variable"))
+        a.define(Symbol(name="rst", kind="variable"))
+        st.pop_scope()
+        b = st.new_scope(kind="module", name="b")
+        st.register_module("b", b)
+        b.define(Symbol(name="clk", kind="variable"))
+        return st, a, b
+
+    def test_view_lists_only_given_scopes(self) -> None:
+        st, _a, b = self._build()
+
+        view = st.view([b])
+
+        assert view.scopes == [b]
+        assert view.modules is st.modules
+        assert len(st.scopes) == 3
+
+    def test_release_module_drops_symbols_and_latest_index_entries(self) -> None:
+        st, a, b = self._build()
+
+        st.release_module(b)
+
+        assert b.symbols == {}
+        assert [scope for scope, _sym in st.lookup_all("clk")] == [st.global_scope, a]
+        assert [scope for scope, _sym in st.lookup_all("rst")] == [a]
+
+    def test_release_module_keeps_registries(self) -> None:
+        st, a, b = self._build()
+
+        st.release_module(b)
+        st.pop_scope()
+        st.release_module(a)
+
+        assert st.modules == {"a": [a], "b": [b]}
+        assert st.lookup_module("b") is b
+        assert "rst" not in st.index
+        assert st.lookup_global("clk") is st.global_scope.symbols["clk"]
@@ -1,3 +1,5 @@
+import json
+import weakref
 from pathlib import Path
 
 import pytest
@@ -18,6 +20,10 @@ UNDRIVEN_SIGNAL_DATA = Path(__file__).parent / "data" / "undriven_signal.v"
 DEFAULT_NETTYPE_NONE_DATA = Path(__file__).parent / "data" / "default_nettype_none.v"
 LATCH_IN_ALWAYS_COMB_DATA = Path(__file__).parent / "data" / "latch_in_always_comb.v"
 DEFPARAM_USAGE_DATA = Path(__file__).parent / "data" / "defparam_usage.v"
+DUP_MODULE_A_DATA = Path(__file__).parent / "data" / "dup_module_a.v"
+DUP_MODULE_B_DATA = Path(__file__).parent / "data" / "dup_module_b.v"
+UNDEFINED_MODULE_REF_DATA = Path(__file__).parent / "data" / "undefined_module_ref.v"
+MODULE_RULES = ["DUPLICATE_MODULE", "UNDEFINED_MODULE"]
 
 
 class TestRunJobsValidation:
@@ -126,10 +132,14 @@ class TestRunJobsValidation:
         parse_calls: list[str] = []
         walked_roots: list[tuple[object, object, bool]] = []
 
+        class FakeRoot:
+            def visit(self, _callback: object) -> None:
+                pass
+
         class FakeTree:
             def __init__(self, path: str) -> None:
                 self.path = path
-                self.root = object()
+                self.root = FakeRoot()
 
         def fake_parse_file(path: str) -> FakeTree:
             parse_calls.append(path)
@@ -174,10 +184,14 @@ class TestRunJobsValidation:
         parse_calls: list[str] = []
         walked_paths: list[str] = []
 
+        class FakeRoot:
+            def visit(self, _callback: object) -> None:
+                pass
+
         class FakeTree:
             def __init__(self, path: str) -> None:
                 self.path = path
-                self.root = object()
+                self.root = FakeRoot()
 
         def fake_parse_file(path: str) -> FakeTree:
             parse_calls.append(path)
@@ -223,7 +237,10 @@ class TestRunJobsValidation:
         monkeypatch.setattr(run_lint_module, "parse_file", fake_parse_file)
         monkeypatch.setattr(run_lint_module, "file_uses_default_nettype_none", lambda path: False)
         monkeypatch.setattr(run_lint_module, "Walker", FakeWalker)
-        monkeypatch.setattr(run_lint_module.rule_runner, "check", fake_rule_check)
+        # run() checks through copies of rule_runner (walk rules and token rules)
+        monkeypatch.setattr(
+            type(run_lint_module.rule_runner), "check", lambda _self, vnode, ctx: fake_rule_check(vnode, ctx)
+        )
         monkeypatch.setattr(
             run_lint_module.symbol_rule_runner,
             "run",
@@ -267,6 +284,138 @@ class TestRunJobsValidation:
         assert diagnostics[3]["file"] == str(second)
 
 
+class TestRunRuleSelection:
+    def test_unknown_rule_code_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="unknown rule code"):
+            run([DATA], rules=["NOT_A_RULE"])
+
+    def test_selection_filters_diagnostics(self) -> None:
+        diagnostics = run([INITIAL_BLOCK_DATA, FINAL_BLOCK_DATA], rules=["NO_FINAL_BLOCK"])
+
+        assert diagnostics
+        assert {d["code"] for d in diagnostics} == {"NO_FINAL_BLOCK"}
+
+    def test_module_rules_only_matches_full_run(self) -> None:
+        paths = sorted((Path(__file__).parent / "data").glob("*.v"))
+
+        full = [d for d in run(paths) if d["code"] in MODULE_RULES]
+        header_only = run(paths, rules=MODULE_RULES)
+
+        assert header_only == full
+        assert {d["code"] for d in header_only} == set(MODULE_RULES)
+
+    def test_module_rules_only_walks_headers_and_instantiations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        visited: list[str] = []
+        real_walker = run_lint_module.Walker
+
+        class RecordingWalker(real_walker):
+            def walk(self, root, tree, ctx, symbol_table, on_node=None) -> None:
+                def record(vnode, node_ctx) -> None:
+                    visited.append(vnode.raw.kind.name)
+                    on_node(vnode, node_ctx)
+
+                super().walk(root, tree, ctx, symbol_table, on_node=record)
+
+        monkeypatch.setattr(run_lint_module, "Walker", RecordingWalker)
+
+        diagnostics = run([DATA, DUP_MODULE_A_DATA, DUP_MODULE_B_DATA, UNDEFINED_MODULE_REF_DATA], rules=MODULE_RULES)
+
+        assert {d["code"] for d in diagnostics} == set(MODULE_RULES)
+        assert "HierarchyInstantiation" in visited
+        for kind in ("AnsiPortList", "DataDeclaration", "AlwaysBlock", "AlwaysCombBlock", "HierarchicalInstance"):
+            assert kind not in visited
+
+    def test_token_rules_only_skips_the_walk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class FailingWalker(run_lint_module.Walker):
+            def walk(self, *args, **kwargs) -> None:
+                raise AssertionError("token rules need no walk")
+
+        monkeypatch.setattr(run_lint_module, "Walker", FailingWalker)
+
+        diagnostics = run([DEFPARAM_USAGE_DATA], rules=["NO_DEFPARAM"])
+
+        assert {d["code"] for d in diagnostics} == {"NO_DEFPARAM"}
+
+    def test_token_and_walk_diagnostics_are_in_source_order(self, tmp_path: Path) -> None:
+        source = tmp_path / "mixed.sv"
+        source.write_text(
+            "module top;\n"
+            "    initial begin end\n"
+            "    defparam u.P = 1;\n"
+            "    initial begin end\n"
+            "endmodule\n",
+            encoding="utf-8",
+        )
+
+        diagnostics = run([source], rules=["NO_INITIAL_BLOCK", "NO_DEFPARAM"])
+
+        assert [(d["line"], d["code"]) for d in diagnostics] == [
+            (2, "NO_INITIAL_BLOCK"),
+            (3, "NO_DEFPARAM"),
+            (4, "NO_INITIAL_BLOCK"),
+        ]
+
+
+class TestRunStreamSymbols:
+    def test_streamed_diagnostics_match_batch_run(self) -> None:
+        paths = sorted((Path(__file__).parent / "data").glob("*.v"))
+
+        streamed = run(paths, stream_symbols=True)
+
+        assert sorted(json.dumps(d.to_dict(), sort_keys=True) for d in streamed) == sorted(
+            json.dumps(d.to_dict(), sort_keys=True) for d in run(paths)
+        )
+
+    def test_module_symbols_are_released_after_the_walk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        tables = []
+        real_table = run_lint_module.SymbolTable
+
+        def recording_table():
+            table = real_table()
+            tables.append(table)
+            return table
+
+        monkeypatch.setattr(run_lint_module, "SymbolTable", recording_table)
+
+        run([MULTIPLE_DRIVERS_DATA, UNDRIVEN_SIGNAL_DATA], stream_symbols=True)
+
+        (table,) = tables
+        modules = [scope for scopes in table.modules.values() for scope in scopes]
+        assert modules
+        assert all(scope.symbols == {} for scope in modules)
+        assert all(scope in table.scopes for scope in modules)
+
+
+class TestRunReleasesFiles:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            lambda: {},
+            lambda: {"stream_symbols": True},
+            lambda: {"walk_stats": run_lint_module.WalkStats(), "profile": run_lint_module.RunProfile()},
+        ],
+    )
+    def test_each_tree_is_freed_before_the_next_file_is_parsed(self, monkeypatch: pytest.MonkeyPatch, options) -> None:
+        trees: list[weakref.ref] = []
+        alive_at_parse: list[int] = []
+        real_parse_file = run_lint_module.parse_file
+
+        def recording_parse_file(path: str):
+            # no gc.collect(): the tree must go by reference counting alone
+            alive_at_parse.append(sum(ref() is not None for ref in trees))
+            tree = real_parse_file(path)
+            trees.append(weakref.ref(tree))
+            return tree
+
+        monkeypatch.setattr(run_lint_module, "parse_file", recording_parse_file)
+
+        run(sorted((Path(__file__).parent / "data").glob("*.v")), **options())
+
+        assert len(trees) > 1
+        assert alive_at_parse == [0] * len(trees)
+        assert all(ref() is None for ref in trees)
+
+
 class TestMain:
     def test_main_returns_zero_for_valid_file(self, capsys: pytest.CaptureFixture[str]) -> None:
         result = main([str(DATA)])
@@ -334,3 +483,144 @@ class TestMain:
         assert result == 0
         assert "demo_a.sv:3:7 - [FIRST] First diagnostic" in captured.out
         assert "demo_b.sv:8:2 - [SECOND] Second diagnostic" in captured.out
+
+    def test_main_passes_rule_selection(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        seen: dict[str, object] = {}
+
+        def fake_run(paths, jobs=1, rules=None):
+            seen["rules"] = rules
+            return []
+
+        monkeypatch.setattr("src.run_lint.run", fake_run)
+
+        result = main([str(DATA), "--rules", "DUPLICATE_MODULE, UNDEFINED_MODULE"])
+
+        assert result == 0
+        assert seen["rules"] == ["DUPLICATE_MODULE", "UNDEFINED_MODULE"]
+
+    def test_main_passes_stream_symbols(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: dict[str, object] = {}
+
+        def fake_run(paths, jobs=1, stream_symbols=False):
+            seen["stream_symbols"] = stream_symbols
+            return []
+
+        monkeypatch.setattr("src.run_lint.run", fake_run)
+
+        assert main([str(DATA), "--stream-symbols"]) == 0
+        assert seen["stream_symbols"] is True
+
+    def test_main_profile_prints_table_to_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(DATA), "--profile"])
+
+        captured = capsys.readouterr()
+        assert result == 0
+        assert "module_rules" in captured.err
+        assert "simple.v" in captured.err
+        assert "module_rules" not in captured.out
+
+    def test_main_rule_stats_prints_table_to_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(INITIAL_BLOCK_DATA), "--rule-stats"])
+
+        captured = capsys.readouterr()
+        assert result == 0
+        assert "NO_INITIAL_BLOCK" in captured.err
+        assert "UNDEFINED_MODULE" in captured.err
+
+    def test_main_rule_stats_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(INITIAL_BLOCK_DATA), "--rule-stats", "--instrument-format", "json"])
+
+        report = json.loads(capsys.readouterr().err)
+        hits = {stat["code"]: stat["hits"] for stat in report["rules"]}
+        assert result == 0
+        assert hits["NO_INITIAL_BLOCK"] >= 1
+
+    @pytest.mark.parametrize("flag", ["--profile", "--rule-stats", "--memory-profile", "--walk-stats"])
+    def test_main_report_flag_before_path_does_not_take_it(
+        self, flag: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        result = main([flag, str(INITIAL_BLOCK_DATA)])
+
+        captured = capsys.readouterr()
+        assert result == 0
+        assert "NO_INITIAL_BLOCK" in captured.out
+        assert captured.err
+
+    def test_main_memory_profile_prints_snapshots_to_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(DATA), "--memory-profile"])
+
+        captured = capsys.readouterr()
+        assert result == 0
+        assert "traced MB" in captured.err
+        assert "top allocation sites" in captured.err
+
+    def test_main_memory_profile_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(DATA), "--memory-profile", "--instrument-format", "json"])
+
+        report = json.loads(capsys.readouterr().err)
+        assert result == 0
+        assert [s["phase"] for s in report["snapshots"]] == ["parse", "walk", "rules"]
+
+    def test_main_trace_writes_chrome_trace(self, tmp_path: Path) -> None:
+        output = tmp_path / "trace.json"
+
+        result = main([str(INITIAL_BLOCK_DATA), "--trace", str(output)])
+
+        events = json.loads(output.read_text(encoding="utf-8"))["traceEvents"]
+        assert result == 0
+        assert {"parse", "walk", "symbol_rules", "module_rules"} <= {e["name"] for e in events}
+
+    def test_main_walk_stats_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(INITIAL_BLOCK_DATA), "--walk-stats", "--instrument-format", "json"])
+
+        report = json.loads(capsys.readouterr().err)
+        assert result == 0
+        assert report["total"]["nodes"] == report["files"][0]["nodes"] > 0
+        assert report["total"]["handlers"]["ModuleDeclarationHandler"] == 1
+
+    def test_main_cprofile_and_flamegraph_write_files(self, tmp_path: Path) -> None:
+        pstats_path, folded_path = tmp_path / "run.pstats", tmp_path / "run.folded"
+
+        result = main(
+            [
+                str(INITIAL_BLOCK_DATA),
+                "--cprofile",
+                str(pstats_path),
+                "--flamegraph",
+                str(folded_path),
+                "--profile-phase",
+                "walk",
+            ]
+        )
+
+        assert result == 0
+        assert pstats_path.stat().st_size > 0
+        assert "pkg/walk/walker.py" in folded_path.read_text(encoding="utf-8")
+
+    def test_main_metrics_file(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        output = tmp_path / "lint.prom"
+
+        result = main([str(INITIAL_BLOCK_DATA), "--metrics-file", str(output), "--metrics-label", "repo=demo"])
+
+        text = output.read_text(encoding="utf-8")
+        assert result == 0
+        assert 'verilinter_files{repo="demo"} 1' in text
+        assert 'verilinter_diagnostics{repo="demo",code="NO_INITIAL_BLOCK"}' in text
+        # timings are collected for the metrics but not printed
+        assert capsys.readouterr().err == ""
+
+    def test_main_rejects_malformed_metrics_label(self) -> None:
+        with pytest.raises(SystemExit):
+            main([str(INITIAL_BLOCK_DATA), "--metrics-file", "lint.prom", "--metrics-label", "no-equals"])
+
+    def test_main_profile_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        result = main([str(DATA), "--profile", "--instrument-format", "json", "--profile-top", "1"])
+
+        report = json.loads(capsys.readouterr().err)
+        assert result == 0
+        assert len(report["files"]) == 1
+        assert report["files"][0]["nodes"] > 0
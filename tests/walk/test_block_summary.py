@@ -0,0 +1,173 @@
+"""Test suite for BlockSummary, the per-procedural-block facts shared through the Context."""
+
+import pyslang as sl
+import pytest
+
+from src.pkg.handlers.register_handlers import *
+from src.pkg.parser.types import ProceduralBlockNode
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.vnodes.syntax_vnode import SyntaxVNode
+from src.pkg.walk.block_summary import BlockSummary, block_summary
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.walk.walker import Walker
+
+
+def _blocks(source: str) -> list[SyntaxVNode]:
+    tree = sl.SyntaxTree.fromText(source)
+    found: list[SyntaxVNode] = []
+
+    def visit(node) -> None:
+        if isinstance(node, ProceduralBlockNode):
+            found.append(SyntaxVNode(node, tree))
+        for child in node:
+            if isinstance(child, sl.SyntaxNode):
+                visit(child)
+
+    visit(tree.root)
+    return found
+
+
+def _summary(body: str, keyword: str = "always_comb") -> BlockSummary:
+    (block,) = _blocks(
+        f"""
+        module top(input logic clk, a, b, c, input logic [3:0] i, output logic x, y, output logic [3:0] v);
+            {keyword} begin
+                {body}
+            end
+        endmodule
+        """
+    )
+    return BlockSummary(block)
+
+
+class TestBlockSummary:
+    def test_targets_reads_and_assignments(self) -> None:
+        summary = _summary("x = a & b; v[i] = c; if (c) y = x;")
+
+        assert len(summary.assignments) == 3
+        assert summary.targets == {"x", "v", "y"}
+        assert summary.reads == {"a", "b", "i", "c", "x"}
+        assert summary.unconditional_targets == {"x", "v"}
+        assert summary.conditional_targets == {"y"}
+
+    def test_compound_assignment_target_is_also_read(self) -> None:
+        summary = _summary("x |= a;", keyword="always_ff @(posedge clk)")
+
+        assert summary.targets == {"x"}
+        assert {"x", "a", "clk"} <= summary.reads
+
+    def test_mix_trigger_is_first_assignment_of_the_other_style(self) -> None:
+        summary = _summary("x = a; y <= b; v <= i; x = c;", keyword="always @(posedge clk)")
+
+        assert summary.assignment_kinds == {
+            sl.SyntaxKind.AssignmentExpression,
+            sl.SyntaxKind.NonblockingAssignmentExpression,
+        }
+        assert summary.mix_trigger is summary.assignments[1]
+
+    def test_single_style_has_no_mix_trigger(self) -> None:
+        assert _summary("x = a; y = b;").mix_trigger is None
+
+    @pytest.mark.parametrize(
+        ("body", "latches"),
+        [
+            ("if (a) y = b;", {"y"}),
+            ("y = '0; if (a) y = b;", set()),
+            ("if (a) y = b; y = c;", set()),
+            ("if (a) y = b; else y = c;", set()),
+            ("if (a) y = b; else x = c;", {"x", "y"}),
+            ("if (a) y = b; else if (b) y = c; else y = a;", set()),
+            ("if (a) y = b; else if (b) y = c;", {"y"}),
+            ("if (a) begin y = b; x = c; end else begin begin y = c; end x = a; end", set()),
+            ("begin y = '0; end if (a) begin y = b; x = c; end", {"x"}),
+            ("case (i) 0: y = a; 1: y = b; default: y = c; endcase", set()),
+            ("case (i) 0: y = a; 1: y = b; endcase", {"y"}),
+            ("case (i) 0: y = a; 1: x = b; default: y = c; endcase", {"x", "y"}),
+            ("case (i) 0: if (a) y = b; else y = c; default: begin y = a; end endcase", set()),
+            ("for (int k = 0; k < 4; k++) y = a;", set()),
+            ("for (int k = 0; k < 4; k++) if (a) y = b;", {"y"}),
+            ("do y = a; while (b);", set()),
+            ("if (a) y = b; do x = c; while (b);", {"y"}),
+        ],
+    )
+    def test_latch_targets(self, body: str, latches: set[str]) -> None:
+        summary = _summary(body)
+
+        assert summary.latch_targets == latches
+        assert summary.definitely_assigned == summary.targets - latches
+
+    def test_for_loop_bounded_by_module_parameters_runs(self) -> None:
+        (block,) = _blocks(
+            """
+            module top #(parameter N = 4)(input logic [N-1:0] a, output logic [N-1:0] y);
+                localparam int FIRST = 0;
+                always_comb for (int k = FIRST; k < N; k++) y[k] = a[k];
+            endmodule
+            """
+        )
+        summary = BlockSummary(block)
+
+        assert summary.definitely_assigned == {"y"}
+        assert summary.latch_targets == set()
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "for (int k = 0; k < i; k++) y = a;",
+            "foreach (v[k]) y = a;",
+            "repeat (i) y = a;",
+            "while (a) y = b;",
+        ],
+    )
+    def test_loop_that_may_not_run_leaves_targets_unknown(self, body: str) -> None:
+        summary = _summary(body)
+
+        assert summary.unknown_targets == {"y"}
+        assert "y" not in summary.definitely_assigned
+        assert summary.latch_targets == set()
+
+    def test_block_summary_reuses_the_context_block(self) -> None:
+        (block,) = _blocks("module m; always_comb x = 1; endmodule")
+        shared = BlockSummary(block)
+
+        assert block_summary(block, Context().with_block(shared)) is shared
+        assert block_summary(block, Context()) is not shared
+
+
+class TestBlockSummaryInWalk:
+    def test_nodes_inside_a_block_share_its_summary(self) -> None:
+        source = """
+        module top(input logic a, output logic x, y);
+            always_comb x = a;
+            always_comb y = a;
+        endmodule
+        """
+        tree = sl.SyntaxTree.fromText(source)
+        symbol_table = SymbolTable()
+        walker = Walker(dispatch)
+        walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+
+        summaries = {id(ctx.block): ctx.block for _vnode, ctx in walker.results if ctx.block is not None}
+        blocks = [vnode for vnode, _ctx in walker.results if isinstance(vnode.raw, ProceduralBlockNode)]
+        assert len(summaries) == 2
+        assert {summary.vnode.raw for summary in summaries.values()} == {vnode.raw for vnode in blocks}
+        module_level = [ctx for vnode, ctx in walker.results if vnode.raw.kind == sl.SyntaxKind.ModuleHeader]
+        assert all(ctx.block is None for ctx in module_level)
+
+    def test_each_block_gets_a_driver_id_for_its_location(self) -> None:
+        source = """
+        module top(input logic a, output logic x, y);
+            always_comb x = a;
+            always_comb y = a;
+        endmodule
+        """
+        tree = sl.SyntaxTree.fromText(source)
+        symbol_table = SymbolTable()
+        walker = Walker(dispatch)
+        walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+
+        blocks = [ctx.block for vnode, ctx in walker.results if isinstance(vnode.raw, ProceduralBlockNode)]
+        assert [block.driver_id for block in blocks] == [0, 1]
+        assert symbol_table.drivers == [block.location for block in blocks]
+        assert symbol_table.lookup_module("top").symbols["x"].drivers == {0: {"line": 3, "col": 25, "file": "source"}}
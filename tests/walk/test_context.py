@@ -129,6 +129,27 @@ class TestContext:
         assert ctx.has(ContextFlag.ALWAYS)
         assert ctx.has(ContextFlag.POSEDGE)
 
+    def test_block_is_carried_by_push_flag_and_scope(self, context: Context, mock_vnode: Mock) -> None:
+        """Test that the block summary set with with_block() survives push, with_flag and with_scope."""
+        block = Mock()
+        ctx = context.with_block(block)
+
+        assert ctx.push(mock_vnode).block is block
+        assert ctx.with_flag(ContextFlag.ALWAYS).block is block
+        assert ctx.with_scope(Mock()).block is block
+        assert context.block is None
+
+    def test_port_is_carried_by_push_flag_scope_and_block(self, context: Context, mock_vnode: Mock) -> None:
+        """Test that the port set with with_port() survives push, with_flag, with_scope and with_block."""
+        port = Mock()
+        ctx = context.with_port(port)
+
+        assert ctx.push(mock_vnode).port is port
+        assert ctx.with_flag(ContextFlag.ALWAYS).port is port
+        assert ctx.with_scope(Mock()).port is port
+        assert ctx.with_block(Mock()).port is port
+        assert context.port is None
+
 
 class TestContextFlag:
     """Test cases for the ContextFlag enum."""
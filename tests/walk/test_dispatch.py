@@ -0,0 +1,109 @@
+"""Test suite for Dispatch and its fused (vnode class, handler) table."""
+
+import pytest
+from unittest.mock import Mock
+import pyslang as sl
+
+from src.pkg.handlers.base_handler import BaseHandler
+from src.pkg.handlers.default_handler import DefaultHandler
+from src.pkg.parser.parse import parse_text
+from src.pkg.vnodes.syntax_vnode import SyntaxVNode
+from src.pkg.vnodes.token_vnode import TokenVNode
+from src.pkg.vnodes.vnode_factory import VNodeFactory
+from src.pkg.walk.dispatch import Dispatch
+
+
+class _FakeHandler(BaseHandler):
+    pass
+
+
+@pytest.fixture
+def fresh_dispatch() -> Dispatch:
+    """Fixture for a Dispatch with nothing registered."""
+    return Dispatch()
+
+
+class TestDispatchResolve:
+    def test_resolve_returns_default_pair_for_unregistered_syntax_node(self, fresh_dispatch: Dispatch) -> None:
+        raw = Mock(spec=sl.SyntaxNode)
+
+        vnode_cls, handler = fresh_dispatch.resolve(raw)
+
+        assert vnode_cls is SyntaxVNode
+        assert isinstance(handler, DefaultHandler)
+
+    def test_resolve_returns_token_vnode_for_token(self, fresh_dispatch: Dispatch) -> None:
+        tree = parse_text("module m; endmodule\n")
+        token = tree.root.getFirstToken()
+
+        vnode_cls, _handler = fresh_dispatch.resolve(token)
+
+        assert vnode_cls is TokenVNode
+
+    def test_resolve_uses_registered_handler_through_mro(self, fresh_dispatch: Dispatch) -> None:
+        fresh_dispatch.register(sl.SyntaxNode)(_FakeHandler)
+        tree = parse_text("module m; endmodule\n")
+
+        _vnode_cls, handler = fresh_dispatch.resolve(tree.root)
+
+        assert isinstance(handler, _FakeHandler)
+
+    def test_resolve_caches_entry_per_raw_type(self, fresh_dispatch: Dispatch) -> None:
+        raw = Mock(spec=sl.SyntaxNode)
+
+        first = fresh_dispatch.resolve(raw)
+        second = fresh_dispatch.resolve(raw)
+
+        assert first is second
+        assert fresh_dispatch._table[type(raw)] is first
+
+    def test_resolve_agrees_with_get(self, fresh_dispatch: Dispatch) -> None:
+        fresh_dispatch.register(sl.SyntaxNode)(_FakeHandler)
+        tree = parse_text("module m; endmodule\n")
+
+        vnode_cls, handler = fresh_dispatch.resolve(tree.root)
+
+        assert fresh_dispatch.get(vnode_cls(tree.root, tree)) is handler
+
+
+class TestDispatchInvalidation:
+    def test_handler_registration_clears_fused_table(self, fresh_dispatch: Dispatch) -> None:
+        tree = parse_text("module m; endmodule\n")
+        _vnode_cls, before = fresh_dispatch.resolve(tree.root)
+
+        fresh_dispatch.register(type(tree.root))(_FakeHandler)
+        _vnode_cls, after = fresh_dispatch.resolve(tree.root)
+
+        assert isinstance(before, DefaultHandler)
+        assert isinstance(after, _FakeHandler)
+
+    def test_vnode_registration_clears_fused_table(self, fresh_dispatch: Dispatch) -> None:
+        raw = Mock(spec=sl.SyntaxNode)
+        fresh_dispatch.resolve(raw)
+
+        class CustomVNode(SyntaxVNode):
+            pass
+
+        VNodeFactory.register(type(raw))(CustomVNode)
+        vnode_cls, _handler = fresh_dispatch.resolve(raw)
+
+        assert vnode_cls is CustomVNode
+
+
+class TestDispatchRestriction:
+    def test_restricted_keeps_handlers_within_kinds(self, fresh_dispatch: Dispatch) -> None:
+        class ModuleHandler(BaseHandler):
+            consumes = frozenset({sl.SyntaxKind.ModuleDeclaration})
+
+        class ExpressionHandler(BaseHandler):
+            consumes = frozenset({sl.SyntaxKind.IdentifierName})
+
+        fresh_dispatch.register(sl.ModuleDeclarationSyntax)(ModuleHandler)
+        fresh_dispatch.register(sl.IdentifierNameSyntax)(ExpressionHandler)
+        fresh_dispatch.register(sl.SyntaxNode)(_FakeHandler)
+
+        restricted = fresh_dispatch.restricted_to(frozenset({sl.SyntaxKind.ModuleDeclaration}))
+
+        assert sorted(type(h).__name__ for h in restricted.handlers()) == ["DefaultHandler", "ModuleHandler"]
+        assert isinstance(restricted._handler_for(sl.IdentifierNameSyntax), DefaultHandler)
+        assert isinstance(fresh_dispatch._handler_for(sl.IdentifierNameSyntax), ExpressionHandler)
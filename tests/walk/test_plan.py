@@ -0,0 +1,144 @@
+"""Test suite for WalkPlan and the subtree pruning it enables in the Walker."""
+
+from pathlib import Path
+
+import pytest
+import pyslang as sl
+
+from src.pkg.handlers.register_handlers import *
+from src.pkg.parser.parse import file_uses_default_nettype_none, parse_file
+from src.pkg.parser.syntax import MODULE_SOURCE_KINDS
+from src.pkg.rules.register_rules import rule_runner, symbol_rule_runner, module_rule_runner
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.walk.plan import WalkPlan, consumed_kinds
+from src.pkg.walk.walker import Walker
+
+DATA = Path(__file__).parent.parent / "data"
+SOURCES = sorted(DATA.glob("*.v"))
+
+
+class _Consumer:
+    def __init__(self, consumes: frozenset[object] | None) -> None:
+        self.consumes = consumes
+
+
+def _default_plan() -> WalkPlan:
+    return WalkPlan.from_consumers(
+        [*dispatch.handlers(), *rule_runner.rules, *symbol_rule_runner.rules, *module_rule_runner.rules]
+    )
+
+
+def _lint(paths: list[Path], plan: WalkPlan | None) -> tuple[list[dict], SymbolTable, int]:
+    symbol_table = SymbolTable()
+    ctx = Context(scope=symbol_table.global_scope)
+    walker = Walker(dispatch, plan=plan)
+    diagnostics: list[dict] = []
+    visited = 0
+
+    def on_node(vnode, node_ctx) -> None:
+        nonlocal visited
+        visited += 1
+        diagnostics.extend(rule_runner.check(vnode, node_ctx))
+
+    for path in paths:
+        symbol_table.set_current_file(str(path))
+        symbol_table.set_current_file_default_nettype_none(file_uses_default_nettype_none(str(path)))
+        tree = parse_file(str(path))
+        walker.walk(tree.root, tree, ctx, symbol_table, on_node=on_node)
+
+    diagnostics += symbol_rule_runner.run(symbol_table)
+    diagnostics += module_rule_runner.run(symbol_table)
+    return diagnostics, symbol_table, visited
+
+
+def _symbol_snapshot(symbol_table: SymbolTable) -> list[tuple]:
+    return sorted(
+        (
+            scope.name,
+            name,
+            symbol.kind,
+            repr(symbol.declarations),
+            repr(symbol.use_events),
+            symbol.is_implicit,
+            symbol.is_port,
+        )
+        for scope in symbol_table.scopes
+        for name, symbol in scope.symbols.items()
+    )
+
+
+class TestConsumedKinds:
+    def test_union_of_declarations(self) -> None:
+        kinds = consumed_kinds([_Consumer(frozenset({"a"})), _Consumer(frozenset({"b"}))])
+
+        assert kinds == frozenset({"a", "b"})
+
+    def test_undeclared_consumer_returns_none(self) -> None:
+        assert consumed_kinds([_Consumer(frozenset({"a"})), _Consumer(None)]) is None
+
+    def test_consumer_without_attribute_returns_none(self) -> None:
+        assert consumed_kinds([object()]) is None
+
+
+class TestWalkPlan:
+    def test_full_plan_skips_nothing(self) -> None:
+        assert WalkPlan.full().is_full
+
+    def test_undeclared_consumer_yields_full_plan(self) -> None:
+        plan = WalkPlan.from_consumers([_Consumer(frozenset()), _Consumer(None)])
+
+        assert plan.is_full
+
+    def test_default_plan_skips_literal_expressions(self) -> None:
+        plan = _default_plan()
+
+        assert sl.SyntaxKind.IntegerLiteralExpression in plan.skip_kinds
+        assert sl.SyntaxKind.StringLiteralExpression in plan.skip_kinds
+
+    def test_default_plan_keeps_subtrees_rules_inspect(self) -> None:
+        plan = _default_plan()
+
+        assert sl.SyntaxKind.IdentifierName not in plan.skip_kinds
+        assert sl.SyntaxKind.AttributeInstance not in plan.skip_kinds
+        assert sl.SyntaxKind.EventControlWithExpression not in plan.skip_kinds
+
+    def test_module_only_plan_skips_expression_level_subtrees(self) -> None:
+        handlers = [
+            handler
+            for handler in dispatch.handlers()
+            if handler.consumes is not None and handler.consumes <= MODULE_SOURCE_KINDS
+        ]
+        plan = WalkPlan.from_consumers([*handlers, *module_rule_runner.rules])
+
+        assert sl.SyntaxKind.AttributeInstance in plan.skip_kinds
+        assert sl.SyntaxKind.ParameterValueAssignment in plan.skip_kinds
+        assert sl.SyntaxKind.EventControlWithExpression in plan.skip_kinds
+
+    def test_every_registered_consumer_declares_consumes(self) -> None:
+        consumers = [*dispatch.handlers(), *rule_runner.rules, *symbol_rule_runner.rules, *module_rule_runner.rules]
+
+        undeclared = [type(c).__name__ for c in consumers if getattr(c, "consumes", None) is None]
+
+        assert undeclared == []
+
+
+class TestPlannedWalkMatchesFullWalk:
+    @pytest.mark.parametrize("path", SOURCES, ids=lambda p: p.name)
+    def test_diagnostics_and_symbols_match(self, path: Path) -> None:
+        full_diagnostics, full_table, full_visited = _lint([path], None)
+        planned_diagnostics, planned_table, planned_visited = _lint([path], _default_plan())
+
+        key = lambda d: (d["code"], d["line"], d["col"], d.get("file"), d["message"])
+        assert sorted(planned_diagnostics, key=key) == sorted(full_diagnostics, key=key)
+        assert _symbol_snapshot(planned_table) == _symbol_snapshot(full_table)
+        assert planned_visited <= full_visited
+
+    def test_multi_file_diagnostics_match(self) -> None:
+        full_diagnostics, _, full_visited = _lint(SOURCES, None)
+        planned_diagnostics, _, planned_visited = _lint(SOURCES, _default_plan())
+
+        key = lambda d: (d["code"], d["line"], d["col"], d.get("file"), d["message"])
+        assert sorted(planned_diagnostics, key=key) == sorted(full_diagnostics, key=key)
+        assert planned_visited < full_visited
@@ -0,0 +1,80 @@
+"""Test suite for TokenScanner, which runs token rules without a walk."""
+
+import gc
+import weakref
+from pathlib import Path
+
+import pyslang as sl
+import pytest
+
+from src.pkg.handlers.register_handlers import *
+from src.pkg.rules.base_token_rule import TokenRule
+from src.pkg.rules.register_rules import *
+from src.pkg.rules.syntax.rule_runner import RuleRunner, rule_runner
+from src.pkg.semantic.symbol_table import SymbolTable
+from src.pkg.walk.context import Context
+from src.pkg.walk.dispatch import dispatch
+from src.pkg.walk.token_scanner import TokenScanner
+from src.pkg.walk.walker import Walker
+
+DATA = Path(__file__).parent.parent / "data"
+TOKEN_RULE_FILES = ["defparam_usage.v", "full_parallel_case.v", "unique_priority_case.v", "new_syntax_rules.v"]
+
+
+class TestTokenScanner:
+    def test_consumes_only_token_rule_kinds(self) -> None:
+        scanner = TokenScanner(rule_runner.token_rules())
+
+        assert sl.TokenKind.DefParamKeyword in scanner.kinds
+        assert all(isinstance(kind, sl.TokenKind) for kind in scanner.kinds)
+
+    @pytest.mark.parametrize("name", TOKEN_RULE_FILES)
+    def test_matches_token_rules_run_on_the_walk(self, name: str) -> None:
+        tree = sl.SyntaxTree.fromFile(str(DATA / name))
+        token_rules = rule_runner.token_rules()
+        symbol_table = SymbolTable()
+        walker = Walker(dispatch)
+        walker.walk(tree.root, tree, Context(scope=symbol_table.global_scope), symbol_table)
+
+        scanned = TokenScanner(token_rules).scan(tree)
+
+        assert scanned
+        assert scanned == token_rules.run(walker.results)
+
+    def test_no_token_rules_scans_nothing(self) -> None:
+        tree = sl.SyntaxTree.fromText("module m; defparam a.b = 1; endmodule")
+
+        assert TokenScanner(RuleRunner()).scan(tree) == []
+
+    def test_collects_the_kinds_present_in_the_tree(self) -> None:
+        tree = sl.SyntaxTree.fromText("module m; initial x = 1; endmodule")
+        present: set[str] = set()
+
+        assert TokenScanner(RuleRunner()).scan(tree, present) == []
+        assert {"ModuleDeclaration", "InitialBlock", "InitialKeyword"} <= present
+        assert "FinalBlock" not in present
+
+    def test_collected_kinds_do_not_keep_the_tree_alive(self) -> None:
+        tree = sl.SyntaxTree.fromText("module m; initial x = 1; endmodule")
+        present: set[str] = set()
+        TokenScanner(RuleRunner()).scan(tree, present)
+        ref = weakref.ref(tree)
+
+        del tree
+        gc.collect()
+
+        assert ref() is None
+        assert "InitialBlock" in present
+
+    def test_rejects_rules_without_declared_kinds(self) -> None:
+        runner = RuleRunner()
+
+        @runner.register
+        class Undeclared(TokenRule):
+            code = "UNDECLARED"
+
+            def applies_to_token(self, token, tree) -> bool:
+                return True
+
+        with pytest.raises(ValueError, match="token kinds"):
+            TokenScanner(runner)